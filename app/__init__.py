@@ -1,6 +1,6 @@
 from flask import Flask, request
 from datetime import datetime, timedelta
-from config import Config
+from config import Config, DEFAULT_SECRET_KEY
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 
@@ -34,11 +34,25 @@ def create_app():
     # 애플리케이션 컨텍스트 설정 (워커를 위해 필요)
     db.app = app
     
-    # 동기화 워커 시작 (개발 모드에서는 실행 안 함)
-    if not app.config.get('DEBUG', False):
+    # PaloAlto API 키 캐시 (캐시 파일을 지정하면 재시작 후에도 keygen을 반복하지 않도록 암호화하여 저장)
+    # 공개된 기본 SECRET_KEY로는 누구나 복호화할 수 있으므로 메모리에만 보관
+    from app.firewall_module.paloalto.api_key_cache import api_key_cache
+    key_cache_file = app.config.get('PALOALTO_KEY_CACHE_FILE')
+    secret_key = app.config.get('SECRET_KEY')
+    if key_cache_file and secret_key == DEFAULT_SECRET_KEY:
+        app.logger.warning("SECRET_KEY가 기본값이므로 PaloAlto API 키를 파일에 저장하지 않습니다.")
+        key_cache_file = None
+    api_key_cache.configure(key_cache_file, secret_key)
+    
+    # 동기화 워커 시작 (개발 모드 또는 SYNC_WORKER_ENABLED=false이면 실행 안 함)
+    if not app.config.get('DEBUG', False) and app.config.get('SYNC_WORKER_ENABLED', True):
         with app.app_context():
             from app.services.firewall.worker import get_worker
-            worker = get_worker(poll_interval=10)
+            worker = get_worker(
+                poll_interval=60,  # 작업 추가/완료 시 즉시 깨어나므로 폴링은 대체 수단
+                max_workers=app.config.get('SYNC_WORKER_COUNT', 1),
+                vendor_limits=app.config.get('SYNC_VENDOR_LIMITS')
+            )
             worker.start()
     
     return app
@@ -53,5 +67,10 @@ from app.models import (
     FirewallServiceObject,
     FirewallServiceGroup,
     SyncHistory,
-    SyncTask
-)
\ No newline at end of file
+    SyncTask,
+    DeviceStats
+)
+
+# create_all 후처리 (FTS5 테이블/트리거 생성, 장비 통계 채우기)
+from app.services import search_index
+from app.services.firewall import device_stats
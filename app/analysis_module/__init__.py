@@ -5,7 +5,8 @@
 
 from .core.policy_analyzer import PolicyAnalyzer
 from .core.redundancy_analyzer import RedundancyAnalyzer
+from .core.shadow_analyzer import ShadowAnalyzer
 from .core.change_analyzer import ChangeAnalyzer
 from .core.policy_resolver import PolicyResolver
 
-__all__ = ['PolicyAnalyzer', 'RedundancyAnalyzer', 'ChangeAnalyzer', 'PolicyResolver']
\ No newline at end of file
+__all__ = ['PolicyAnalyzer', 'RedundancyAnalyzer', 'ShadowAnalyzer', 'ChangeAnalyzer', 'PolicyResolver']
\ No newline at end of file
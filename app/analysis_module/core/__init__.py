@@ -4,7 +4,8 @@
 
 from .policy_analyzer import PolicyAnalyzer
 from .redundancy_analyzer import RedundancyAnalyzer
+from .shadow_analyzer import ShadowAnalyzer
 from .change_analyzer import ChangeAnalyzer
 from .policy_resolver import PolicyResolver
 
-__all__ = ['PolicyAnalyzer', 'RedundancyAnalyzer', 'ChangeAnalyzer', 'PolicyResolver'] 
\ No newline at end of file
+__all__ = ['PolicyAnalyzer', 'RedundancyAnalyzer', 'ShadowAnalyzer', 'ChangeAnalyzer', 'PolicyResolver'] 
\ No newline at end of file
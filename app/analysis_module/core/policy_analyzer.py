@@ -8,6 +8,7 @@ from typing import Optional, Dict, List
 from datetime import datetime
 
 from .redundancy_analyzer import RedundancyAnalyzer
+from .shadow_analyzer import ShadowAnalyzer
 from .change_analyzer import ChangeAnalyzer
 from ..utils.excel_handler import ExcelHandler
 
@@ -18,6 +19,7 @@ class PolicyAnalyzer:
         """PolicyAnalyzer 초기화"""
         self.logger = logging.getLogger(__name__)
         self.redundancy_analyzer = RedundancyAnalyzer()
+        self.shadow_analyzer = ShadowAnalyzer()
         self.change_analyzer = ChangeAnalyzer()
         self.excel_handler = ExcelHandler()
     
@@ -48,6 +50,33 @@ class PolicyAnalyzer:
             self.logger.error(f"중복 정책 분석 중 오류 발생: {e}")
             raise
     
+    def analyze_shadow(self,
+                       df: pd.DataFrame,
+                       vendor: str,
+                       output_file: str,
+                       **kwargs) -> pd.DataFrame:
+        """
+        가려진 정책 분석을 수행합니다.
+        
+        Args:
+            df: PolicyResolver로 Extracted 컬럼을 생성한 정책 데이터프레임
+            vendor: 방화벽 벤더 (예: 'paloalto', 'ngf')
+            output_file: 결과를 저장할 파일 경로
+            **kwargs: 추가 매개변수
+        
+        Returns:
+            분석 결과 데이터프레임
+        """
+        try:
+            self.logger.info(f"{vendor} 방화벽 가려진 정책 분석 시작")
+            result_df = self.shadow_analyzer.analyze(df, vendor, **kwargs)
+            self.excel_handler.save_shadow_analysis(result_df, output_file)
+            self.logger.info(f"가려진 정책 분석 결과가 {output_file}에 저장되었습니다.")
+            return result_df
+        except Exception as e:
+            self.logger.error(f"가려진 정책 분석 중 오류 발생: {e}")
+            raise
+    
     def analyze_changes(self,
                        df_before: pd.DataFrame,
                        df_after: pd.DataFrame,
@@ -1,36 +1,216 @@
 import pandas as pd
-from typing import Tuple, Dict
+import numpy as np
+import logging
+from typing import Tuple, Dict, List, FrozenSet, Iterable
+
+from ..utils.interval_set import IntervalSet
+from ..utils.ip_intervals import AddressSet, AddressIndex
+from ..utils.port_intervals import ServiceSet, PORT_MAX
 
 class PolicyResolver:
     def __init__(self):
+        self.logger = logging.getLogger(__name__)
         self.cache: Dict[str, Tuple[str, str, str, str]] = {}
+        # 객체명별 IP 구간 집합 (객체 정의가 바뀔 수 있으므로 resolve마다 초기화)
+        self.address_cache: Dict[str, AddressSet] = {}
+        # 마지막으로 resolve한 정책의 출발지/목적지 구간 집합 (정책 순서와 동일)
+        self.rules_df = None
+        self.addresses: Dict[str, List[AddressSet]] = {}
+        self._address_indexes: Dict[str, AddressIndex] = {}
+        # 서비스 객체명별 프로토콜/포트 구간 집합과 마지막으로 resolve한 정책별 서비스 집합
+        self.service_cache: Dict[str, ServiceSet] = {}
+        self.services: List[ServiceSet] = []
+        # 마지막 resolve에서 발견된 순환 참조 그룹 목록
+        self.group_cycles: List[List[str]] = []
+
+    @staticmethod
+    def _split_members(entry) -> List[str]:
+        """그룹 Entry 값을 멤버 이름 목록으로 분리합니다."""
+        if not isinstance(entry, str):
+            return []
+        return [member.strip() for member in entry.split(',') if member.strip()]
+
+    def expand_groups(self, group_dict: dict) -> Dict[str, FrozenSet[str]]:
+        """
+        그룹 의존 그래프를 한 번 순회해 모든 그룹을 말단 멤버 집합으로 펼칩니다.
+
+        하위 그룹을 먼저 펼치는 순서(Tarjan SCC)로 처리하므로 각 그룹은 한 번만 계산됩니다.
+        서로를 포함하는 순환 그룹은 같은 말단 멤버 집합을 갖도록 묶어서 펼치고 group_cycles에 기록합니다.
+
+        Args:
+            group_dict: {그룹명: 콤마로 구분된 멤버} 딕셔너리
+
+        Returns:
+            {그룹명: 말단 멤버 frozenset}
+        """
+        graph = {}
+        for name, entry in group_dict.items():
+            members = self._split_members(entry)
+            # Entry가 비었거나 자기 자신뿐이면 그룹이 아닌 값으로 취급
+            if members and members != [name]:
+                graph[name] = members
 
-    def resolve_groupname_to_entry(self, name: str, network_group_dict: dict, resolved_cache: dict, depth: int = 0, max_depth: int = 10) -> str:
-        if depth > max_depth or name in resolved_cache:
-            return resolved_cache.get(name, name)
+        expanded: Dict[str, FrozenSet[str]] = {}
+        cycles: List[List[str]] = []
+        order: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack = set()
 
-        entry = network_group_dict.get(name)
-        if entry and entry != name:
-            resolved_entries = [self.resolve_groupname_to_entry(n.strip(), network_group_dict, resolved_cache, depth + 1) for n in entry.split(',')]
-            resolved_name = ','.join(set(resolved_entries))
-            resolved_cache[name] = resolved_name
-            return resolved_name
+        for root in graph:
+            if root in order:
+                continue
+            work = [(root, iter(graph[root]))]
+            order[root] = lowlink[root] = len(order)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, members = work[-1]
+                advanced = False
+                for member in members:
+                    if member not in graph:
+                        continue
+                    if member not in order:
+                        order[member] = lowlink[member] = len(order)
+                        stack.append(member)
+                        on_stack.add(member)
+                        work.append((member, iter(graph[member])))
+                        advanced = True
+                        break
+                    if member in on_stack:
+                        lowlink[node] = min(lowlink[node], order[member])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] != order[node]:
+                    continue
 
-        resolved_cache[name] = name
-        return name
+                # node가 강연결요소의 루트: 요소 전체를 한 번에 펼침 (하위 요소는 이미 계산됨)
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                component_set = set(component)
+                leaves = set()
+                for group in component:
+                    for member in graph[group]:
+                        if member in component_set:
+                            continue
+                        leaves.update(expanded.get(member, (member,)))
+                if len(component) > 1 or node in graph[node]:
+                    cycles.append(sorted(component))
+                leaves = frozenset(leaves)
+                for group in component:
+                    expanded[group] = leaves
 
-    def process_cell(self, cell: str, network_group_dict: dict) -> str:
-        resolved_cache = {}
+        self.group_cycles.extend(cycles)
+        for cycle in cycles:
+            self.logger.warning(f"순환 참조 그룹 발견: {' -> '.join(cycle)}")
+        return expanded
+
+    def resolve_members(self, cell, expanded_groups: Dict[str, FrozenSet[str]]) -> FrozenSet[str]:
+        """
+        셀의 객체명 목록을 펼쳐진 그룹 캐시로 말단 멤버 집합으로 변환합니다.
+
+        Args:
+            cell: 콤마로 구분된 객체명/그룹명
+            expanded_groups: expand_groups 결과
+
+        Returns:
+            말단 멤버 frozenset
+        """
         names = [name.strip() for name in str(cell).split(',')]
-        resolved_names = [self.resolve_groupname_to_entry(name, network_group_dict, resolved_cache) for name in names]
-        flattened_resolved = set(','.join(resolved_names).split(','))
-        return ','.join(flattened_resolved)
+        if len(names) == 1:
+            return expanded_groups.get(names[0], frozenset(names))
+        return frozenset().union(*(expanded_groups.get(name, (name,)) for name in names))
+
+    def process_cell(self, cell: str, expanded_groups: Dict[str, FrozenSet[str]]) -> str:
+        return ','.join(self.resolve_members(cell, expanded_groups))
+
+    def _resolve_column(self, series: pd.Series, expanded_groups: Dict[str, FrozenSet[str]],
+                        cell_cache: Dict[str, FrozenSet[str]]) -> List[FrozenSet[str]]:
+        """컬럼의 각 셀을 말단 멤버 집합으로 변환합니다. 같은 셀 값은 한 번만 계산합니다."""
+        results = []
+        for cell in series:
+            key = str(cell)
+            members = cell_cache.get(key)
+            if members is None:
+                members = self.resolve_members(key, expanded_groups)
+                cell_cache[key] = members
+            results.append(members)
+        return results
 
     def replace_object_to_value(self, resolved_source: str, network_dict: dict) -> str:
         replaced_names = [str(network_dict.get(name, name)) for name in str(resolved_source).split(',')]
         return ','.join(set(replaced_names))
 
 
+    def compile_address(self, name: str, network_dict: dict) -> AddressSet:
+        """
+        네트워크 객체명을 IP 구간 집합으로 변환합니다. 객체명별로 한 번만 변환합니다.
+
+        Args:
+            name: 네트워크 객체명 또는 주소 값
+            network_dict: {객체명: 주소 값} 딕셔너리
+
+        Returns:
+            AddressSet
+        """
+        address = self.address_cache.get(name)
+        if address is None:
+            address = AddressSet.parse(network_dict.get(name, name))
+            self.address_cache[name] = address
+        return address
+
+    def compile_cell(self, members: Iterable[str], network_dict: dict) -> AddressSet:
+        """
+        그룹이 풀린 객체명 목록을 하나의 IP 구간 집합으로 변환합니다.
+
+        Args:
+            members: 말단 객체명 목록
+            network_dict: {객체명: 주소 값} 딕셔너리
+
+        Returns:
+            AddressSet
+        """
+        return AddressSet.union_all(self.compile_address(name, network_dict) for name in members)
+
+    def get_address_index(self, direction: str = 'source') -> AddressIndex:
+        """
+        마지막으로 resolve한 정책의 주소 인덱스를 반환합니다.
+
+        Args:
+            direction: 'source' 또는 'destination'
+
+        Returns:
+            AddressIndex
+        """
+        if direction not in self.addresses:
+            raise ValueError(f"변환된 정책 주소가 없습니다: {direction} (resolve를 먼저 호출하세요)")
+        if direction not in self._address_indexes:
+            self._address_indexes[direction] = AddressIndex(self.addresses[direction])
+        return self._address_indexes[direction]
+
+    def find_rules_by_ip(self, ip: str, direction: str = 'source') -> pd.DataFrame:
+        """
+        IP 주소를 출발지 또는 목적지로 포함하는 정책을 찾습니다.
+
+        Args:
+            ip: IP 주소 문자열
+            direction: 'source' 또는 'destination'
+
+        Returns:
+            해당 IP를 포함하는 정책 데이터프레임
+        """
+        positions = self.get_address_index(direction).find_ip(ip)
+        return self.rules_df.iloc[positions]
+
     def combine_protocol_port(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Protocol + Port 정보를 기반으로 Value 컬럼 생성
@@ -44,25 +224,93 @@ class PolicyResolver:
         Returns:
             pd.DataFrame: 'Value' 컬럼 추가 및 필요시 row 분리된 DataFrame
         """
-        rows = []
+        if df.empty:
+            return pd.DataFrame(columns=['Name', 'Protocol', 'Port', 'Value'])
+
+        protocol = df['Protocol'].astype(str).str.upper()
+        port_raw = df['Port'].astype(str).str.replace(' ', '', regex=False)
+        # '*' 처리 → '0-65535'
+        port_raw = port_raw.mask(port_raw == '*', '0-65535')
+
+        combined = pd.DataFrame({'Name': df['Name'].to_numpy(), 'Protocol': protocol.to_numpy(),
+                                 'Port': port_raw.str.split(',').to_numpy()})
+        combined = combined.explode('Port', ignore_index=True)
+        combined['Port'] = combined['Port'].str.strip()
+        combined['Value'] = combined['Protocol'] + '/' + combined['Port']
+        return combined
+
+    def compile_services(self, combined_df: pd.DataFrame) -> Dict[str, ServiceSet]:
+        """
+        combine_protocol_port 결과를 서비스 객체별 프로토콜/포트 구간 집합으로 변환합니다.
+        포트 범위('1024-2048')를 포함해 벡터 연산으로 해석하고, 같은 이름의 여러 행은 하나로 병합합니다.
+
+        Args:
+            combined_df: 'Name', 'Protocol', 'Port', 'Value' 컬럼을 가진 DataFrame
+
+        Returns:
+            {서비스명: ServiceSet}
+        """
+        if combined_df.empty:
+            return {}
+
+        bounds = combined_df['Port'].str.extract(r'^(\d+)(?:-(\d+))?$')
+        starts = pd.to_numeric(bounds[0], errors='coerce')
+        ends = pd.to_numeric(bounds[1].fillna(bounds[0]), errors='coerce')
+        valid = (starts.notna() & (starts <= ends) & (ends <= PORT_MAX)).to_numpy()
+        starts = starts.to_numpy()[valid].astype(np.int64)
+        ends = ends.to_numpy()[valid].astype(np.int64)
+
+        services: Dict[str, Dict[str, IntervalSet]] = {}
+        valid_rows = combined_df[valid]
+        for (name, protocol), positions in valid_rows.groupby(['Name', 'Protocol'], sort=False).indices.items():
+            services.setdefault(name, {})[protocol] = IntervalSet.from_arrays(starts[positions], ends[positions])
+        compiled = {name: ServiceSet(protocols) for name, protocols in services.items()}
 
-        for _, row in df.iterrows():
-            name = row['Name']
-            protocol = str(row['Protocol']).upper()
-            port_raw = str(row['Port']).replace(' ', '')
+        # 숫자 범위가 아닌 포트('any' 등)는 문자열 해석으로 처리
+        for name, values in combined_df[~valid].groupby('Name', sort=False)['Value']:
+            extra = ServiceSet.from_tokens(values)
+            compiled[name] = compiled[name].union(extra) if name in compiled else extra
+        return compiled
+
+    def compile_service(self, name: str) -> ServiceSet:
+        """
+        서비스 객체명을 프로토콜/포트 구간 집합으로 변환합니다.
+        서비스 객체가 아닌 값('any', 'TCP/80' 등)은 값 자체를 해석합니다.
+
+        Args:
+            name: 서비스 객체명 또는 서비스 값
+
+        Returns:
+            ServiceSet
+        """
+        service = self.service_cache.get(name)
+        if service is None:
+            service = ServiceSet.parse(name)
+            self.service_cache[name] = service
+        return service
 
-            # '*' 처리 → '0-65535'
-            if port_raw == '*':
-                ports = ['0-65535']
-            else:
-                ports = port_raw.split(',')
+    def find_rules_by_service(self, protocol: str, port: int) -> pd.DataFrame:
+        """
+        프로토콜/포트를 허용 서비스로 포함하는 정책을 찾습니다.
 
-            for port in ports:
-                port = port.strip()
-                value = f"{protocol}/{port}"
-                rows.append({'Name': name, 'Protocol': protocol, 'Port': port, 'Value': value})
+        Args:
+            protocol: 프로토콜 (예: 'tcp')
+            port: 포트 번호
 
-        return pd.DataFrame(rows)
+        Returns:
+            해당 서비스를 포함하는 정책 데이터프레임
+        """
+        if self.rules_df is None:
+            raise ValueError("변환된 정책 서비스가 없습니다. (resolve를 먼저 호출하세요)")
+        # 같은 서비스 집합을 공유하는 정책이 많으므로 고유 집합 단위로 한 번씩만 검사
+        matched: Dict[int, bool] = {}
+        mask = np.zeros(len(self.services), dtype=bool)
+        for position, service in enumerate(self.services):
+            key = id(service)
+            if key not in matched:
+                matched[key] = service.contains_port(protocol, port)
+            mask[position] = matched[key]
+        return self.rules_df.iloc[np.flatnonzero(mask)]
 
     def resolve(self, rules_df, network_object_df, network_group_object_df, service_object_df, service_group_object_df) -> pd.DataFrame:
         try:
@@ -75,16 +323,50 @@ class PolicyResolver:
 
             service_group_dict = service_group_object_df.set_index('Group Name')['Entry'].to_dict()
             service_object_df = self.combine_protocol_port(service_object_df)
-            service_dict = service_object_df.set_index('Name')['Value'].to_dict()
+            # 서비스 하나가 여러 포트를 가질 수 있으므로 이름별로 모든 값을 유지
+            service_dict = service_object_df.groupby('Name', sort=False)['Value'].agg(list).to_dict()
+            self.service_cache = self.compile_services(service_object_df)
 
-            rules_df['Resolved Source'] = rules_df['Source'].apply(lambda x: self.process_cell(x, network_group_dict))
-            rules_df['Resolved Destination'] = rules_df['Destination'].apply(lambda x: self.process_cell(x, network_group_dict))
-            rules_df['Resolved Service'] = rules_df['Service'].apply(lambda x: self.process_cell(x, service_group_dict))
+            # 그룹은 장비(객체 목록)당 한 번만 펼치고, 셀 결과는 출발지/목적지 컬럼이 함께 재사용
+            self.group_cycles = []
+            network_groups = self.expand_groups(network_group_dict)
+            service_groups = self.expand_groups(service_group_dict)
+            network_cells: Dict[str, FrozenSet[str]] = {}
+            service_cells: Dict[str, FrozenSet[str]] = {}
+
+            source_members = self._resolve_column(rules_df['Source'], network_groups, network_cells)
+            destination_members = self._resolve_column(rules_df['Destination'], network_groups, network_cells)
+            service_members = self._resolve_column(rules_df['Service'], service_groups, service_cells)
+
+            rules_df['Resolved Source'] = [','.join(members) for members in source_members]
+            rules_df['Resolved Destination'] = [','.join(members) for members in destination_members]
+            rules_df['Resolved Service'] = [','.join(members) for members in service_members]
 
             rules_df['Extracted Source'] = rules_df['Resolved Source'].apply(lambda x: self.replace_object_to_value(x, network_dict))
             rules_df['Extracted Destination'] = rules_df['Resolved Destination'].apply(lambda x: self.replace_object_to_value(x, network_dict))
-            rules_df['Extracted Service'] = rules_df['Resolved Service'].apply(lambda x: self.replace_object_to_value(x, service_dict))
-            
+            extracted_services: Dict[FrozenSet[str], str] = {}
+            compiled_services: Dict[FrozenSet[str], ServiceSet] = {}
+            for members in set(service_members):
+                extracted_services[members] = ','.join(
+                    set().union(*(service_dict.get(name, (name,)) for name in members)))
+                compiled_services[members] = ServiceSet.union_all(self.compile_service(name) for name in members)
+            rules_df['Extracted Service'] = [extracted_services[members] for members in service_members]
+            self.services = [compiled_services[members] for members in service_members]
+
+            # 객체명 단위로 캐시된 IP 구간 집합을 정책별로 합쳐 둠
+            self.address_cache = {}
+            cell_cache: Dict[FrozenSet[str], AddressSet] = {}
+            self.addresses = {}
+            for direction, column_members in (('source', source_members), ('destination', destination_members)):
+                compiled = []
+                for members in column_members:
+                    if members not in cell_cache:
+                        cell_cache[members] = self.compile_cell(members, network_dict)
+                    compiled.append(cell_cache[members])
+                self.addresses[direction] = compiled
+            self.rules_df = rules_df
+            self._address_indexes = {}
+
             rules_df.drop(columns=['Resolved Source', 'Resolved Destination', 'Resolved Service'], inplace=True)
 
             return rules_df
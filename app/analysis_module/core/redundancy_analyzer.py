@@ -5,7 +5,6 @@
 import pandas as pd
 import logging
 from typing import Dict, List, Tuple
-from collections import defaultdict
 
 class RedundancyAnalyzer:
     """중복 정책 분석을 위한 클래스"""
@@ -24,18 +23,39 @@ class RedundancyAnalyzer:
             'default': ['Enable', 'Action', 'Extracted Source', 'User', 'Extracted Destination', 'Extracted Service', 'Application']
         }
     
-    def _normalize_policy(self, policy_series: pd.Series) -> tuple:
+    @staticmethod
+    def _normalize_column(series: pd.Series) -> pd.Series:
         """
-        정책 데이터를 정규화합니다.
+        다중 값 컬럼을 정규화합니다. (콤마로 분리 후 정렬하여 다시 결합)
+        같은 값은 한 번만 정규화하도록 고유값 단위로 변환합니다.
         
         Args:
-            policy_series: 정규화할 정책 데이터
+            series: 정규화할 컬럼
         
         Returns:
-            정규화된 정책 데이터 튜플
+            정규화된 컬럼
         """
-        normalized_policy = policy_series.apply(lambda x: ','.join(sorted(x.split(','))) if isinstance(x, str) else x)
-        return tuple(normalized_policy)
+        uniques = series.dropna().unique()
+        mapping = {
+            value: ','.join(sorted(value.split(','))) if isinstance(value, str) else value
+            for value in uniques
+        }
+        return series.map(mapping)
+    
+    def _build_policy_keys(self, df_check: pd.DataFrame) -> pd.Series:
+        """
+        정규화된 비교 컬럼으로 정책별 그룹 키를 생성합니다.
+        같은 키는 정규화된 내용이 같은 정책이며, 키 번호는 처음 등장한 순서입니다.
+        
+        Args:
+            df_check: 비교할 컬럼만 선택한 데이터프레임
+        
+        Returns:
+            정책별 그룹 키
+        """
+        normalized = pd.DataFrame({column: self._normalize_column(df_check[column]) for column in df_check.columns},
+                                  index=df_check.index)
+        return normalized.groupby(list(normalized.columns), sort=False, dropna=False).ngroup()
     
     def _prepare_data(self, df: pd.DataFrame, vendor: str) -> pd.DataFrame:
         """
@@ -85,59 +105,26 @@ class RedundancyAnalyzer:
             df_check = df_filtered[columns_to_check]
             
             # 중복 정책 분석
-            policy_map = defaultdict(list)
-            results_list = []
-            current_no = 1
-            total = len(df_filtered)
-            
-            self.logger.info("정책 중복 여부 확인 중...")
-            for i in range(total):
-                try:
-                    # 진행률 표시 (10% 단위로)
-                    if i % (total // 10) == 0 or i == total - 1:
-                        progress = (i + 1) / total * 100
-                        print(f"\r정책 분석 중: {progress:.1f}% ({i + 1}/{total})", end='', flush=True)
-                    
-                    current_policy = self._normalize_policy(df_check.iloc[i])
-                    if current_policy in policy_map:
-                        row = df_filtered.iloc[i].to_dict()
-                        row.update({'No': policy_map[current_policy], 'Type': 'Lower'})
-                        results_list.append(row)
-                    else:
-                        policy_map[current_policy] = current_no
-                        row = df_filtered.iloc[i].to_dict()
-                        row.update({'No': current_no, 'Type': 'Upper'})
-                        results_list.append(row)
-                        current_no += 1
-                except Exception as e:
-                    self.logger.warning(f"정책 {i} 분석 중 오류 발생: {e}")
-                    continue
+            self.logger.info(f"정책 중복 여부 확인 중... ({len(df_filtered)}개)")
+            policy_keys = self._build_policy_keys(df_check)
             
-            print()  # 줄바꿈
-            
-            # 결과 데이터프레임 생성
-            results = pd.DataFrame(results_list)
-
-            # 각 No 그룹에 Upper와 Lower가 모두 포함되도록 필터링
-            def ensure_upper_and_lower(df):
-                valid_no_groups = []
-                grouped = df.groupby('No')
-                for name, group in grouped:
-                    if 'Upper' in group['Type'].values and 'Lower' in group['Type'].values:
-                        valid_no_groups.append(group)
-                return pd.concat(valid_no_groups).reset_index(drop=True)
-
-            duplicated_results = ensure_upper_and_lower(results)
+            # 같은 키의 정책이 2개 이상인 그룹만 선택 (첫 정책은 Upper, 나머지는 Lower)
+            duplicated_mask = policy_keys.duplicated(keep=False)
+            duplicated_results = df_filtered[duplicated_mask].copy()
+            duplicated_keys = policy_keys[duplicated_mask]
+            duplicated_results['Type'] = duplicated_keys.duplicated().map({False: 'Upper', True: 'Lower'})
             
-            # No 재부여
-            duplicated_results['No'] = duplicated_results.groupby('No').ngroup() + 1
+            # No 부여 (Upper 정책이 나온 순서대로 1부터)
+            duplicated_results['No'] = pd.factorize(duplicated_keys)[0] + 1
             
             # 컬럼 순서 재조정
             columns_order = ['No', 'Type'] + [col for col in df.columns]
             duplicated_results = duplicated_results[columns_order]
             
-            # No 기준으로, 각 No 내에서 Upper가 상단에 위치하도록 정렬 (내림차순 정렬)
-            duplicated_results = duplicated_results.sort_values(by=['No', 'Type'], ascending=[True, False])
+            # No 기준으로, 각 No 내에서 Upper가 상단에 위치하도록 정렬 (같은 Type은 정책 순서 유지)
+            duplicated_results = duplicated_results.sort_values(
+                by=['No', 'Type'], ascending=[True, False], kind='stable'
+            ).reset_index(drop=True)
 
             self.logger.info("중복 정책 분석 완료")
             return duplicated_results
@@ -0,0 +1,265 @@
+"""
+가려진(Shadowed) 정책 분석을 위한 클래스입니다.
+"""
+
+import pandas as pd
+import numpy as np
+import logging
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from ..utils.interval_set import IntervalSet, _to_array
+from ..utils.ip_intervals import AddressSet
+from ..utils.port_intervals import ServiceSet, PORT_MAX
+
+
+class _StabbingIndex:
+    """
+    여러 정책의 구간을 모아 특정 값을 포함하는 정책을 찾는 인덱스입니다.
+
+    구간을 길이 등급(길이의 비트 수)별로 나누어 시작값 기준으로 정렬해 둡니다.
+    값 v를 포함하는 구간은 각 등급에서 시작값이 [v - 최대 길이, v] 범위에 있으므로,
+    전체 구간을 훑지 않고 등급별로 좁은 범위만 검사합니다.
+    """
+
+    def __init__(self, interval_sets: List[IntervalSet]):
+        starts, ends, owners = [], [], []
+        for position, intervals in enumerate(interval_sets):
+            for start, end in intervals:
+                starts.append(start)
+                ends.append(end)
+                owners.append(position)
+
+        buckets: Dict[int, list] = {}
+        for start, end, owner in zip(starts, ends, owners):
+            buckets.setdefault((end - start).bit_length(), []).append((start, end, owner))
+
+        self.buckets = []
+        for _, entries in sorted(buckets.items()):
+            entries.sort()
+            # 시작값 순으로 정렬되어 있어 마지막 끝값이 가장 크다는 보장이 없으므로 끝값 전체로 dtype 결정
+            bucket_ends = _to_array(entry[1] for entry in entries)
+            bucket_starts = np.array([entry[0] for entry in entries], dtype=bucket_ends.dtype)
+            bucket_owners = np.array([entry[2] for entry in entries], dtype=np.int64)
+            max_length = max(entry[1] - entry[0] for entry in entries)
+            self.buckets.append((bucket_starts, bucket_ends, bucket_owners, max_length))
+
+    def query(self, value: int, before: int) -> np.ndarray:
+        """
+        값을 포함하는 구간을 가진 정책 위치를 반환합니다.
+
+        Args:
+            value: 검사할 값
+            before: 이 위치보다 앞선 정책만 반환
+
+        Returns:
+            정책 위치 배열 (병합된 구간 집합은 값 하나를 한 구간만 포함하므로 중복 없음)
+        """
+        value = int(value)
+        hits = []
+        for starts, ends, owners, max_length in self.buckets:
+            low = np.searchsorted(starts, max(0, value - max_length), side='left')
+            high = np.searchsorted(starts, value, side='right')
+            if low < high:
+                matched = owners[low:high][np.asarray(ends[low:high] >= value, dtype=bool)]
+                hits.append(matched[matched < before])
+        if not hits:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate(hits)
+
+
+class ShadowAnalyzer:
+    """가려진 정책(앞선 정책이 출발지/목적지/서비스를 모두 포함하는 정책) 분석을 위한 클래스"""
+
+    def __init__(self):
+        """ShadowAnalyzer 초기화"""
+        self.logger = logging.getLogger(__name__)
+        self.required_columns = ['Extracted Source', 'Extracted Destination', 'Extracted Service']
+        # 앞선 정책이 any이거나 값을 모두 포함해야 하는 컬럼
+        self.member_columns = ['User', 'Application']
+        # 값이 같은 정책끼리만 비교하는 컬럼
+        self.partition_columns = ['Vsys']
+        # 인덱스로 후보를 좁히다가 이 수 이하가 되면 포함 여부를 직접 검사
+        self.candidate_limit = 32
+
+    @staticmethod
+    def _parse_column(series: pd.Series, parser: Callable) -> list:
+        """컬럼 값을 고유값 단위로 한 번만 변환합니다."""
+        cache = {}
+        results = []
+        for value in series:
+            key = value if isinstance(value, str) else None
+            if key not in cache:
+                cache[key] = parser(key)
+            results.append(cache[key])
+        return results
+
+    @staticmethod
+    def _parse_members(value: Optional[str]) -> Optional[FrozenSet[str]]:
+        """콤마로 구분된 값을 집합으로 변환합니다. any이거나 비어 있으면 None(전체)을 반환합니다."""
+        if not value:
+            return None
+        members = frozenset(member.strip() for member in value.split(',') if member.strip())
+        if not members or 'any' in {member.lower() for member in members}:
+            return None
+        return members
+
+    @staticmethod
+    def _members_contain(outer: Optional[FrozenSet[str]], inner: Optional[FrozenSet[str]]) -> bool:
+        """outer 값 집합(None은 전체)이 inner 값 집합을 포함하는지 검사합니다."""
+        return outer is None or (inner is not None and inner <= outer)
+
+    @staticmethod
+    def _encode_services(services: List[ServiceSet]) -> List[IntervalSet]:
+        """
+        프로토콜별 포트 구간을 하나의 정수 축으로 변환합니다. (프로토콜 코드 * 65536 + 포트)
+        any 서비스는 모든 프로토콜 코드를 덮는 하나의 구간이 됩니다.
+        """
+        protocols = sorted({protocol for service in services for protocol in service.protocols} - {'*'})
+        codes = {protocol: code for code, protocol in enumerate(protocols, start=1)}
+        span = PORT_MAX + 1
+        full = (0, (len(codes) + 1) * span - 1)
+
+        encoded = []
+        for service in services:
+            if service.is_any:
+                encoded.append(IntervalSet.from_pairs([full]))
+                continue
+            encoded.append(IntervalSet.from_pairs(
+                (codes[protocol] * span + start, codes[protocol] * span + end)
+                for protocol, ports in service.protocols.items()
+                for start, end in ports
+            ))
+        return encoded
+
+    def _covers(self, rules: Dict[str, list], outer: int, inner: int) -> bool:
+        """outer 정책이 inner 정책의 트래픽을 모두 포함하는지 검사합니다."""
+        return (rules['source'][outer].contains(rules['source'][inner])
+                and rules['destination'][outer].contains(rules['destination'][inner])
+                and rules['service'][outer].contains(rules['service'][inner])
+                and all(self._members_contain(rules[column][outer], rules[column][inner])
+                        for column in self.member_columns if column in rules))
+
+    def _find_shadowed(self, rules: Dict[str, list]) -> List[Tuple[int, int]]:
+        """
+        정책 순서대로 각 정책을 가리는 가장 앞선 정책을 찾습니다.
+
+        각 정책의 대표 값(출발지/목적지 첫 주소, 첫 서비스 포트)을 포함하는 앞선 정책만 인덱스로 추려
+        후보로 삼고, 후보에 대해서만 전체 포함 여부를 검사합니다.
+
+        Args:
+            rules: 컬럼별 변환된 정책 값 목록
+
+        Returns:
+            (가리는 정책 위치, 가려진 정책 위치) 목록
+        """
+        total = len(rules['source'])
+        dimensions = []
+        # 보통 주소가 서비스보다 선택도가 높으므로 주소 축부터 후보를 좁힙니다.
+        for interval_sets in ([address.v4 for address in rules['source']],
+                              [address.v4 for address in rules['destination']],
+                              [address.v6 for address in rules['source']],
+                              [address.v6 for address in rules['destination']],
+                              self._encode_services(rules['service'])):
+            dimensions.append((interval_sets, _StabbingIndex(interval_sets)))
+
+        pairs = []
+        step = max(1, total // 10)
+        for inner in range(1, total):
+            if inner % step == 0:
+                self.logger.info(f"가려진 정책 분석 중: {inner / total * 100:.1f}% ({inner}/{total})")
+
+            candidates = None
+            for interval_sets, index in dimensions:
+                intervals = interval_sets[inner]
+                if not len(intervals):
+                    continue
+                hits = index.query(intervals.starts[0], inner)
+                candidates = hits if candidates is None else np.intersect1d(candidates, hits, assume_unique=True)
+                # 후보가 충분히 줄면 나머지 축은 인덱스 대신 직접 검사
+                if len(candidates) <= self.candidate_limit:
+                    break
+            if candidates is None:
+                candidates = np.arange(inner)
+            candidates = np.sort(candidates)
+
+            for outer in candidates:
+                if self._covers(rules, int(outer), inner):
+                    pairs.append((int(outer), inner))
+                    break
+        return pairs
+
+    def _compile_rules(self, df: pd.DataFrame) -> Dict[str, list]:
+        """분석에 필요한 컬럼을 주소/서비스/멤버 집합으로 변환합니다."""
+        rules = {
+            'source': self._parse_column(df['Extracted Source'], AddressSet.parse),
+            'destination': self._parse_column(df['Extracted Destination'], AddressSet.parse),
+            'service': self._parse_column(df['Extracted Service'], ServiceSet.parse),
+        }
+        for column in self.member_columns:
+            if column in df.columns:
+                rules[column] = self._parse_column(df[column], self._parse_members)
+        return rules
+
+    def analyze(self, df: pd.DataFrame, vendor: str, **kwargs) -> pd.DataFrame:
+        """
+        가려진 정책을 분석합니다.
+
+        결과는 중복 정책 분석과 같은 형식으로, 가리는 정책은 'Upper', 가려진 정책은 'Lower'로 표시하고
+        가리는 정책별로 같은 No를 부여합니다.
+
+        Args:
+            df: PolicyResolver로 Extracted 컬럼을 생성한 정책 데이터프레임
+            vendor: 방화벽 벤더
+            **kwargs: 추가 매개변수
+
+        Returns:
+            분석 결과 데이터프레임
+        """
+        try:
+            self.logger.info("가려진 정책 분석 시작")
+
+            missing_columns = [column for column in self.required_columns if column not in df.columns]
+            if missing_columns:
+                raise ValueError(f"분석에 필요한 컬럼이 없습니다: {', '.join(missing_columns)} "
+                                 f"(PolicyResolver로 먼저 변환하세요)")
+
+            # 활성화된 정책만 비교 (차단 정책도 뒤의 정책을 가릴 수 있으므로 Action은 구분하지 않음)
+            df_filtered = df[df['Enable'] == 'Y']
+            partition_columns = [column for column in self.partition_columns if column in df_filtered.columns]
+            if partition_columns:
+                partitions = [positions for positions in df_filtered.groupby(
+                    partition_columns, sort=False, dropna=False).indices.values()]
+            else:
+                partitions = [np.arange(len(df_filtered))]
+
+            pairs = []
+            for positions in partitions:
+                positions = np.sort(positions)
+                rules = self._compile_rules(df_filtered.iloc[positions])
+                pairs.extend((positions[outer], positions[inner]) for outer, inner in self._find_shadowed(rules))
+
+            columns_order = ['No', 'Type'] + [col for col in df.columns]
+            if not pairs:
+                self.logger.info("가려진 정책 분석 완료 (0건)")
+                return pd.DataFrame(columns=columns_order)
+
+            pairs = pd.DataFrame(pairs, columns=['outer', 'inner']).sort_values(['outer', 'inner'])
+            pairs['No'] = pd.factorize(pairs['outer'])[0] + 1
+            upper = pairs.drop_duplicates('outer')
+
+            upper_rows = df_filtered.iloc[upper['outer'].to_numpy()].copy()
+            upper_rows['No'] = upper['No'].to_numpy()
+            upper_rows['Type'] = 'Upper'
+            lower_rows = df_filtered.iloc[pairs['inner'].to_numpy()].copy()
+            lower_rows['No'] = pairs['No'].to_numpy()
+            lower_rows['Type'] = 'Lower'
+
+            results = pd.concat([upper_rows, lower_rows])[columns_order]
+            results = results.sort_values(by=['No', 'Type'], ascending=[True, False], kind='stable').reset_index(drop=True)
+
+            self.logger.info(f"가려진 정책 분석 완료 ({len(pairs)}건)")
+            return results
+
+        except Exception as e:
+            self.logger.error(f"가려진 정책 분석 중 오류 발생: {e}")
+            raise
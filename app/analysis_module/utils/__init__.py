@@ -3,5 +3,8 @@
 """
 
 from .excel_handler import ExcelHandler
+from .interval_set import IntervalSet
+from .ip_intervals import AddressSet, AddressIndex
+from .port_intervals import ServiceSet
 
-__all__ = ['ExcelHandler'] 
\ No newline at end of file
+__all__ = ['ExcelHandler', 'IntervalSet', 'AddressSet', 'AddressIndex', 'ServiceSet'] 
\ No newline at end of file
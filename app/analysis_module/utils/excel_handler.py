@@ -94,6 +94,33 @@ class ExcelHandler:
             self.logger.error(f"결과 저장 중 오류 발생: {e}")
             raise
     
+    def save_shadow_analysis(self, 
+                           df: pd.DataFrame, 
+                           output_file: str):
+        """
+        가려진 정책 분석 결과를 엑셀 파일로 저장합니다.
+        (가리는 정책은 Upper, 가려진 정책은 Lower 스타일로 표시)
+        
+        Args:
+            df: 저장할 데이터프레임
+            output_file: 저장할 파일 경로
+        """
+        try:
+            self.logger.info(f"가려진 정책 분석 결과 저장 중: {output_file}")
+            
+            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+                df.to_excel(writer, 
+                          sheet_name='Shadow', 
+                          index=False)
+                self._apply_styles(writer.sheets['Shadow'], 
+                                 'redundancy')
+            
+            self.logger.info(f"결과가 {output_file}에 저장되었습니다.")
+            
+        except Exception as e:
+            self.logger.error(f"결과 저장 중 오류 발생: {e}")
+            raise
+    
     def save_change_analysis(self, 
                            results: Dict[str, pd.DataFrame], 
                            output_file: str):
@@ -0,0 +1,211 @@
+"""
+정수 구간 집합을 다루는 유틸리티 클래스입니다.
+"""
+
+import numpy as np
+from typing import Iterable, Iterator, Tuple
+
+# int64로 표현할 수 있는 최대값 (초과하는 값은 파이썬 정수 배열로 보관)
+INT64_MAX = np.iinfo(np.int64).max
+
+
+def _to_array(values) -> np.ndarray:
+    """정수 목록을 int64 배열로, int64 범위를 넘으면 object 배열로 변환합니다."""
+    values = list(values)
+    if values and max(values) > INT64_MAX:
+        return np.array(values, dtype=object)
+    return np.array(values, dtype=np.int64)
+
+
+class IntervalSet:
+    """
+    정렬·병합된 닫힌 정수 구간 [start, end] 집합입니다.
+
+    구간은 시작값 기준으로 정렬되고 겹치거나 맞닿은 구간은 하나로 병합되어 있으므로
+    포함/겹침 검사를 searchsorted 기반 벡터 연산으로 수행할 수 있습니다.
+    """
+
+    __slots__ = ('starts', 'ends')
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray):
+        """
+        IntervalSet 초기화 (이미 정렬·병합된 배열을 받습니다. 일반적으로 from_pairs를 사용합니다)
+
+        Args:
+            starts: 구간 시작값 배열
+            ends: 구간 끝값 배열
+        """
+        self.starts = starts
+        self.ends = ends
+
+    @classmethod
+    def empty(cls) -> 'IntervalSet':
+        """빈 구간 집합을 반환합니다."""
+        return cls(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[int, int]]) -> 'IntervalSet':
+        """
+        (start, end) 목록으로 구간 집합을 생성합니다. 겹치거나 맞닿은 구간은 병합합니다.
+
+        Args:
+            pairs: (start, end) 튜플 목록 (양 끝 포함)
+
+        Returns:
+            병합된 구간 집합
+        """
+        pairs = list(pairs)
+        if not pairs:
+            return cls.empty()
+        if len(pairs) == 1:
+            bounds = _to_array(pairs[0])
+            return cls(bounds[:1], bounds[1:])
+        starts = _to_array(start for start, _ in pairs)
+        ends = _to_array(end for _, end in pairs)
+        if starts.dtype != ends.dtype:
+            starts, ends = starts.astype(object), ends.astype(object)
+        return cls._merge(starts, ends)
+
+    @classmethod
+    def from_arrays(cls, starts, ends) -> 'IntervalSet':
+        """
+        시작값/끝값 배열로 구간 집합을 생성합니다. 겹치거나 맞닿은 구간은 병합합니다.
+
+        Args:
+            starts: 구간 시작값 배열
+            ends: 구간 끝값 배열 (양 끝 포함)
+
+        Returns:
+            병합된 구간 집합
+        """
+        starts, ends = np.asarray(starts), np.asarray(ends)
+        if not len(starts):
+            return cls.empty()
+        if starts.dtype != ends.dtype:
+            starts, ends = starts.astype(object), ends.astype(object)
+        return cls._merge(starts, ends)
+
+    @classmethod
+    def _merge(cls, starts: np.ndarray, ends: np.ndarray) -> 'IntervalSet':
+        """정렬되지 않은 구간 배열을 정렬·병합합니다."""
+        order = np.argsort(starts, kind='stable')
+        starts, ends = starts[order], ends[order]
+        max_ends = np.maximum.accumulate(ends)
+        # 직전까지의 최대 끝값 + 1보다 시작값이 크면 새 구간
+        new_group = np.ones(len(starts), dtype=bool)
+        new_group[1:] = starts[1:] > max_ends[:-1] + 1
+        group_starts = np.flatnonzero(new_group)
+        group_ends = np.append(group_starts[1:], len(starts)) - 1
+        return cls(starts[group_starts], max_ends[group_ends])
+
+    @classmethod
+    def union_all(cls, interval_sets: Iterable['IntervalSet']) -> 'IntervalSet':
+        """
+        여러 구간 집합의 합집합을 한 번의 정렬·병합으로 계산합니다.
+
+        Args:
+            interval_sets: 구간 집합 목록
+
+        Returns:
+            병합된 구간 집합
+        """
+        interval_sets = [intervals for intervals in interval_sets if len(intervals)]
+        if not interval_sets:
+            return cls.empty()
+        if len(interval_sets) == 1:
+            return interval_sets[0]
+        starts = [intervals.starts for intervals in interval_sets]
+        ends = [intervals.ends for intervals in interval_sets]
+        if any(array.dtype == object for array in starts + ends):
+            starts = [array.astype(object) for array in starts]
+            ends = [array.astype(object) for array in ends]
+        return cls._merge(np.concatenate(starts), np.concatenate(ends))
+
+    def union(self, other: 'IntervalSet') -> 'IntervalSet':
+        """두 구간 집합의 합집합을 반환합니다."""
+        return self.union_all([self, other])
+
+    def _covering_index(self, values: np.ndarray) -> np.ndarray:
+        """각 값보다 시작값이 작거나 같은 마지막 구간의 위치를 반환합니다. (없으면 -1)"""
+        return np.searchsorted(self.starts, values, side='right') - 1
+
+    def contains_points(self, values) -> np.ndarray:
+        """
+        각 값이 구간 집합에 포함되는지 검사합니다.
+
+        Args:
+            values: 검사할 값 배열
+
+        Returns:
+            값별 포함 여부 배열
+        """
+        values = _to_array(int(value) for value in values)
+        if not len(self):
+            return np.zeros(values.shape, dtype=bool)
+        starts, ends = self.starts, self.ends
+        if values.dtype != starts.dtype:
+            values, starts, ends = values.astype(object), starts.astype(object), ends.astype(object)
+        index = np.searchsorted(starts, values, side='right') - 1
+        found = index >= 0
+        result = np.zeros(values.shape, dtype=bool)
+        result[found] = np.asarray(ends[index[found]] >= values[found], dtype=bool)
+        return result
+
+    def contains_point(self, value: int) -> bool:
+        """값 하나가 구간 집합에 포함되는지 검사합니다."""
+        return bool(self.contains_points([value])[0])
+
+    def contains(self, other: 'IntervalSet') -> bool:
+        """
+        다른 구간 집합이 이 집합에 완전히 포함되는지 검사합니다.
+
+        Args:
+            other: 검사할 구간 집합
+
+        Returns:
+            포함 여부
+        """
+        if not len(other):
+            return True
+        if not len(self):
+            return False
+        index = self._covering_index(other.starts)
+        if (index < 0).any():
+            return False
+        return bool(np.all(self.ends[index] >= other.ends))
+
+    def overlaps(self, other: 'IntervalSet') -> bool:
+        """
+        두 구간 집합이 하나 이상의 값을 공유하는지 검사합니다.
+
+        Args:
+            other: 검사할 구간 집합
+
+        Returns:
+            겹침 여부
+        """
+        if not len(self) or not len(other):
+            return False
+        # 상대 구간의 시작값을 덮는 구간이 있거나, 상대 구간 안에서 시작하는 구간이 있으면 겹침
+        if self.contains_points(other.starts).any():
+            return True
+        index = np.searchsorted(self.starts, other.starts, side='left')
+        inside = index < len(self.starts)
+        return bool(np.any(self.starts[index[inside]] <= other.ends[inside]))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip((int(start) for start in self.starts), (int(end) for end in self.ends))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
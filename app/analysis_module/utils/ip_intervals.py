@@ -0,0 +1,287 @@
+"""
+IP 주소 값을 정수 구간 집합으로 변환하는 유틸리티입니다.
+"""
+
+import ipaddress
+import numpy as np
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
+from .interval_set import IntervalSet
+
+IPV4_MAX = 2 ** 32 - 1
+IPV6_MAX = 2 ** 128 - 1
+
+# 전체 주소를 의미하는 값
+ANY_VALUES = {'any', 'all', '*', '0.0.0.0/0', '::/0'}
+
+
+@lru_cache(maxsize=65536)
+def parse_address_token(token: str) -> Optional[Tuple[int, int, int]]:
+    """
+    주소 값 하나를 (버전, 시작, 끝) 정수 구간으로 변환합니다.
+    지원 형식: 단일 IP, CIDR(호스트 비트 허용), 'start-end' 범위
+
+    Args:
+        token: 주소 문자열 (예: '10.0.0.0/24', '10.0.0.1-10.0.0.9')
+
+    Returns:
+        (4 또는 6, 시작 정수, 끝 정수), IP가 아니면 None
+    """
+    try:
+        if '-' in token:
+            start_text, end_text = token.split('-', 1)
+            start = ipaddress.ip_address(start_text.strip())
+            end = ipaddress.ip_address(end_text.strip())
+            if start.version != end.version or int(end) < int(start):
+                return None
+            return start.version, int(start), int(end)
+        network = ipaddress.ip_network(token, strict=False)
+        return network.version, int(network.network_address), int(network.broadcast_address)
+    except ValueError:
+        return None
+
+
+class AddressSet:
+    """
+    정책의 출발지/목적지 주소를 IPv4/IPv6 구간 집합과 이름(FQDN 등) 집합으로 표현합니다.
+    """
+
+    __slots__ = ('v4', 'v6', 'names')
+
+    def __init__(self, v4: IntervalSet, v6: IntervalSet, names: FrozenSet[str] = frozenset()):
+        """
+        AddressSet 초기화
+
+        Args:
+            v4: IPv4 구간 집합
+            v6: IPv6 구간 집합
+            names: IP로 해석되지 않는 값 (FQDN, 미해석 객체명 등)
+        """
+        self.v4 = v4
+        self.v6 = v6
+        self.names = names
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[str]) -> 'AddressSet':
+        """
+        주소 값 목록으로 AddressSet을 생성합니다.
+
+        Args:
+            tokens: 주소 문자열 목록
+
+        Returns:
+            AddressSet
+        """
+        v4_pairs, v6_pairs, names = [], [], set()
+        for token in tokens:
+            token = str(token).strip()
+            if not token:
+                continue
+            if token.lower() in ANY_VALUES:
+                v4_pairs.append((0, IPV4_MAX))
+                v6_pairs.append((0, IPV6_MAX))
+                continue
+            parsed = parse_address_token(token)
+            if parsed is None:
+                names.add(token)
+            elif parsed[0] == 4:
+                v4_pairs.append(parsed[1:])
+            else:
+                v6_pairs.append(parsed[1:])
+        return cls(IntervalSet.from_pairs(v4_pairs), IntervalSet.from_pairs(v6_pairs), frozenset(names))
+
+    @classmethod
+    def parse(cls, value) -> 'AddressSet':
+        """
+        콤마로 구분된 주소 문자열로 AddressSet을 생성합니다.
+
+        Args:
+            value: 예) '10.0.0.0/24,10.1.0.1-10.1.0.9,www.example.com'
+
+        Returns:
+            AddressSet
+        """
+        if value is None or (isinstance(value, float) and value != value):
+            return cls(IntervalSet.empty(), IntervalSet.empty())
+        return cls.from_tokens(str(value).split(','))
+
+    @classmethod
+    def union_all(cls, address_sets: Iterable['AddressSet']) -> 'AddressSet':
+        """
+        여러 주소 집합의 합집합을 계산합니다. (IPv4/IPv6별로 한 번만 병합)
+
+        Args:
+            address_sets: 주소 집합 목록
+
+        Returns:
+            합쳐진 주소 집합
+        """
+        address_sets = list(address_sets)
+        if len(address_sets) == 1:
+            return address_sets[0]
+        return cls(IntervalSet.union_all(address.v4 for address in address_sets),
+                   IntervalSet.union_all(address.v6 for address in address_sets),
+                   frozenset().union(*(address.names for address in address_sets)))
+
+    @property
+    def is_any(self) -> bool:
+        """모든 주소를 포함하는지 여부"""
+        return (len(self.v4) == 1 and self.v4.starts[0] == 0 and self.v4.ends[0] == IPV4_MAX
+                and len(self.v6) == 1 and self.v6.starts[0] == 0 and self.v6.ends[0] == IPV6_MAX)
+
+    def union(self, other: 'AddressSet') -> 'AddressSet':
+        """두 주소 집합의 합집합을 반환합니다."""
+        return AddressSet(self.v4.union(other.v4), self.v6.union(other.v6), self.names | other.names)
+
+    def contains(self, other: 'AddressSet') -> bool:
+        """
+        다른 주소 집합이 이 집합에 완전히 포함되는지 검사합니다.
+        이름 값은 같은 이름이 있거나 이 집합이 any인 경우에만 포함으로 봅니다.
+
+        Args:
+            other: 검사할 주소 집합
+
+        Returns:
+            포함 여부
+        """
+        if not self.v4.contains(other.v4) or not self.v6.contains(other.v6):
+            return False
+        return other.names <= self.names or self.is_any
+
+    def overlaps(self, other: 'AddressSet') -> bool:
+        """두 주소 집합이 하나 이상의 주소를 공유하는지 검사합니다."""
+        if self.v4.overlaps(other.v4) or self.v6.overlaps(other.v6):
+            return True
+        return bool(self.names & other.names) or (bool(other.names) and self.is_any) or (bool(self.names) and other.is_any)
+
+    def contains_ip(self, ip: str) -> bool:
+        """
+        IP 주소 하나가 포함되는지 검사합니다.
+
+        Args:
+            ip: IP 주소 문자열
+
+        Returns:
+            포함 여부
+        """
+        address = ipaddress.ip_address(ip)
+        intervals = self.v4 if address.version == 4 else self.v6
+        return intervals.contains_point(int(address))
+
+    def is_empty(self) -> bool:
+        """주소가 하나도 없는지 여부"""
+        return not len(self.v4) and not len(self.v6) and not self.names
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, AddressSet):
+            return NotImplemented
+        return self.v4 == other.v4 and self.v6 == other.v6 and self.names == other.names
+
+    def __hash__(self) -> int:
+        return hash((self.v4, self.v6, self.names))
+
+    def __repr__(self) -> str:
+        return f"AddressSet(v4={list(self.v4)}, v6={list(self.v6)}, names={sorted(self.names)})"
+
+
+class AddressIndex:
+    """
+    여러 정책의 주소 집합을 하나의 구간 배열로 모아 IP/주소 범위로 정책을 찾는 인덱스입니다.
+    """
+
+    def __init__(self, address_sets: List[AddressSet]):
+        """
+        AddressIndex 초기화
+
+        Args:
+            address_sets: 정책 순서대로 정렬된 주소 집합 목록
+        """
+        self.address_sets = address_sets
+        self.size = len(address_sets)
+        self.any_mask = np.array([address.is_any for address in address_sets], dtype=bool)
+        # 이름 값(FQDN 등)별 정책 위치
+        self.name_owners = {}
+        for position, address in enumerate(address_sets):
+            for name in address.names:
+                self.name_owners.setdefault(name, []).append(position)
+        self.families = {}
+        for version in (4, 6):
+            interval_sets = [address.v4 if version == 4 else address.v6 for address in address_sets]
+            owners = np.repeat(np.arange(self.size), [len(intervals) for intervals in interval_sets])
+            merged = [intervals for intervals in interval_sets if len(intervals)]
+            if not merged:
+                continue
+            starts = [intervals.starts for intervals in merged]
+            ends = [intervals.ends for intervals in merged]
+            if version == 6 or any(array.dtype == object for array in starts + ends):
+                starts = [array.astype(object) for array in starts]
+                ends = [array.astype(object) for array in ends]
+            self.families[version] = (np.concatenate(starts), np.concatenate(ends), owners)
+
+    def _positions(self, matched: np.ndarray) -> np.ndarray:
+        """구간별 일치 여부를 정책 위치 배열로 변환합니다."""
+        return np.flatnonzero(matched)
+
+    def find_ip(self, ip: str) -> np.ndarray:
+        """
+        IP 주소를 포함하는 정책 위치를 반환합니다.
+
+        Args:
+            ip: IP 주소 문자열
+
+        Returns:
+            정렬된 정책 위치 배열
+        """
+        address = ipaddress.ip_address(ip)
+        matched = np.zeros(self.size, dtype=bool)
+        if address.version in self.families:
+            starts, ends, owners = self.families[address.version]
+            value = int(address)
+            hits = np.asarray(starts <= value, dtype=bool) & np.asarray(ends >= value, dtype=bool)
+            matched[owners[hits]] = True
+        return self._positions(matched)
+
+    def find_overlapping(self, address_set: AddressSet) -> np.ndarray:
+        """
+        주소 집합과 하나 이상의 주소를 공유하는 정책 위치를 반환합니다.
+
+        Args:
+            address_set: 검사할 주소 집합
+
+        Returns:
+            정렬된 정책 위치 배열
+        """
+        matched = np.zeros(self.size, dtype=bool)
+        for version, intervals in ((4, address_set.v4), (6, address_set.v6)):
+            if version not in self.families or not len(intervals):
+                continue
+            starts, ends, owners = self.families[version]
+            for start, end in intervals:
+                hits = np.asarray(starts <= end, dtype=bool) & np.asarray(ends >= start, dtype=bool)
+                matched[owners[hits]] = True
+        if address_set.names:
+            matched |= self.any_mask
+            for name in address_set.names:
+                matched[self.name_owners.get(name, [])] = True
+        return self._positions(matched)
+
+    def find_containing(self, address_set: AddressSet) -> np.ndarray:
+        """
+        주소 집합을 완전히 포함하는 정책 위치를 반환합니다.
+        첫 주소를 포함하는 정책으로 후보를 좁힌 뒤 후보만 구간 단위로 검사합니다.
+
+        Args:
+            address_set: 검사할 주소 집합
+
+        Returns:
+            정렬된 정책 위치 배열
+        """
+        if len(address_set.v4):
+            candidates = self.find_ip(str(ipaddress.IPv4Address(int(address_set.v4.starts[0]))))
+        elif len(address_set.v6):
+            candidates = self.find_ip(str(ipaddress.IPv6Address(int(address_set.v6.starts[0]))))
+        else:
+            candidates = np.arange(self.size)
+        return np.array([position for position in candidates if self.address_sets[position].contains(address_set)],
+                        dtype=np.int64)
@@ -0,0 +1,221 @@
+"""
+서비스(프로토콜/포트) 값을 프로토콜별 포트 구간 집합으로 변환하는 유틸리티입니다.
+"""
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+from .interval_set import IntervalSet
+
+PORT_MAX = 65535
+
+# 모든 프로토콜/포트를 의미하는 프로토콜 키
+ANY_PROTOCOL = '*'
+
+# 전체 서비스를 의미하는 값
+ANY_VALUES = {'any', 'all', '*'}
+
+
+@lru_cache(maxsize=65536)
+def parse_port_range(port: str) -> Optional[Tuple[int, int]]:
+    """
+    포트 값 하나를 (시작, 끝) 구간으로 변환합니다.
+
+    Args:
+        port: '80', '1024-2048', '*' 형식의 포트 문자열
+
+    Returns:
+        (시작 포트, 끝 포트), 해석할 수 없으면 None
+    """
+    port = port.strip()
+    if port in ('', '*', 'any'):
+        return 0, PORT_MAX
+    try:
+        if '-' in port:
+            start_text, end_text = port.split('-', 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = end = int(port)
+    except ValueError:
+        return None
+    if not 0 <= start <= end <= PORT_MAX:
+        return None
+    return start, end
+
+
+@lru_cache(maxsize=65536)
+def parse_service_token(token: str) -> Optional[Tuple[str, int, int]]:
+    """
+    'PROTOCOL/PORT' 형식의 서비스 값을 (프로토콜, 시작, 끝)으로 변환합니다.
+
+    Args:
+        token: 예) 'TCP/80', 'UDP/1024-2048'
+
+    Returns:
+        (대문자 프로토콜, 시작 포트, 끝 포트), 형식이 다르면 None
+    """
+    if '/' not in token:
+        return None
+    protocol, port = token.split('/', 1)
+    protocol = protocol.strip().upper()
+    port_range = parse_port_range(port)
+    if not protocol or port_range is None:
+        return None
+    return (protocol,) + port_range
+
+
+class ServiceSet:
+    """
+    정책의 서비스를 프로토콜별 포트 구간 집합과 이름(application-default 등) 집합으로 표현합니다.
+    """
+
+    __slots__ = ('protocols', 'names')
+
+    def __init__(self, protocols: Dict[str, IntervalSet], names: FrozenSet[str] = frozenset()):
+        """
+        ServiceSet 초기화
+
+        Args:
+            protocols: {프로토콜: 포트 구간 집합} (ANY_PROTOCOL 키는 모든 프로토콜)
+            names: 포트로 해석되지 않는 서비스 값
+        """
+        self.protocols = protocols
+        self.names = names
+
+    @classmethod
+    def any(cls) -> 'ServiceSet':
+        """모든 서비스를 포함하는 집합을 반환합니다."""
+        return cls({ANY_PROTOCOL: IntervalSet.from_pairs([(0, PORT_MAX)])})
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[str]) -> 'ServiceSet':
+        """
+        서비스 값 목록으로 ServiceSet을 생성합니다.
+
+        Args:
+            tokens: 서비스 문자열 목록 (예: ['TCP/80', 'UDP/53'])
+
+        Returns:
+            ServiceSet
+        """
+        pairs: Dict[str, list] = {}
+        names = set()
+        for token in tokens:
+            token = str(token).strip()
+            if not token:
+                continue
+            if token.lower() in ANY_VALUES:
+                pairs.setdefault(ANY_PROTOCOL, []).append((0, PORT_MAX))
+                continue
+            parsed = parse_service_token(token)
+            if parsed is None:
+                names.add(token)
+            else:
+                pairs.setdefault(parsed[0], []).append(parsed[1:])
+        return cls({protocol: IntervalSet.from_pairs(ranges) for protocol, ranges in pairs.items()}, frozenset(names))
+
+    @classmethod
+    def parse(cls, value) -> 'ServiceSet':
+        """
+        콤마로 구분된 서비스 문자열로 ServiceSet을 생성합니다.
+
+        Args:
+            value: 예) 'TCP/80,TCP/443,UDP/1024-2048'
+
+        Returns:
+            ServiceSet
+        """
+        if value is None or (isinstance(value, float) and value != value):
+            return cls({})
+        return cls.from_tokens(str(value).split(','))
+
+    @classmethod
+    def union_all(cls, service_sets: Iterable['ServiceSet']) -> 'ServiceSet':
+        """
+        여러 서비스 집합의 합집합을 계산합니다. (프로토콜별로 한 번만 병합)
+
+        Args:
+            service_sets: 서비스 집합 목록
+
+        Returns:
+            합쳐진 서비스 집합
+        """
+        service_sets = list(service_sets)
+        if len(service_sets) == 1:
+            return service_sets[0]
+        ports: Dict[str, list] = {}
+        for service in service_sets:
+            for protocol, intervals in service.protocols.items():
+                ports.setdefault(protocol, []).append(intervals)
+        return cls({protocol: IntervalSet.union_all(intervals) for protocol, intervals in ports.items()},
+                   frozenset().union(*(service.names for service in service_sets)))
+
+    @property
+    def is_any(self) -> bool:
+        """모든 서비스를 포함하는지 여부"""
+        return ANY_PROTOCOL in self.protocols
+
+    def union(self, other: 'ServiceSet') -> 'ServiceSet':
+        """두 서비스 집합의 합집합을 반환합니다."""
+        protocols = dict(self.protocols)
+        for protocol, ports in other.protocols.items():
+            protocols[protocol] = protocols[protocol].union(ports) if protocol in protocols else ports
+        return ServiceSet(protocols, self.names | other.names)
+
+    def contains(self, other: 'ServiceSet') -> bool:
+        """
+        다른 서비스 집합이 이 집합에 완전히 포함되는지 검사합니다.
+
+        Args:
+            other: 검사할 서비스 집합
+
+        Returns:
+            포함 여부
+        """
+        if self.is_any:
+            return True
+        if other.is_any or not other.names <= self.names:
+            return False
+        return all(protocol in self.protocols and self.protocols[protocol].contains(ports)
+                   for protocol, ports in other.protocols.items())
+
+    def overlaps(self, other: 'ServiceSet') -> bool:
+        """두 서비스 집합이 하나 이상의 프로토콜/포트를 공유하는지 검사합니다."""
+        if self.is_empty() or other.is_empty():
+            return False
+        if self.is_any or other.is_any or self.names & other.names:
+            return True
+        return any(protocol in self.protocols and self.protocols[protocol].overlaps(ports)
+                   for protocol, ports in other.protocols.items())
+
+    def contains_port(self, protocol: str, port: int) -> bool:
+        """
+        프로토콜/포트 하나가 포함되는지 검사합니다.
+
+        Args:
+            protocol: 프로토콜 (예: 'tcp')
+            port: 포트 번호
+
+        Returns:
+            포함 여부
+        """
+        if self.is_any:
+            return True
+        ports = self.protocols.get(protocol.upper())
+        return ports is not None and ports.contains_point(port)
+
+    def is_empty(self) -> bool:
+        """서비스가 하나도 없는지 여부"""
+        return not self.protocols and not self.names
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ServiceSet):
+            return NotImplemented
+        return self.protocols == other.protocols and self.names == other.names
+
+    def __hash__(self) -> int:
+        return hash((tuple(sorted(self.protocols.items())), self.names))
+
+    def __repr__(self) -> str:
+        protocols = {protocol: list(ports) for protocol, ports in sorted(self.protocols.items())}
+        return f"ServiceSet({protocols}, names={sorted(self.names)})"
@@ -1,6 +1,7 @@
 # firewall/collector_factory.py
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .firewall_interface import FirewallInterface
+from .collector_pool import CollectorPool
 from .paloalto.paloalto_collector import PaloAltoCollector
 from .mf2.mf2_collector import MF2Collector
 from .ngf.ngf_collector import NGFCollector
@@ -15,12 +16,20 @@ class FirewallCollectorFactory:
         'mock': ['hostname', 'username', 'password']
     }
 
+    # (장비 ID, 배치 ID)별로 배치 동안 재사용하는 수집기 풀
+    _pool = CollectorPool()
+
     @staticmethod
-    def get_collector(source_type: str, **kwargs) -> FirewallInterface:
+    def get_collector(source_type: str, batch_id: Optional[str] = None, device_id: Optional[int] = None,
+                      **kwargs) -> FirewallInterface:
         """방화벽 타입에 따른 Collector 객체를 생성하여 반환합니다.
 
+        device_id와 batch_id가 모두 있으면 같은 배치의 모든 동기화 단계에 같은 Collector를 반환합니다.
+
         Args:
             source_type (str): 방화벽 타입 ('paloalto', 'mf2', 'ngf', 'mock' 중 하나)
+            batch_id (str, optional): 동기화 배치 ID (배치 단위 캐시 공유에 사용)
+            device_id (int, optional): 장비 ID (배치 단위 Collector 재사용에 사용)
             **kwargs: 방화벽 인증에 필요한 파라미터
             동일한 파라미터값으로 수정함
                 - hostname: 장비 호스트명
@@ -45,15 +54,39 @@ class FirewallCollectorFactory:
         if missing_params:
             raise ValueError(f"{source_type} 방화벽에 필요한 파라미터가 누락되었습니다: {', '.join(missing_params)}")
 
+        if device_id is not None and batch_id:
+            return FirewallCollectorFactory._pool.get(
+                device_id, batch_id,
+                lambda: FirewallCollectorFactory._create_collector(source_type, batch_id, kwargs)
+            )
+        return FirewallCollectorFactory._create_collector(source_type, batch_id, kwargs)
+
+    @staticmethod
+    def _create_collector(source_type: str, batch_id: Optional[str], kwargs: Dict[str, Any]) -> FirewallInterface:
+        """방화벽 타입에 맞는 Collector 객체를 새로 생성합니다."""
         # Collector 객체 생성 및 반환
         if source_type == 'paloalto':
-            return PaloAltoCollector(kwargs['hostname'], kwargs['username'], kwargs['password'])
+            return PaloAltoCollector(kwargs['hostname'], kwargs['username'], kwargs['password'], batch_id=batch_id)
         elif source_type == 'mf2':
-            return MF2Collector(kwargs['hostname'], kwargs['username'], kwargs['password'])
+            return MF2Collector(kwargs['hostname'], kwargs['username'], kwargs['password'], batch_id=batch_id)
         elif source_type == 'ngf':
-            return NGFCollector(kwargs['hostname'], kwargs['username'], kwargs['password'])
+            return NGFCollector(kwargs['hostname'], kwargs['username'], kwargs['password'], batch_id=batch_id)
         elif source_type == 'mock':
             return MockCollector(kwargs['hostname'], kwargs['username'], kwargs['password'])
         
         # 여기까지 오면 안되지만, 혹시 모르니 예외 처리
-        raise ValueError(f"알 수 없는 방화벽 모듈 타입: {source_type}")
\ No newline at end of file
+        raise ValueError(f"알 수 없는 방화벽 모듈 타입: {source_type}")
+
+    @staticmethod
+    def release_batch(batch_id: str) -> None:
+        """배치 동기화가 끝났을 때 배치 단위로 공유하던 자원(Collector, 설정 스냅샷, SSH 세션, 로그인 세션 등)을 해제합니다.
+
+        Args:
+            batch_id (str): 동기화 배치 ID
+        """
+        if not batch_id:
+            return
+        FirewallCollectorFactory._pool.release(batch_id)
+        PaloAltoCollector.release_batch(batch_id)
+        MF2Collector.release_batch(batch_id)
+        NGFCollector.release_batch(batch_id)
@@ -0,0 +1,91 @@
+# firewall/collector_pool.py
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Tuple
+
+from .firewall_interface import FirewallInterface
+
+# 풀에 보관할 최대 수집기 수 (초과 시 가장 오래 사용하지 않은 수집기부터 정리)
+DEFAULT_MAX_COLLECTORS = 64
+
+
+class CollectorPool:
+    """
+    (장비 ID, 배치 ID)별 수집기 인스턴스를 배치 동안 재사용하는 풀입니다.
+
+    같은 작업의 모든 동기화 유형이 하나의 수집기를 공유하므로 keygen, 로그인,
+    샘플 데이터 생성 등 수집기 생성 비용이 작업당 한 번만 발생합니다.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_COLLECTORS) -> None:
+        self.max_size = max_size
+        self._collectors: "OrderedDict[Tuple[Hashable, Hashable], FirewallInterface]" = OrderedDict()
+        self._key_locks: Dict[Tuple[Hashable, Hashable], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, device_id: Hashable, batch_id: Hashable,
+            factory: Callable[[], FirewallInterface]) -> FirewallInterface:
+        """
+        배치의 수집기를 반환합니다. 없으면 factory로 생성하여 보관합니다.
+
+        :param device_id: 장비 ID
+        :param batch_id: 동기화 배치 ID
+        :param factory: 수집기가 없을 때 호출할 생성 함수
+        :return: 수집기
+        """
+        key = (device_id, batch_id)
+        with self._lock:
+            collector = self._collectors.get(key)
+            if collector is not None:
+                self._collectors.move_to_end(key)
+                return collector
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # 같은 키의 동시 요청은 수집기를 한 번만 생성하도록 키 단위로 잠급니다.
+        with key_lock:
+            with self._lock:
+                collector = self._collectors.get(key)
+                if collector is not None:
+                    return collector
+
+            collector = factory()
+
+            with self._lock:
+                self._collectors[key] = collector
+                evicted = []
+                while len(self._collectors) > self.max_size:
+                    evicted_key, evicted_collector = self._collectors.popitem(last=False)
+                    self._key_locks.pop(evicted_key, None)
+                    evicted.append(evicted_collector)
+
+        self._close_all(evicted)
+        return collector
+
+    def release(self, batch_id: Hashable) -> int:
+        """
+        배치의 수집기를 풀에서 제거하고 정리합니다.
+
+        :param batch_id: 동기화 배치 ID
+        :return: 정리한 수집기 수
+        """
+        with self._lock:
+            keys = [key for key in self._collectors if key[1] == batch_id]
+            collectors = [self._collectors.pop(key) for key in keys]
+            for key in keys:
+                self._key_locks.pop(key, None)
+
+        self._close_all(collectors)
+        return len(collectors)
+
+    @staticmethod
+    def _close_all(collectors) -> None:
+        for collector in collectors:
+            try:
+                collector.close()
+            except Exception as e:
+                logging.error("수집기 정리 실패 (%s): %s", type(collector).__name__, e)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._collectors)
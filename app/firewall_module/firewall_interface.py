@@ -4,6 +4,12 @@ import pandas as pd
 from typing import Optional
 
 class FirewallInterface(ABC):
+    def close(self) -> None:
+        """수집기가 단독으로 사용하던 자원(연결 등)을 정리합니다.
+        배치 단위로 공유하는 자원은 release_batch에서 정리되므로 기본 구현은 아무것도 하지 않습니다.
+        """
+        pass
+
     @abstractmethod
     def get_system_info(self) -> pd.DataFrame:
         """시스템 정보를 DataFrame으로 반환합니다."""
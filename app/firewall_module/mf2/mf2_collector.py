@@ -1,85 +1,108 @@
 # firewall/mf2/mf2_collector.py
 import pandas as pd
+from contextlib import contextmanager
 from typing import Optional
 from ..firewall_interface import FirewallInterface
-from .mf2_module import show_system_info, export_security_rules, download_object_files, host_parsing, network_parsing, combine_mask_end, delete_files, export_address_objects, service_parsing
-import os
+from .mf2_module import read_system_info, rule_parsing, host_parsing, network_parsing, group_parsing, service_parsing, combine_mask_end, build_address_objects
+from .mf2_session import MF2Session, mf2_sessions
 
 class MF2Collector(FirewallInterface):
-    def __init__(self, hostname: str, username: str, password: str):
+    def __init__(self, hostname: str, username: str, password: str, batch_id: Optional[str] = None):
         self.device_ip = hostname
         self.username = username
         self.password = password
-        module_dir = os.path.dirname(os.path.abspath(__file__))
-        self.temp_dir = os.path.join(module_dir, 'temp')
-        os.makedirs(self.temp_dir, exist_ok=True)
+        self.batch_id = batch_id
+
+    @staticmethod
+    def release_batch(batch_id: str) -> int:
+        """배치 동기화가 끝나면 해당 배치의 SSH 세션을 닫고 내려받은 파일을 정리합니다."""
+        return mf2_sessions.release(batch_id)
+
+    @contextmanager
+    def _session(self):
+        """
+        배치 ID가 있으면 배치 단위로 공유하는 세션을, 없으면 호출 한 번에만 쓰는 세션을 반환합니다.
+        """
+        if self.batch_id:
+            yield mf2_sessions.get(self.device_ip, self.username, self.password, self.batch_id)
+            return
+
+        session = MF2Session(self.device_ip, self.username, self.password)
+        try:
+            yield session
+        finally:
+            session.close()
+
+    @staticmethod
+    def _parsed_conf(session: MF2Session, files: dict, conf_file: str, parser) -> pd.DataFrame:
+        """conf 파일 파싱 결과를 세션 캐시에서 가져옵니다. (호출 측 변경에 대비해 복사본 반환)"""
+        return session.parsed(conf_file, lambda: parser(files[conf_file])).copy()
 
     def get_system_info(self) -> pd.DataFrame:
-        # 기본 포트 22 사용
-        return show_system_info(self.device_ip, self.username, self.password)
+        with self._session() as session:
+            return session.run(lambda client: read_system_info(client, self.device_ip))
 
     def export_security_rules(self, **kwargs) -> pd.DataFrame:
-        return export_security_rules(self.device_ip, self.username, self.password)
+        with self._session() as session:
+            def load_rules():
+                rule_file = session.download_rule_file()
+                return rule_parsing(rule_file) if rule_file else pd.DataFrame()
+            return session.parsed('fwrules', load_rules).copy()
 
     def export_network_objects(self) -> pd.DataFrame:
         """네트워크 객체 정보를 PaloAlto 형식으로 변환하여 반환합니다."""
         conf_types = ['hostobject.conf', 'networkobject.conf']
-        files = download_object_files(self.device_ip, 22, self.username, self.password, '/secui/etc/', self.temp_dir, conf_types)
-        if len(files) < len(conf_types):
-            return pd.DataFrame(columns=['Name', 'Type', 'Value'])
-
-        host_file = os.path.join(self.temp_dir, f"{self.device_ip}_hostobject.conf")
-        network_file = os.path.join(self.temp_dir, f"{self.device_ip}_networkobject.conf")
-
-        # 호스트 객체 처리
-        host_df = host_parsing(host_file)
-        host_df = host_df[['name', 'ip']].rename(columns={'name': 'Name', 'ip': 'Value'})
-        host_df['Type'] = 'ip-netmask'
-
-        # 네트워크 객체 처리
-        network_df = network_parsing(network_file)
-        network_df['Value'] = network_df.apply(combine_mask_end, axis=1)
-        network_df = network_df[['name', 'Value']].rename(columns={'name': 'Name'})
-        network_df['Type'] = 'ip-netmask'
+        with self._session() as session:
+            files = session.download_conf_files(conf_types)
+            if len(files) < len(conf_types):
+                return pd.DataFrame(columns=['Name', 'Type', 'Value'])
+
+            # 호스트 객체 처리
+            host_df = self._parsed_conf(session, files, 'hostobject.conf', host_parsing)
+            host_df = host_df[['name', 'ip']].rename(columns={'name': 'Name', 'ip': 'Value'})
+            host_df['Type'] = 'ip-netmask'
+
+            # 네트워크 객체 처리
+            network_df = self._parsed_conf(session, files, 'networkobject.conf', network_parsing)
+            network_df['Value'] = network_df.apply(combine_mask_end, axis=1)
+            network_df = network_df[['name', 'Value']].rename(columns={'name': 'Name'})
+            network_df['Type'] = 'ip-netmask'
 
         # 결과 합치기
         result_df = pd.concat([host_df, network_df], ignore_index=True)
         # 'Value'에 '-'가 포함되어 있으면 ip-range, 그렇지 않으면 ip-netmask로 설정
         result_df['Type'] = result_df['Value'].apply(lambda v: 'ip-range' if '-' in str(v) else 'ip-netmask')
-
-        delete_files(files)
         return result_df
 
     def export_network_group_objects(self) -> pd.DataFrame:
         """네트워크 그룹 객체 정보를 PaloAlto 형식으로 변환하여 반환합니다."""
         conf_types = ['hostobject.conf', 'networkobject.conf', 'groupobject.conf']
-        files = download_object_files(self.device_ip, 22, self.username, self.password, '/secui/etc/', self.temp_dir, conf_types)
-        if len(files) < len(conf_types):
-            return pd.DataFrame(columns=['Group Name', 'Entry'])
-
-        group_file = os.path.join(self.temp_dir, f"{self.device_ip}_groupobject.conf")
-        host_file = os.path.join(self.temp_dir, f"{self.device_ip}_hostobject.conf")
-        network_file = os.path.join(self.temp_dir, f"{self.device_ip}_networkobject.conf")
-
-        address_df, group_df = export_address_objects(group_file, host_file, network_file)
-        delete_files(files)
+        with self._session() as session:
+            files = session.download_conf_files(conf_types)
+            if len(files) < len(conf_types):
+                return pd.DataFrame(columns=['Group Name', 'Entry'])
+
+            address_df, group_df = build_address_objects(
+                self._parsed_conf(session, files, 'groupobject.conf', group_parsing),
+                self._parsed_conf(session, files, 'hostobject.conf', host_parsing),
+                self._parsed_conf(session, files, 'networkobject.conf', network_parsing)
+            )
         return group_df[['Group Name', 'Entry']]
 
     def export_service_objects(self) -> pd.DataFrame:
         """서비스 객체 정보를 PaloAlto 형식으로 변환하여 반환합니다."""
         conf_types = ['serviceobject.conf']
-        files = download_object_files(self.device_ip, 22, self.username, self.password, '/secui/etc/', self.temp_dir, conf_types)
-        if len(files) < len(conf_types):
-            return pd.DataFrame(columns=['Name', 'Protocol', 'Port'])
+        with self._session() as session:
+            files = session.download_conf_files(conf_types)
+            if len(files) < len(conf_types):
+                return pd.DataFrame(columns=['Name', 'Protocol', 'Port'])
+
+            service_df = self._parsed_conf(session, files, 'serviceobject.conf', service_parsing)
 
-        service_file = os.path.join(self.temp_dir, f"{self.device_ip}_serviceobject.conf")
-        service_df = service_parsing(service_file)
         service_df = service_df[['name', 'protocol', 'str_svc_port']].rename(
             columns={'name': 'Name', 'protocol': 'Protocol', 'str_svc_port': 'Port'}
         )
         service_df['Protocol'] = service_df['Protocol'].apply(lambda x: x.lower() if isinstance(x, str) else x)
-        
-        delete_files(files)
         return service_df
 
     def export_service_group_objects(self) -> pd.DataFrame:
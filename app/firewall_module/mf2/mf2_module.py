@@ -3,6 +3,7 @@ import re
 import logging
 import paramiko
 from scp import SCPClient
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook
 from openpyxl.styles import PatternFill
@@ -66,6 +67,51 @@ SERVICE_PATTERN = {
     'description': r'd = "([^"]+)"',
 }
 
+RULE_PATTERN = {
+    'rid': r"\{rid=(.*?), ",
+    'description': r"description=\"(.*?)\", use=",
+    'use': r"use=\"(.*?)\", action",
+    'action': r"action=\"(.*?)\", group",
+    'shaping_string': r"shaping_string=\"(.*?)\", bi_di",
+    'from': r"from = \{(.*?)\},  to",
+    'to': r"to = \{(.*?)\},  service",
+    'service': r"service = \{(.*?)\},  vid",
+    'ua': r"ua = \{(.*?)\}, unuse",
+}
+
+
+class FieldExtractor:
+    """
+    필드별 정규식을 미리 컴파일해 두고, 블록에서 필드별 첫 번째 값을 추출합니다.
+
+    블록마다 패턴 문자열로 re.search/re.findall을 호출하면 매번 패턴 캐시 조회와
+    (findall의 경우) 블록 끝까지의 전체 탐색이 반복되므로, 컴파일된 패턴의 search로
+    필드별 첫 번째 일치만 찾습니다.
+    """
+
+    def __init__(self, patterns: dict):
+        self.fields = [(key, re.compile(pattern)) for key, pattern in patterns.items()]
+
+    def extract(self, text: str) -> dict:
+        """
+        :param text: 객체/규칙 블록 문자열
+        :return: {필드: 첫 번째 일치 값} (일치하지 않은 필드는 제외, 패턴 정의 순서 유지)
+        """
+        data = {}
+        for key, regex in self.fields:
+            match = regex.search(text)
+            if match:
+                data[key] = match.group(1)
+        return data
+
+
+HOST_EXTRACTOR = FieldExtractor(HOST_PATTERN)
+MASK_EXTRACTOR = FieldExtractor(MASK_PATTERN)
+RANGE_EXTRACTOR = FieldExtractor(RANGE_PATTERN)
+GROUP_EXTRACTOR = FieldExtractor(GROUP_PATTERN)
+SERVICE_EXTRACTOR = FieldExtractor(SERVICE_PATTERN)
+RULE_EXTRACTOR = FieldExtractor(RULE_PATTERN)
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 
@@ -193,43 +239,50 @@ def download_object_files(host: str, port: int, username: str, password: str,
         return downloaded_files
 
 
+def read_system_info(ssh: paramiko.SSHClient, host: str) -> pd.DataFrame:
+    """
+    연결된 SSH 세션으로 장비의 시스템 정보를 수집하여 DataFrame으로 반환합니다.
+    """
+    # hostname
+    _, stdout, _ = ssh.exec_command('hostname')
+    hostname = stdout.readline().strip()
+
+    # uptime (공백 기준 분할 후 4번째, 5번째 요소 사용)
+    _, stdout, _ = ssh.exec_command('uptime')
+    uptime_parts = stdout.readline().rstrip().split(' ')
+    uptime = f"{uptime_parts[3]} {uptime_parts[4].rstrip(',')}" if len(uptime_parts) >= 5 else ""
+
+    # SECUIMF2 정보
+    _, stdout, _ = ssh.exec_command(INFO_FILE)
+    info_lines = stdout.readlines()
+    # rpm version
+    _, stdout, _ = ssh.exec_command('rpm -q mf2')
+    version = stdout.readline().strip()
+
+    # info_lines 순서에 따라 모델, mac, serial 추출
+    model = info_lines[0].split('=')[1].strip() if len(info_lines) > 0 else ""
+    mac_address = info_lines[2].split('=')[1].strip() if len(info_lines) > 2 else ""
+    hw_serial = info_lines[3].split('=')[1].strip() if len(info_lines) > 3 else ""
+
+    data = {
+        "hostname": hostname,
+        "ip_address": host,
+        "mac_address": mac_address,
+        "uptime": uptime,
+        "model": model,
+        "serial_number": hw_serial,
+        "sw_version": version,
+    }
+    return pd.DataFrame(data, index=[0])
+
+
 def show_system_info(host: str, username: str, password: str) -> pd.DataFrame:
     """
     원격 장비의 시스템 정보를 수집하여 DataFrame으로 반환합니다.
     """
     ssh = create_ssh_client(host, 22, username, password)
     try:
-        # hostname
-        _, stdout, _ = ssh.exec_command('hostname')
-        hostname = stdout.readline().strip()
-
-        # uptime (공백 기준 분할 후 4번째, 5번째 요소 사용)
-        _, stdout, _ = ssh.exec_command('uptime')
-        uptime_parts = stdout.readline().rstrip().split(' ')
-        uptime = f"{uptime_parts[3]} {uptime_parts[4].rstrip(',')}" if len(uptime_parts) >= 5 else ""
-
-        # SECUIMF2 정보
-        _, stdout, _ = ssh.exec_command(INFO_FILE)
-        info_lines = stdout.readlines()
-        # rpm version
-        _, stdout, _ = ssh.exec_command('rpm -q mf2')
-        version = stdout.readline().strip()
-
-        # info_lines 순서에 따라 모델, mac, serial 추출
-        model = info_lines[0].split('=')[1].strip() if len(info_lines) > 0 else ""
-        mac_address = info_lines[2].split('=')[1].strip() if len(info_lines) > 2 else ""
-        hw_serial = info_lines[3].split('=')[1].strip() if len(info_lines) > 3 else ""
-
-        data = {
-            "hostname": hostname,
-            "ip_address": host,
-            "mac_address": mac_address,
-            "uptime": uptime,
-            "model": model,
-            "serial_number": hw_serial,
-            "sw_version": version,
-        }
-        return pd.DataFrame(data, index=[0])
+        return read_system_info(ssh, host)
     except Exception as e:
         logging.error("show_system_info error: %s", e)
     finally:
@@ -258,59 +311,164 @@ def remove_newlines_from_file(file_path: str) -> str:
     """
     파일 내용을 읽어와 모든 개행문자를 제거한 문자열을 반환합니다.
     """
+    content = read_text_file(file_path)
+    return content.replace('\n', '')
+
+
+def read_text_file(file_path: str) -> str:
+    """
+    파일 내용을 그대로 읽어 반환합니다. (개행 제거는 블록 추출 시 블록 단위로 수행)
+    """
     try:
         with open(file_path, 'r', encoding='utf-8-sig') as file:
-            content = file.read()
-        return content.replace('\n', '')
+            return file.read()
     except Exception as e:
-        logging.error("remove_newlines_from_file error: %s", e)
+        logging.error("read_text_file error: %s", e)
         return f"error: {e}"
 
 
-def extract_braces_of_depth_1_or_more(content: str) -> list:
+BRACE_PATTERN = re.compile(r'[{}]')
+OPEN_BRACE, CLOSE_BRACE = ord('{'), ord('}')
+
+
+def _brace_depths(content: str) -> tuple:
+    """
+    모든 중괄호의 위치와 중괄호 직후 깊이를 한 번에(벡터 연산으로) 계산합니다.
+
+    :return: (중괄호 위치 배열, 중괄호 직전 깊이 배열, 중괄호 직후 깊이 배열, 여는 중괄호 여부 배열)
+    """
+    codes = np.frombuffer(content.encode('utf-32-le'), dtype=np.uint32)
+    positions = np.flatnonzero((codes == OPEN_BRACE) | (codes == CLOSE_BRACE))
+    is_open = codes[positions] == OPEN_BRACE
+    deltas = np.where(is_open, 1, -1)
+    depth_after = np.cumsum(deltas)
+    return positions, depth_after - deltas, depth_after, is_open
+
+
+def _finish_block(block: str, remove_newlines: bool) -> str:
+    """블록에서 (필요 시) 개행을 제거하고 앞뒤 공백을 정리합니다."""
+    if remove_newlines:
+        block = block.replace('\n', '')
+    return block.strip()
+
+
+def _join_spans(content: str, spans: list) -> str:
+    """
+    원본 문자열의 구간 목록을 이어 붙입니다.
+    """
+    if len(spans) == 1:
+        start, end = spans[0]
+        return content[start:end]
+    return ''.join(content[start:end] for start, end in spans)
+
+
+def _append_span(spans: list, start: int, end: int) -> None:
+    """
+    구간을 추가합니다. 직전 구간과 이어지면 합칩니다.
+    """
+    if start >= end:
+        return
+    if spans and spans[-1][1] == start:
+        spans[-1][1] = end
+    else:
+        spans.append([start, end])
+
+
+def extract_braces_of_depth_1_or_more(content: str, remove_newlines: bool = False) -> list:
     """
     중괄호({})로 둘러싸인 블록 중 깊이가 1 이상인 내용들을 리스트로 반환합니다.
+
+    중괄호 위치와 깊이를 한 번에 계산한 뒤 원본 문자열에서 블록 구간을 잘라내므로
+    문자를 하나씩 이어 붙이지 않고 입력 크기에 선형으로 동작합니다.
+    remove_newlines가 True이면 각 블록에서 개행문자를 제거합니다.
+    """
+    positions, depth_before, depth_after, is_open = _brace_depths(content)
+    if len(depth_after) and depth_after.min() < 0:
+        # 닫는 중괄호가 더 많은 비정상 입력은 구간 기록 방식으로 처리
+        return _extract_depth_1_spans(content, remove_newlines)
+
+    starts = positions[is_open & (depth_before == 0)]
+    ends = positions[~is_open & (depth_after == 0)]
+    return [
+        _finish_block(content[start:end + 1], remove_newlines)
+        for start, end in zip(starts.tolist(), ends.tolist())
+    ]
+
+
+def _extract_depth_1_spans(content: str, remove_newlines: bool) -> list:
+    """
+    extract_braces_of_depth_1_or_more의 일반 구현 (깊이가 음수가 되는 입력용)
     """
     depth = 0
     results = []
-    temp = ""
-    for char in content:
-        if char == '{':
+    spans = []
+    position = 0
+    for match in BRACE_PATTERN.finditer(content):
+        index = match.start()
+        # 직전 중괄호와 현재 중괄호 사이의 문자는 깊이 1 이상일 때만 포함
+        if depth >= 1:
+            _append_span(spans, position, index)
+        position = index + 1
+
+        if match.group() == '{':
             if depth == 0:
-                temp = ""
-            temp += char
+                spans = []
+            _append_span(spans, index, index + 1)
             depth += 1
-        elif char == '}':
-            temp += char
+        else:
+            _append_span(spans, index, index + 1)
             depth -= 1
             if depth == 0:
-                results.append(temp.strip())
-        elif depth >= 1:
-            temp += char
+                results.append(_finish_block(_join_spans(content, spans), remove_newlines))
     return results
 
 
-def extract_braces_of_depth_2_or_more_without_outer_braces(content: str) -> list:
+def extract_braces_of_depth_2_or_more_without_outer_braces(content: str, remove_newlines: bool = False) -> list:
     """
     중괄호 블록 중 깊이가 2 이상인 부분만 추출하여 외부 중괄호는 제거한 내용을 리스트로 반환합니다.
+
+    extract_braces_of_depth_1_or_more와 같은 방식으로 선형 시간에 동작합니다.
+    remove_newlines가 True이면 각 블록에서 개행문자를 제거합니다.
+    """
+    positions, depth_before, depth_after, is_open = _brace_depths(content)
+    if len(depth_after) and depth_after.min() < 0:
+        # 닫는 중괄호가 더 많은 비정상 입력은 구간 기록 방식으로 처리
+        return _extract_depth_2_spans(content, remove_newlines)
+
+    starts = positions[is_open & (depth_before == 1)]
+    ends = positions[~is_open & (depth_after == 1)]
+    return [
+        _finish_block(content[start + 1:end], remove_newlines)
+        for start, end in zip(starts.tolist(), ends.tolist())
+    ]
+
+
+def _extract_depth_2_spans(content: str, remove_newlines: bool) -> list:
+    """
+    extract_braces_of_depth_2_or_more_without_outer_braces의 일반 구현 (깊이가 음수가 되는 입력용)
     """
     depth = 0
     results = []
-    temp = ""
-    for char in content:
-        if char == '{':
+    spans = []
+    position = 0
+    for match in BRACE_PATTERN.finditer(content):
+        index = match.start()
+        # 직전 중괄호와 현재 중괄호 사이의 문자는 깊이 2 이상일 때만 포함
+        if depth >= 2:
+            _append_span(spans, position, index)
+        position = index + 1
+
+        if match.group() == '{':
             if depth >= 1:
-                temp += char
+                _append_span(spans, index, index + 1)
             depth += 1
-        elif char == '}':
+        else:
             depth -= 1
             if depth >= 1:
-                temp += char
+                _append_span(spans, index, index + 1)
                 if depth == 1:
-                    results.append(temp[1:-1].strip())
-                    temp = ""
-        elif depth >= 2:
-            temp += char
+                    results.append(_finish_block(_join_spans(content, spans)[1:-1], remove_newlines))
+                    spans = []
     return results
 
 
@@ -338,36 +496,32 @@ def group_parsing(file_path: str) -> pd.DataFrame:
     """
     그룹 객체 파일을 파싱하여 DataFrame으로 반환합니다.
     """
-    content = remove_newlines_from_file(file_path)
-    depth_braces = extract_braces_of_depth_2_or_more_without_outer_braces(content)
+    content = read_text_file(file_path)
+    depth_braces = extract_braces_of_depth_2_or_more_without_outer_braces(content, remove_newlines=True)
     if depth_braces:
         depth_braces.pop(0)  # id 정보 삭제
 
     data_list = []
     for text in depth_braces:
-        data = {}
-        for key, pattern in GROUP_PATTERN.items():
-            match = re.search(pattern, text)
-            if match:
-                if key in ['hosts', 'networks']:
-                    items = []
-                    obj_str = match.group(1)
-                    if obj_str:
-                        for item in obj_str.split(','):
-                            # item 형식: key=value 또는 [key]
-                            items.append(item.split('=')[0].replace('[', '').replace(']', ''))
-                    data[key] = ','.join(items)
-                elif key == 'count':
-                    items = []
-                    obj_str = match.group(1)
-                    if obj_str:
-                        for item in obj_str.split(','):
-                            parts = item.split('=')
-                            if len(parts) > 1:
-                                items.append(parts[1])
-                    data[key] = ','.join(items)
-                else:
-                    data[key] = match.group(1)
+        data = GROUP_EXTRACTOR.extract(text)
+        for key in ['hosts', 'networks']:
+            if key in data:
+                items = []
+                obj_str = data[key]
+                if obj_str:
+                    for item in obj_str.split(','):
+                        # item 형식: key=value 또는 [key]
+                        items.append(item.split('=')[0].replace('[', '').replace(']', ''))
+                data[key] = ','.join(items)
+        if 'count' in data:
+            items = []
+            obj_str = data['count']
+            if obj_str:
+                for item in obj_str.split(','):
+                    parts = item.split('=')
+                    if len(parts) > 1:
+                        items.append(parts[1])
+            data['count'] = ','.join(items)
         data_list.append(data)
     return pd.DataFrame(data_list)
 
@@ -376,8 +530,8 @@ def service_parsing(file_path: str) -> pd.DataFrame:
     """
     서비스 객체 파일을 파싱하여 DataFrame으로 반환합니다.
     """
-    content = remove_newlines_from_file(file_path)
-    depth_braces = extract_braces_of_depth_2_or_more_without_outer_braces(content)
+    content = read_text_file(file_path)
+    depth_braces = extract_braces_of_depth_2_or_more_without_outer_braces(content, remove_newlines=True)
     if depth_braces:
         # 첫 두 항목(id 등) 삭제
         depth_braces.pop(0)
@@ -385,13 +539,7 @@ def service_parsing(file_path: str) -> pd.DataFrame:
         depth_braces.pop(0)
 
     data_list = []
-    for text in depth_braces:
-        data = {}
-        for key, pattern in SERVICE_PATTERN.items():
-            match = re.search(pattern, text)
-            if match:
-                data[key] = match.group(1)
-        data_list.append(data)
+    data_list = [SERVICE_EXTRACTOR.extract(text) for text in depth_braces]
     return pd.DataFrame(data_list)
 
 
@@ -400,19 +548,14 @@ def network_parsing(file_path: str) -> pd.DataFrame:
     네트워크 객체 파일을 파싱하여 DataFrame으로 반환합니다.
     range 문자열 포함 여부에 따라 RANGE_PATTERN 또는 MASK_PATTERN을 사용합니다.
     """
-    content = remove_newlines_from_file(file_path)
-    depth_braces = extract_braces_of_depth_2_or_more_without_outer_braces(content)
+    content = read_text_file(file_path)
+    depth_braces = extract_braces_of_depth_2_or_more_without_outer_braces(content, remove_newlines=True)
     if depth_braces:
         depth_braces.pop(0)
-    data_list = []
-    for text in depth_braces:
-        data = {}
-        pattern = RANGE_PATTERN if "range" in text else MASK_PATTERN
-        for key, pat in pattern.items():
-            match = re.search(pat, text)
-            if match:
-                data[key] = match.group(1)
-        data_list.append(data)
+    data_list = [
+        (RANGE_EXTRACTOR if "range" in text else MASK_EXTRACTOR).extract(text)
+        for text in depth_braces
+    ]
     return pd.DataFrame(data_list)
 
 
@@ -420,18 +563,11 @@ def host_parsing(file_path: str) -> pd.DataFrame:
     """
     호스트 객체 파일을 파싱하여 DataFrame으로 반환합니다.
     """
-    content = remove_newlines_from_file(file_path)
-    depth_braces = extract_braces_of_depth_2_or_more_without_outer_braces(content)
+    content = read_text_file(file_path)
+    depth_braces = extract_braces_of_depth_2_or_more_without_outer_braces(content, remove_newlines=True)
     if depth_braces:
         depth_braces.pop(0)
-    data_list = []
-    for text in depth_braces:
-        data = {}
-        for key, pattern in HOST_PATTERN.items():
-            match = re.search(pattern, text)
-            if match:
-                data[key] = match.group(1)
-        data_list.append(data)
+    data_list = [HOST_EXTRACTOR.extract(text) for text in depth_braces]
     return pd.DataFrame(data_list)
 
 
@@ -439,49 +575,35 @@ def rule_parsing(file_path: str) -> pd.DataFrame:
     """
     규칙(rule) 파일을 파싱하여 DataFrame으로 반환합니다.
     """
-    content = remove_newlines_from_file(file_path)
-    depth_braces = extract_braces_of_depth_2_or_more_without_outer_braces(content)
+    content = read_text_file(file_path)
+    depth_braces = extract_braces_of_depth_2_or_more_without_outer_braces(content, remove_newlines=True)
     if not depth_braces:
         return pd.DataFrame()
     rule_blocks = extract_braces_of_depth_1_or_more(depth_braces[0])
 
-    # 정규표현식 패턴들
-    rule_pattern = r"\{rid=(.*?), "
-    description_pattern = r"description=\"(.*?)\", use="
-    use_pattern = r"use=\"(.*?)\", action"
-    action_pattern = r"action=\"(.*?)\", group"
-    shaping_pattern = r"shaping_string=\"(.*?)\", bi_di"
-    source_pattern = r"from = \{(.*?)\},  to"
-    destination_pattern = r"to = \{(.*?)\},  service"
-    service_pattern = r"service = \{(.*?)\},  vid"
-    ua_pattern = r"ua = \{(.*?)\}, unuse"
-
     policies = []
     for idx, block in enumerate(rule_blocks):
-        rulename = re.findall(rule_pattern, block)
-        description = re.findall(description_pattern, block)
-        use = re.findall(use_pattern, block)
-        action = re.findall(action_pattern, block)
-        shaping_string = re.findall(shaping_pattern, block)
-        shaping_string = shaping_string[0] if shaping_string else ""
+        fields = RULE_EXTRACTOR.extract(block)
+        shaping_string = fields.get('shaping_string', "")
         schedule = shaping_string.split('=')[1].lstrip('"') if "time=" in shaping_string else ''
-        source = re.findall(source_pattern, block)
-        destination = re.findall(destination_pattern, block)
-        service = re.findall(service_pattern, block)
-        ua = re.findall(ua_pattern, block)
+        rulename = fields.get('rid')
+        source = fields.get('from')
+        destination = fields.get('to')
+        service = fields.get('service')
+        ua = fields.get('ua')
 
         policy = {
             "Seq": idx + 1,
-            "Rule Name": int(rulename[0]) if rulename else None,
-            "Enable": use[0] if use else "",
-            "Action": action[0] if action else "",
-            "Source": parse_object(source[0]) if source else "",
-            "User": parse_object(ua[0]) if ua else "",
-            "Destination": parse_object(destination[0]) if destination else "",
-            "Service": parse_object(service[0]) if service else "",
+            "Rule Name": int(rulename) if rulename is not None else None,
+            "Enable": fields.get('use', ""),
+            "Action": fields.get('action', ""),
+            "Source": parse_object(source) if source is not None else "",
+            "User": parse_object(ua) if ua is not None else "",
+            "Destination": parse_object(destination) if destination is not None else "",
+            "Service": parse_object(service) if service is not None else "",
             "Application": "Any",
             "Security Profile": schedule,
-            "Description": description[0] if description else "",
+            "Description": fields.get('description', ""),
         }
         policies.append(policy)
 
@@ -525,9 +647,17 @@ def export_address_objects(group_file: str, host_file: str, network_file: str) -
     그룹, 호스트, 네트워크 객체 파일을 파싱하여
     네트워크 객체(DataFrame)와 그룹 객체(DataFrame)를 반환합니다.
     """
-    group_df = group_parsing(group_file)
-    network_df = network_parsing(network_file)
-    host_df = host_parsing(host_file)
+    return build_address_objects(group_parsing(group_file), host_parsing(host_file), network_parsing(network_file))
+
+
+def build_address_objects(group_df: pd.DataFrame, host_df: pd.DataFrame, network_df: pd.DataFrame) -> tuple:
+    """
+    파싱된 그룹, 호스트, 네트워크 객체 DataFrame으로
+    네트워크 객체(DataFrame)와 그룹 객체(DataFrame)를 만듭니다. 입력 DataFrame은 변경하지 않습니다.
+    """
+    group_df = group_df.copy()
+    network_df = network_df.copy()
+    host_df = host_df.copy()
 
     if not network_df.empty:
         network_df['Value'] = network_df.apply(combine_mask_end, axis=1)
@@ -0,0 +1,211 @@
+# firewall/mf2/mf2_session.py
+import os
+import shutil
+import logging
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import paramiko
+from scp import SCPClient
+
+from .mf2_module import create_ssh_client, exec_remote_command, POLICY_DIRECTORY, CONF_DIRECTORY
+
+# MF2 설정 파일 원격 디렉토리
+REMOTE_DIRECTORY = '/secui/etc/'
+
+
+class MF2Session:
+    """
+    MF2 장비 하나에 대한 동기화 배치 단위 SSH/SCP 세션입니다.
+
+    인증된 SSH 연결 하나를 배치 동안 재사용하고, 같은 .conf/.fwrules 파일은 한 번만
+    내려받으며, 파싱 결과도 메모리에 보관합니다. close() 시 연결과 임시 파일을 정리합니다.
+    """
+
+    def __init__(self, host: str, username: str, password: str, port: int = 22,
+                 remote_directory: str = REMOTE_DIRECTORY) -> None:
+        self.host = host
+        self.username = username
+        self.password = password
+        self.port = port
+        self.remote_directory = remote_directory
+        self.local_directory = tempfile.mkdtemp(prefix=f'mf2_{host}_')
+        self.connect_count = 0
+        self._client: Optional[paramiko.SSHClient] = None
+        self._conf_listing: Optional[List[str]] = None
+        self._downloads: Dict[str, str] = {}
+        self._parsed: Dict[Hashable, Any] = {}
+        self._lock = threading.RLock()
+        self._closed = False
+
+    # ────────────── SSH ──────────────
+
+    def _open_client(self) -> paramiko.SSHClient:
+        """새 SSH 연결을 생성합니다."""
+        return create_ssh_client(self.host, self.port, self.username, self.password)
+
+    def get_client(self) -> paramiko.SSHClient:
+        """
+        인증된 SSH 연결을 반환합니다. 연결이 없거나 끊어진 경우에만 다시 연결합니다.
+
+        :return: paramiko SSHClient
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"이미 종료된 MF2 세션입니다: {self.host}")
+            transport = self._client.get_transport() if self._client else None
+            if transport is None or not transport.is_active():
+                if self._client:
+                    self._client.close()
+                self._client = self._open_client()
+                self.connect_count += 1
+            return self._client
+
+    def exec_command(self, command: str, remote_directory: Optional[str] = None) -> List[str]:
+        """
+        원격 명령어를 실행하고 표준 출력 줄 목록을 반환합니다.
+
+        :param command: 실행할 명령어
+        :param remote_directory: 명령 실행 전 이동할 원격 디렉토리
+        :return: 표준 출력 줄 목록
+        """
+        with self._lock:
+            _, stdout, _ = exec_remote_command(self.get_client(), command, remote_directory)
+            return stdout.readlines()
+
+    def run(self, func: Callable[[paramiko.SSHClient], Any]) -> Any:
+        """
+        세션 잠금을 잡은 상태에서 SSH 연결로 func를 실행합니다.
+
+        :param func: SSHClient를 인자로 받는 함수
+        :return: func 반환값
+        """
+        with self._lock:
+            return func(self.get_client())
+
+    def _scp_get(self, remote_path: str, local_path: str) -> None:
+        """SCP로 원격 파일을 내려받습니다."""
+        with SCPClient(self.get_client().get_transport()) as scp:
+            scp.get(remote_path, local_path)
+
+    # ────────────── FILE DOWNLOAD ──────────────
+
+    def download(self, file_name: str) -> str:
+        """
+        원격 파일을 배치당 한 번만 내려받고 로컬 경로를 반환합니다.
+
+        :param file_name: 원격 디렉토리 기준 파일명
+        :return: 로컬 파일 경로
+        """
+        with self._lock:
+            if file_name not in self._downloads:
+                local_path = os.path.join(self.local_directory, f"{self.host}_{file_name}")
+                self._scp_get(os.path.join(self.remote_directory, file_name), local_path)
+                self._downloads[file_name] = local_path
+            return self._downloads[file_name]
+
+    def download_conf_files(self, conf_types: List[str]) -> Dict[str, str]:
+        """
+        장비에 있는 conf 파일 중 요청한 파일을 내려받습니다. (목록 조회도 배치당 1회)
+
+        :param conf_types: 내려받을 conf 파일명 목록
+        :return: {conf 파일명: 로컬 경로} (장비에 없는 파일은 제외)
+        """
+        with self._lock:
+            if self._conf_listing is None:
+                self._conf_listing = [line.strip() for line in self.exec_command(CONF_DIRECTORY, self.remote_directory)]
+            return {
+                conf_file: self.download(conf_file)
+                for conf_file in conf_types if conf_file in self._conf_listing
+            }
+
+    def download_rule_file(self) -> Optional[str]:
+        """
+        최신 fwrules 파일을 내려받습니다.
+
+        :return: 로컬 경로 (규칙 파일이 없으면 None)
+        """
+        with self._lock:
+            lines = self.exec_command(POLICY_DIRECTORY, self.remote_directory)
+            if not lines:
+                return None
+            return self.download(lines[0].split()[-1])
+
+    # ────────────── PARSE CACHE ──────────────
+
+    def parsed(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        파싱 결과를 배치 동안 캐시합니다.
+
+        :param key: 캐시 키 (예: 'hostobject.conf')
+        :param loader: 캐시가 없을 때 호출할 파싱 함수
+        :return: 파싱 결과
+        """
+        with self._lock:
+            if key not in self._parsed:
+                self._parsed[key] = loader()
+            return self._parsed[key]
+
+    def close(self) -> None:
+        """SSH 연결을 닫고 내려받은 임시 파일을 삭제합니다."""
+        with self._lock:
+            self._closed = True
+            if self._client:
+                self._client.close()
+                self._client = None
+            self._downloads.clear()
+            self._parsed.clear()
+            shutil.rmtree(self.local_directory, ignore_errors=True)
+
+
+class MF2SessionRegistry:
+    """(호스트, 배치 ID)별 MF2Session을 관리하는 레지스트리입니다."""
+
+    def __init__(self) -> None:
+        self._sessions: Dict[Tuple[str, Hashable], MF2Session] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str, username: str, password: str, batch_id: Hashable) -> MF2Session:
+        """
+        배치의 세션을 반환합니다. 없으면 새로 생성합니다.
+
+        :param host: 장비 IP
+        :param username: 접속 계정
+        :param password: 접속 비밀번호
+        :param batch_id: 동기화 배치 ID
+        :return: MF2Session
+        """
+        key = (host, batch_id)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = MF2Session(host, username, password)
+                self._sessions[key] = session
+            return session
+
+    def release(self, batch_id: Hashable) -> int:
+        """
+        배치의 세션을 모두 닫습니다.
+
+        :param batch_id: 동기화 배치 ID
+        :return: 닫은 세션 수
+        """
+        with self._lock:
+            keys = [key for key in self._sessions if key[1] == batch_id]
+            sessions = [self._sessions.pop(key) for key in keys]
+
+        for session in sessions:
+            try:
+                session.close()
+            except Exception as e:
+                logging.error("MF2 세션 종료 실패 (%s): %s", session.host, e)
+        return len(sessions)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+
+# 모듈 전역 세션 레지스트리 (모든 MF2Collector 인스턴스가 공유)
+mf2_sessions = MF2SessionRegistry()
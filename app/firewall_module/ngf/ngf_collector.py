@@ -4,10 +4,26 @@ from typing import Optional
 from datetime import datetime, timedelta
 from ..firewall_interface import FirewallInterface
 from .ngf_module import NGFClient
+from .ngf_session import ngf_clients
 
 class NGFCollector(FirewallInterface):
-    def __init__(self, hostname: str, ext_clnt_id: str, ext_clnt_secret: str):
-        self.client = NGFClient(hostname, ext_clnt_id, ext_clnt_secret)
+    def __init__(self, hostname: str, ext_clnt_id: str, ext_clnt_secret: str, batch_id: Optional[str] = None):
+        self.batch_id = batch_id
+        if batch_id:
+            # 같은 배치의 수집기는 로그인 세션을 공유합니다.
+            self.client = ngf_clients.get(hostname, ext_clnt_id, ext_clnt_secret, batch_id)
+        else:
+            self.client = NGFClient(hostname, ext_clnt_id, ext_clnt_secret)
+
+    @staticmethod
+    def release_batch(batch_id: str) -> int:
+        """배치 동기화가 끝나면 해당 배치의 NGF 세션을 로그아웃합니다."""
+        return ngf_clients.release(batch_id)
+
+    def close(self) -> None:
+        """배치 없이 생성한 클라이언트의 HTTP 연결을 닫습니다. (배치 클라이언트는 release_batch에서 정리)"""
+        if not self.batch_id:
+            self.client.close()
 
     def get_system_info(self) -> pd.DataFrame:
         """시스템 정보를 반환합니다."""
@@ -20,8 +36,13 @@ class NGFCollector(FirewallInterface):
 
     def export_network_objects(self) -> pd.DataFrame:
         """네트워크 객체 정보를 PaloAlto 형식으로 변환하여 반환합니다."""
+        # 호스트/네트워크/도메인 객체를 한 번의 로그인으로 조회
+        with self.client.session():
+            host_df = self.client.export_objects('host', use_session=False)
+            network_df = self.client.export_objects('network', use_session=False)
+            domain_df = self.client.export_objects('domain', use_session=False)
+
         # 호스트 객체
-        host_df = self.client.export_objects('host')
         if not host_df.empty:
             host_df = host_df[['name', 'ip_list']].rename(columns={'name': 'Name', 'ip_list': 'Value'})
             host_df['Type'] = 'ip-netmask'
@@ -29,7 +50,6 @@ class NGFCollector(FirewallInterface):
             host_df = pd.DataFrame(columns=['Name', 'Type', 'Value'])
 
         # 네트워크 객체
-        network_df = self.client.export_objects('network')
         if not network_df.empty:
             network_df = network_df[['name', 'ip_list_ip_info1', 'ip_list_ip_info2']].rename(columns={'name': 'Name', 'ip_list_ip_info1': 'ip1', 'ip_list_ip_info2': 'ip2'})
             network_df['Value'] = network_df.apply(
@@ -42,7 +62,6 @@ class NGFCollector(FirewallInterface):
             network_df = pd.DataFrame(columns=['Name', 'Type', 'Value'])
 
         # 도메인 객체
-        domain_df = self.client.export_objects('domain')
         if not domain_df.empty:
             domain_df = domain_df[['name', 'dmn_name']].rename(columns={'name': 'Name', 'dmn_name': 'Value'})
             domain_df['Type'] = 'fqdn'
@@ -1,8 +1,11 @@
 import json
 import logging
+import threading
 import requests
 import pandas as pd
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
 # SSL 경고 비활성화
 requests.packages.urllib3.disable_warnings()
@@ -10,32 +13,75 @@ requests.packages.urllib3.disable_warnings()
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s')
 
+# 서비스 그룹 상세 정보를 동시에 조회할 최대 요청 수 (연결 풀 크기와 같음)
+DEFAULT_MAX_WORKERS = 8
+
 
 class NGFClient:
     """
     NGF API와 연동하여 로그인, 데이터 조회, 규칙 파싱 등의 기능을 제공하는 클라이언트입니다.
     """
 
-    def __init__(self, hostname: str, username: str, password: str, timeout: int = 60):
+    def __init__(self, hostname: str, username: str, password: str, timeout: int = 60,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
         self.hostname = hostname
         self.ext_clnt_id = username
         self.ext_clnt_secret = password
         self.timeout = timeout
+        self.max_workers = max(1, int(max_workers))
         self.token = None
+        self.http = self._create_http_session()
+        self._lock = threading.RLock()
+        self._session_depth = 0
         self.user_agent = (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
             "AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/54.0.2840.99 Safari/537.6"
         )
 
+    def _create_http_session(self) -> requests.Session:
+        """
+        keep-alive 연결을 재사용하는 HTTP 세션을 생성합니다.
+        동시 요청 수만큼 연결 풀을 잡아 요청마다 TLS 핸드셰이크가 반복되지 않도록 합니다.
+        """
+        http = requests.Session()
+        http.verify = False
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        http.mount('https://', adapter)
+        return http
+
+    def close(self) -> None:
+        """HTTP 연결 풀을 닫습니다."""
+        self.http.close()
+
+    def acquire(self) -> None:
+        """
+        로그인 세션 사용을 시작합니다. 사용 중인 곳이 남아 있으면 로그아웃하지 않습니다.
+        """
+        with self._lock:
+            self._session_depth += 1
+
+    def release(self) -> None:
+        """
+        로그인 세션 사용을 마칩니다. 마지막 사용자가 끝나면 로그아웃합니다.
+        """
+        with self._lock:
+            self._session_depth = max(0, self._session_depth - 1)
+            if self._session_depth == 0:
+                self.logout()
+
     @contextmanager
     def session(self):
-        """세션 컨텍스트 매니저"""
+        """
+        세션 컨텍스트 매니저
+        중첩되거나 배치 단위로 세션을 잡고 있는 경우 로그인/로그아웃은 한 번만 수행됩니다.
+        """
+        self.acquire()
         try:
             self.login()
             yield
         finally:
-            self.logout()
+            self.release()
 
     def _get_headers(self, token: str = None) -> dict:
         headers = {
@@ -49,9 +95,13 @@ class NGFClient:
 
     def login(self) -> str:
         """NGF에 로그인"""
-        if self.token:  # 이미 로그인된 경우
-            return self.token
-        
+        with self._lock:
+            if self.token:  # 이미 로그인된 경우
+                return self.token
+            return self._login()
+
+    def _login(self) -> str:
+        """로그인 요청을 보냅니다. (잠금은 호출 측에서 잡습니다)"""
         url = f"https://{self.hostname}/api/au/external/login"
         data = {
             "ext_clnt_id": self.ext_clnt_id,
@@ -60,11 +110,10 @@ class NGFClient:
             "force": 1
         }
         try:
-            response = requests.post(
+            response = self.http.post(
                 url,
                 headers=self._get_headers(),
                 data=json.dumps(data),
-                verify=False,
                 timeout=3
             )
             if response.status_code == 200:
@@ -80,15 +129,18 @@ class NGFClient:
 
     def logout(self) -> bool:
         """NGF에서 로그아웃"""
-        if not self.token:
-            return True
+        with self._lock:
+            if not self.token:
+                return True
+            return self._logout()
 
+    def _logout(self) -> bool:
+        """로그아웃 요청을 보냅니다. (잠금은 호출 측에서 잡습니다)"""
         url = f"https://{self.hostname}/api/au/external/logout"
         try:
-            response = requests.delete(
+            response = self.http.delete(
                 url,
                 headers=self._get_headers(token=self.token),
-                verify=False,
                 timeout=3
             )
             if response.status_code == 200:
@@ -102,18 +154,36 @@ class NGFClient:
             logging.error("Exception during logout: %s", e)
             return False
 
+    def _refresh_token(self, expired_token: str) -> bool:
+        """
+        만료된 토큰으로 다시 로그인합니다.
+        다른 스레드가 이미 갱신한 경우에는 새 토큰을 그대로 사용합니다.
+        """
+        with self._lock:
+            if self.token == expired_token:
+                logging.info("NGF 토큰 만료, 재로그인합니다.")
+                self.token = None
+            return self.login() is not None
+
+    def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        인증 토큰을 붙여 요청을 보냅니다. 토큰이 만료(401)되면 재로그인 후 한 번 다시 요청합니다.
+        """
+        url = f"https://{self.hostname}{endpoint}"
+        token = self.token
+        response = self.http.request(method, url, headers=self._get_headers(token=token),
+                                     timeout=self.timeout, **kwargs)
+        if response.status_code == 401 and self._refresh_token(token):
+            response = self.http.request(method, url, headers=self._get_headers(token=self.token),
+                                         timeout=self.timeout, **kwargs)
+        return response
+
     def _get(self, endpoint: str) -> dict:
         """
         내부적으로 GET 요청을 수행합니다.
         """
-        url = f"https://{self.hostname}{endpoint}"
         try:
-            response = requests.get(
-                url,
-                headers=self._get_headers(token=self.token),
-                verify=False,
-                timeout=self.timeout
-            )
+            response = self._request('GET', endpoint)
             if response.status_code == 200:
                 logging.info("GET %s Success", endpoint)
                 return response.json()
@@ -169,15 +239,9 @@ class NGFClient:
     
     def get_service_group_objects_information(self, service_group_name: str) -> dict:
         """서비스 그룹 객체의 상세 정보를 조회합니다."""
-        url = f"https://{self.hostname}/api/op/service-group/get/objects"
         try:
-            response = requests.post(
-                url,
-                headers=self._get_headers(token=self.token),
-                verify=False,
-                timeout=self.timeout,
-                json={'name': service_group_name}
-            )
+            response = self._request('POST', "/api/op/service-group/get/objects",
+                                     json={'name': service_group_name})
             if response.status_code == 200:
                 return response.json()
             else:
@@ -201,81 +265,82 @@ class NGFClient:
         NGF 규칙 데이터를 파싱하여 pandas DataFrame으로 반환합니다.
         """
         try:
-            token = self.login()
-            if not token:
-                raise Exception("NGF 로그인 실패")
-            
-            rules_data = self.get_fw4_rules()
-            if not rules_data:
-                raise Exception("규칙 데이터를 가져올 수 없습니다")
-            
-            security_rules = []
-            rules = rules_data.get("result", [])
-            for rule in rules:
-                seq = rule.get("seq")
-                fw_rule_id = rule.get("fw_rule_id")
-                name = rule.get("name")
-                # default rule은 건너뜁니다.
-                if name == "default":
-                    continue
-                use = "Y" if rule.get("use") == 1 else "N"
-                action = "allow" if rule.get("action") == 1 else "deny"
-
-                src_list = rule.get("src")
-                if not src_list:
-                    src_list = "any"
-                else:
-                    src_list = [src.get("name") for src in src_list]
-
-                user_list = rule.get("user")
-                if not user_list:
-                    user_list = "any"
-                else:
-                    user_list = [list(user.values())[0] for user in user_list]
-
-                dst_list = rule.get("dst")
-                if not dst_list:
-                    dst_list = "any"
-                else:
-                    dst_list = [dst.get("name") for dst in dst_list]
-
-                srv_list = rule.get("srv")
-                if not srv_list:
-                    srv_list = "any"
-                else:
-                    srv_list = [srv.get("name") for srv in srv_list]
-
-                app_list = rule.get("app")
-                if not app_list:
-                    app_list = "any"
-                else:
-                    app_list = [app.get("name") for app in app_list]
-
-                last_hit_time = rule.get("last_hit_time")
-                desc = rule.get("desc")
-
-                info = {
-                    "Seq": seq,
-                    "Rule Name": fw_rule_id,
-                    "Enable": use,
-                    "Action": action,
-                    "Source": self.list_to_string(src_list),
-                    "User": self.list_to_string(user_list),
-                    "Destination": self.list_to_string(dst_list),
-                    "Service": self.list_to_string(srv_list),
-                    "Application": self.list_to_string(app_list),
-                    "Last Hit Date": last_hit_time,
-                    "Description": desc
-                }
-                security_rules.append(info)
-
-            return pd.DataFrame(security_rules)
-        
+            with self.session():
+                return self._export_security_rules()
         except Exception as e:
             logging.error(f"NGF 규칙 데이터 수집 중 오류 발생: {str(e)}")
             raise Exception(f"NGF 규칙 데이터 수집 실패: {str(e)}")
-        finally:
-            self.logout()
+
+    def _export_security_rules(self) -> pd.DataFrame:
+        """로그인된 세션에서 규칙 데이터를 조회하여 DataFrame으로 변환합니다."""
+        if not self.token:
+            raise Exception("NGF 로그인 실패")
+
+        rules_data = self.get_fw4_rules()
+        if not rules_data:
+            raise Exception("규칙 데이터를 가져올 수 없습니다")
+        
+        security_rules = []
+        rules = rules_data.get("result", [])
+        for rule in rules:
+            seq = rule.get("seq")
+            fw_rule_id = rule.get("fw_rule_id")
+            name = rule.get("name")
+            # default rule은 건너뜁니다.
+            if name == "default":
+                continue
+            use = "Y" if rule.get("use") == 1 else "N"
+            action = "allow" if rule.get("action") == 1 else "deny"
+
+            src_list = rule.get("src")
+            if not src_list:
+                src_list = "any"
+            else:
+                src_list = [src.get("name") for src in src_list]
+
+            user_list = rule.get("user")
+            if not user_list:
+                user_list = "any"
+            else:
+                user_list = [list(user.values())[0] for user in user_list]
+
+            dst_list = rule.get("dst")
+            if not dst_list:
+                dst_list = "any"
+            else:
+                dst_list = [dst.get("name") for dst in dst_list]
+
+            srv_list = rule.get("srv")
+            if not srv_list:
+                srv_list = "any"
+            else:
+                srv_list = [srv.get("name") for srv in srv_list]
+
+            app_list = rule.get("app")
+            if not app_list:
+                app_list = "any"
+            else:
+                app_list = [app.get("name") for app in app_list]
+
+            last_hit_time = rule.get("last_hit_time")
+            desc = rule.get("desc")
+
+            info = {
+                "Seq": seq,
+                "Rule Name": fw_rule_id,
+                "Enable": use,
+                "Action": action,
+                "Source": self.list_to_string(src_list),
+                "User": self.list_to_string(user_list),
+                "Destination": self.list_to_string(dst_list),
+                "Service": self.list_to_string(srv_list),
+                "Application": self.list_to_string(app_list),
+                "Last Hit Date": last_hit_time,
+                "Description": desc
+            }
+            security_rules.append(info)
+
+        return pd.DataFrame(security_rules)
 
     def export_objects(self, object_type: str, use_session: bool = True) -> pd.DataFrame:
         """
@@ -335,48 +400,55 @@ class NGFClient:
         except Exception as e:
             raise Exception(f"NGF {object_type} 객체 데이터 수집 실패: {str(e)}")
 
+    @staticmethod
+    def _get_member_ids(object_data: dict) -> list:
+        """
+        서비스 그룹 상세 조회 결과에서 멤버 ID 목록을 추출합니다.
+
+        :param object_data: get_service_group_objects_information 반환값
+        :return: 멤버 ID 목록 (결과가 없으면 None)
+        """
+        if not object_data:
+            return None
+        result_data = object_data.get('result')
+        if not result_data:
+            return None
+        mem_id = result_data[0].get('mem_id')
+        if not mem_id:
+            return []
+        return [member_id.strip() for member_id in str(mem_id).split(';') if member_id.strip()]
+
     def export_service_group_objects_with_members(self) -> pd.DataFrame:
         """
         서비스 그룹 객체와 해당 멤버들의 정보를 포함한 DataFrame을 반환합니다.
+        그룹별 상세 정보는 max_workers 개까지 동시에 조회합니다.
         """
         with self.session():
             # 세션 내에서는 use_session=False로 호출
             service_df = self.export_objects('service', use_session=False)
             service_lookup = {}
-            if not service_df.empty:
-                for _, row in service_df.iterrows():
-                    if 'srv_obj_id' in row and 'name' in row:
-                        service_lookup[str(row['srv_obj_id'])] = row['name']
+            if not service_df.empty and {'srv_obj_id', 'name'} <= set(service_df.columns):
+                service_lookup = dict(zip(service_df['srv_obj_id'].astype(str), service_df['name']))
             
             group_df = self.export_objects('service_group', use_session=False)
             if group_df.empty:
                 return pd.DataFrame()
             
-            # 3. 각 그룹의 상세 정보를 저장할 리스트
+            # 각 서비스 그룹의 상세 정보를 동시에 조회 (결과 순서는 그룹 순서와 같음)
+            group_names = list(group_df['name'])
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(group_names))) as executor:
+                object_data_list = list(executor.map(self.get_service_group_objects_information, group_names))
+
             group_details = []
-            
-            # 4. 각 서비스 그룹에 대해 멤버 정보 조회
-            for _, group in group_df.iterrows():
-                object_data = self.get_service_group_objects_information(group['name'])
-                if object_data and 'result' in object_data:
-                    result_data = object_data.get('result', [])
-                    if result_data:
-                        detail = pd.json_normalize(result_data, sep='_').iloc[0]
-                        member_ids = str(detail['mem_id']).split(';') if detail['mem_id'] else []
-                        member_names = []
-                        for member_id in member_ids:
-                            member_id = member_id.strip()
-                            if member_id:
-                                member_name = service_lookup.get(member_id)
-                                if member_name:
-                                    member_names.append(member_name)
-                                else:
-                                    member_names.append(f'Unknown_{member_id}')
-                        
-                        group_details.append({
-                            'Group Name': group['name'],
-                            'Entry': ','.join(member_names) if member_names else ''
-                        })
+            for group_name, object_data in zip(group_names, object_data_list):
+                member_ids = self._get_member_ids(object_data)
+                if member_ids is None:
+                    continue
+                member_names = [service_lookup.get(member_id, f'Unknown_{member_id}') for member_id in member_ids]
+                group_details.append({
+                    'Group Name': group_name,
+                    'Entry': ','.join(member_names) if member_names else ''
+                })
             
             return pd.DataFrame(group_details)
 
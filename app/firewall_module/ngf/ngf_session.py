@@ -0,0 +1,66 @@
+# firewall/ngf/ngf_session.py
+import logging
+import threading
+from typing import Dict, Hashable, Tuple
+
+from .ngf_module import NGFClient
+
+
+class NGFClientRegistry:
+    """
+    (호스트, 배치 ID)별 NGFClient를 관리하는 레지스트리입니다.
+
+    같은 배치의 모든 수집기가 하나의 클라이언트(로그인 토큰, HTTP 연결 풀)를 공유하므로
+    배치 동안 로그인은 한 번만 수행되고, release() 시 한 번 로그아웃합니다.
+    """
+
+    def __init__(self) -> None:
+        self._clients: Dict[Tuple[str, Hashable], NGFClient] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str, username: str, password: str, batch_id: Hashable) -> NGFClient:
+        """
+        배치의 클라이언트를 반환합니다. 없으면 새로 생성하고 배치가 끝날 때까지 세션을 잡아 둡니다.
+
+        :param host: 장비 IP
+        :param username: ext_clnt_id
+        :param password: ext_clnt_secret
+        :param batch_id: 동기화 배치 ID
+        :return: NGFClient
+        """
+        key = (host, batch_id)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = NGFClient(host, username, password)
+                # 로그인은 첫 요청 시 수행하고, 로그아웃은 release()까지 미룹니다.
+                client.acquire()
+                self._clients[key] = client
+            return client
+
+    def release(self, batch_id: Hashable) -> int:
+        """
+        배치의 클라이언트를 모두 로그아웃하고 연결을 닫습니다.
+
+        :param batch_id: 동기화 배치 ID
+        :return: 닫은 클라이언트 수
+        """
+        with self._lock:
+            keys = [key for key in self._clients if key[1] == batch_id]
+            clients = [self._clients.pop(key) for key in keys]
+
+        for client in clients:
+            try:
+                client.release()
+                client.close()
+            except Exception as e:
+                logging.error("NGF 세션 종료 실패 (%s): %s", client.hostname, e)
+        return len(clients)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+
+# 모듈 전역 클라이언트 레지스트리 (모든 NGFCollector 인스턴스가 공유)
+ngf_clients = NGFClientRegistry()
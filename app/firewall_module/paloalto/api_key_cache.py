@@ -0,0 +1,144 @@
+# firewall/paloalto/api_key_cache.py
+import os
+import json
+import base64
+import hashlib
+import logging
+import threading
+from typing import Callable, Dict, Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+
+
+def _derive_fernet_key(secret: str) -> bytes:
+    """임의 길이의 비밀값에서 Fernet 키(32바이트, urlsafe base64)를 만듭니다."""
+    return base64.urlsafe_b64encode(hashlib.sha256(secret.encode('utf-8')).digest())
+
+
+class ApiKeyCache:
+    """
+    PaloAlto keygen으로 발급받은 API 키를 장비/계정별로 보관하는 캐시입니다.
+
+    키는 (hostname, username, 비밀번호 해시)이므로 비밀번호가 바뀌면 자동으로 새 키를 발급받습니다.
+    파일 경로와 비밀값이 설정되면 Fernet으로 암호화하여 디스크에 저장하므로 프로세스를 재시작해도 유지됩니다.
+    """
+
+    def __init__(self, path: Optional[str] = None, secret: Optional[str] = None) -> None:
+        self._keys: Dict[str, str] = {}
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.RLock()
+        self._path = None
+        self._fernet = None
+        self.configure(path, secret)
+
+    def configure(self, path: Optional[str], secret: Optional[str]) -> None:
+        """
+        디스크 저장 위치와 암호화 비밀값을 설정합니다. 둘 중 하나라도 없으면 메모리에만 보관합니다.
+
+        :param path: 암호화된 캐시 파일 경로
+        :param secret: 암호화 비밀값 (예: 애플리케이션 SECRET_KEY)
+        """
+        with self._lock:
+            if path and secret:
+                self._path = path
+                self._fernet = Fernet(_derive_fernet_key(secret))
+                self._keys.update(self._load())
+            else:
+                self._path = None
+                self._fernet = None
+
+    @staticmethod
+    def make_key(hostname: str, username: str, password: str) -> str:
+        """캐시 키를 생성합니다. 비밀번호는 해시로만 보관합니다."""
+        password_hash = hashlib.sha256(password.encode('utf-8')).hexdigest()
+        return f"{hostname}|{username}|{password_hash}"
+
+    def _load(self) -> Dict[str, str]:
+        """암호화된 캐시 파일을 읽습니다. 파일이 없거나 복호화할 수 없으면 빈 캐시를 반환합니다."""
+        if not os.path.exists(self._path):
+            return {}
+        try:
+            with open(self._path, 'rb') as f:
+                return json.loads(self._fernet.decrypt(f.read()).decode('utf-8'))
+        except (InvalidToken, ValueError, OSError) as e:
+            logging.warning("PaloAlto API 키 캐시 파일을 읽을 수 없어 무시합니다 (%s): %s", self._path, e)
+            return {}
+
+    def _save(self) -> None:
+        """캐시를 암호화하여 파일에 저장합니다. (self._lock 보유 상태에서 호출)"""
+        if not self._path:
+            return
+        try:
+            directory = os.path.dirname(self._path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self._path}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(self._fernet.encrypt(json.dumps(self._keys).encode('utf-8')))
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, self._path)
+        except OSError as e:
+            logging.error("PaloAlto API 키 캐시 저장 실패 (%s): %s", self._path, e)
+
+    def get(self, hostname: str, username: str, password: str, loader: Callable[[], str]) -> str:
+        """
+        캐시된 API 키를 반환합니다. 없으면 loader로 발급받아 저장합니다.
+
+        :param hostname: 장비 호스트명
+        :param username: 접속 계정
+        :param password: 접속 비밀번호
+        :param loader: 키가 없을 때 호출할 keygen 함수
+        :return: API 키
+        """
+        cache_key = self.make_key(hostname, username, password)
+        with self._lock:
+            api_key = self._keys.get(cache_key)
+            if api_key:
+                return api_key
+            key_lock = self._key_locks.setdefault(cache_key, threading.Lock())
+
+        # keygen은 키 단위로만 잠급니다. (응답이 늦은 장비가 다른 장비의 키 조회를 막지 않도록)
+        with key_lock:
+            with self._lock:
+                api_key = self._keys.get(cache_key)
+                if api_key:
+                    return api_key
+
+            api_key = loader()
+
+            with self._lock:
+                self._keys[cache_key] = api_key
+                self._save()
+            return api_key
+
+    def invalidate(self, hostname: Optional[str] = None, username: Optional[str] = None,
+                   password: Optional[str] = None, api_key: Optional[str] = None) -> int:
+        """
+        API 키를 무효화합니다. 인자를 모두 생략하면 전체 캐시를 비웁니다.
+
+        :param hostname: 장비 호스트명
+        :param username: 접속 계정 (hostname, password와 함께 지정)
+        :param password: 접속 비밀번호
+        :param api_key: 지정하면 해당 값이 저장된 경우에만 삭제 (다른 스레드가 이미 갱신한 키는 유지)
+        :return: 삭제된 키 수
+        """
+        with self._lock:
+            if username is not None and password is not None:
+                keys = [self.make_key(hostname, username, password)]
+            else:
+                keys = [key for key in self._keys if hostname is None or key.split('|', 1)[0] == hostname]
+            keys = [key for key in keys if key in self._keys and (api_key is None or self._keys[key] == api_key)]
+            for key in keys:
+                del self._keys[key]
+                self._key_locks.pop(key, None)
+            if keys:
+                self._save()
+            return len(keys)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._keys)
+
+
+# 모듈 전역 API 키 캐시 (모든 PaloAltoAPI 인스턴스가 공유)
+api_key_cache = ApiKeyCache()
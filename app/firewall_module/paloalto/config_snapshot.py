@@ -0,0 +1,91 @@
+# firewall/paloalto/config_snapshot.py
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# 스냅샷 기본 유지 시간 (초)
+DEFAULT_SNAPSHOT_TTL = 300
+
+
+class ConfigSnapshotCache:
+    """
+    PaloAlto 설정(/config) 파싱 결과를 동기화 배치 단위로 공유하는 캐시입니다.
+
+    키는 (hostname, batch_id, config_type) 형태이며, 같은 배치 안에서는
+    설정을 한 번만 내려받아 파싱하고 모든 export 함수가 같은 스냅샷을 사용합니다.
+    """
+
+    def __init__(self, ttl: int = DEFAULT_SNAPSHOT_TTL) -> None:
+        self.ttl = ttl
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        self._key_locks: Dict[Tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl is not None and time.monotonic() - created_at > self.ttl
+
+    def _purge_expired(self) -> None:
+        """만료된 스냅샷을 정리합니다. (self._lock 보유 상태에서 호출)"""
+        expired = [key for key, (created_at, _) in self._entries.items() if self._is_expired(created_at)]
+        for key in expired:
+            self._entries.pop(key, None)
+            self._key_locks.pop(key, None)
+
+    def get(self, hostname: str, batch_id: Hashable, config_type: str, loader: Callable[[], Any]) -> Any:
+        """
+        스냅샷을 반환합니다. 없거나 만료된 경우 loader를 호출하여 새로 생성합니다.
+
+        :param hostname: 장비 호스트명
+        :param batch_id: 동기화 배치 ID
+        :param config_type: 'running' 또는 'candidate'
+        :param loader: 스냅샷이 없을 때 호출할 함수 (파싱된 설정 반환)
+        :return: 파싱된 설정 스냅샷
+        """
+        key = (hostname, batch_id, config_type)
+        with self._lock:
+            self._purge_expired()
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry[1]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # 같은 키에 대한 동시 요청은 한 번만 장비에서 가져오도록 키 단위로 잠급니다.
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and not self._is_expired(entry[0]):
+                    return entry[1]
+
+            logging.info("PaloAlto 설정 스냅샷 생성: %s (%s, batch=%s)", hostname, config_type, batch_id)
+            snapshot = loader()
+
+            with self._lock:
+                self._entries[key] = (time.monotonic(), snapshot)
+            return snapshot
+
+    def invalidate(self, batch_id: Optional[Hashable] = None, hostname: Optional[str] = None) -> int:
+        """
+        스냅샷을 무효화합니다. 인자를 모두 생략하면 전체 캐시를 비웁니다.
+
+        :param batch_id: 무효화할 배치 ID
+        :param hostname: 무효화할 장비 호스트명
+        :return: 삭제된 스냅샷 수
+        """
+        with self._lock:
+            keys = [
+                key for key in self._entries
+                if (batch_id is None or key[1] == batch_id) and (hostname is None or key[0] == hostname)
+            ]
+            for key in keys:
+                self._entries.pop(key, None)
+                self._key_locks.pop(key, None)
+            return len(keys)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# 모듈 전역 스냅샷 캐시 (모든 PaloAltoAPI 인스턴스가 공유)
+config_snapshot_cache = ConfigSnapshotCache()
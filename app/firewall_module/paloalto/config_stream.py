@@ -0,0 +1,64 @@
+# firewall/paloalto/config_stream.py
+import xml.etree.ElementTree as ET
+from typing import IO, Iterator, Optional, Tuple
+
+# 응답 루트(<response>) 기준 vsys 엔트리 경로
+VSYS_PATH = ('result', 'config', 'devices', 'entry', 'vsys', 'entry')
+
+# vsys 하위 레코드 경로와 레코드 종류
+RECORD_PATHS = {
+    VSYS_PATH + ('rulebase', 'security', 'rules', 'entry'): 'security_rules',
+    VSYS_PATH + ('address', 'entry'): 'address',
+    VSYS_PATH + ('address-group', 'entry'): 'address_group',
+    VSYS_PATH + ('service', 'entry'): 'service',
+    VSYS_PATH + ('service-group', 'entry'): 'service_group',
+}
+
+
+def iter_config_entries(source: IO[bytes]) -> Iterator[Tuple[str, Optional[str], ET.Element]]:
+    """
+    설정 XML 스트림을 iterparse로 읽으면서 정책/객체 엔트리를 하나씩 반환합니다.
+
+    반환된 요소는 다음 엔트리를 읽기 전에 트리에서 제거되므로, 호출 측은
+    반복 중에 필요한 값을 바로 추출해야 합니다. 처리가 끝난 요소를 계속 제거하기
+    때문에 설정 크기와 관계없이 메모리 사용량이 일정하게 유지됩니다.
+
+    :param source: 설정 XML 바이트 스트림 (예: requests 응답의 raw)
+    :return: (레코드 종류, vsys 이름, 엔트리 요소) 이터레이터
+    """
+    path = []       # 루트를 제외한 현재 태그 경로
+    elements = []   # 루트부터 현재 요소까지의 요소 스택
+    record_depth = None
+    vsys_name = None
+
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            if elements:
+                path.append(elem.tag)
+            elements.append(elem)
+
+            current_path = tuple(path)
+            if current_path == VSYS_PATH:
+                vsys_name = elem.attrib.get('name')
+            if record_depth is None and current_path in RECORD_PATHS:
+                record_depth = len(path)
+            continue
+
+        # end 이벤트: 레코드 내부 요소는 레코드가 끝날 때 함께 정리합니다.
+        depth = len(path)
+        if record_depth is not None and depth > record_depth:
+            elements.pop()
+            path.pop()
+            continue
+
+        if record_depth is not None and depth == record_depth:
+            record_depth = None
+            yield RECORD_PATHS[tuple(path)], vsys_name, elem
+
+        elements.pop()
+        if path:
+            path.pop()
+        # 처리가 끝난 요소는 부모에서 제거하여 메모리를 해제합니다.
+        if elements:
+            elements[-1].remove(elem)
+        elem.clear()
@@ -3,10 +3,16 @@ import pandas as pd
 from typing import Optional
 from ..firewall_interface import FirewallInterface
 from .paloalto_module import PaloAltoAPI
+from .config_snapshot import config_snapshot_cache
 
 class PaloAltoCollector(FirewallInterface):
-    def __init__(self, hostname: str, username: str, password: str):
-        self.api = PaloAltoAPI(hostname, username, password)
+    def __init__(self, hostname: str, username: str, password: str, batch_id: Optional[str] = None):
+        self.api = PaloAltoAPI(hostname, username, password, batch_id=batch_id)
+
+    @staticmethod
+    def release_batch(batch_id: str) -> int:
+        """배치 동기화가 끝나면 해당 배치의 설정 스냅샷을 해제합니다."""
+        return config_snapshot_cache.invalidate(batch_id=batch_id)
 
     def get_system_info(self) -> pd.DataFrame:
         """시스템 정보를 반환합니다."""
@@ -1,13 +1,20 @@
 import os
 import time
+import uuid
 import datetime
 import logging
+import threading
 import requests
 import xml.etree.ElementTree as ET
 
 import pandas as pd
 from openpyxl import load_workbook
 from openpyxl.styles import PatternFill
+from requests.adapters import HTTPAdapter
+
+from .config_snapshot import config_snapshot_cache
+from .config_stream import iter_config_entries, RECORD_PATHS
+from .api_key_cache import api_key_cache
 
 # SSL 설정
 requests.packages.urllib3.util.ssl_.DEFAULT_CIPHERS += ':DES-CBC3-SHA'
@@ -19,6 +26,47 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# API 요청 타임아웃 (연결, 응답 대기) 초
+DEFAULT_TIMEOUT = (10, 300)
+
+# 장비별 HTTP 연결 풀 크기 (한 작업 안에서 동시에 실행되는 동기화 유형 수를 고려)
+HTTP_POOL_SIZE = 4
+
+_http_sessions = {}
+_http_sessions_lock = threading.Lock()
+
+
+def get_http_session(hostname: str) -> requests.Session:
+    """
+    장비별로 공유하는 keep-alive HTTP 세션을 반환합니다.
+    같은 장비에 대한 요청은 수집기 인스턴스와 관계없이 TLS 연결을 재사용합니다.
+
+    :param hostname: 장비 호스트명
+    :return: requests.Session
+    """
+    with _http_sessions_lock:
+        http = _http_sessions.get(hostname)
+        if http is None:
+            http = requests.Session()
+            http.verify = False
+            http.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE))
+            _http_sessions[hostname] = http
+        return http
+
+
+def close_http_sessions() -> int:
+    """
+    공유 HTTP 세션을 모두 닫습니다.
+
+    :return: 닫은 세션 수
+    """
+    with _http_sessions_lock:
+        sessions = list(_http_sessions.values())
+        _http_sessions.clear()
+    for http in sessions:
+        http.close()
+    return len(sessions)
+
 
 def apply_excel_style(file_name: str) -> None:
     """
@@ -52,10 +100,19 @@ def apply_excel_style(file_name: str) -> None:
 
 
 class PaloAltoAPI:
-    def __init__(self, hostname: str, username: str, password: str) -> None:
+    def __init__(self, hostname: str, username: str, password: str, batch_id: str = None, streaming: bool = True) -> None:
         self.hostname = hostname
         self.base_url = f'https://{hostname}/api/'
-        self.api_key = self._get_api_key(username, password)
+        # True이면 설정 XML을 iterparse로 스트리밍 파싱하여 메모리 사용량을 일정하게 유지합니다.
+        self.streaming = streaming
+        # 배치 ID가 없으면 인스턴스 단위로 설정 스냅샷을 공유합니다.
+        self.batch_id = batch_id or f'instance-{uuid.uuid4()}'
+        self.username = username
+        self._password = password
+        self.http = get_http_session(hostname)
+        # keygen은 장비/계정별로 한 번만 수행하고 캐시된 키를 재사용합니다.
+        self.api_key = api_key_cache.get(hostname, username, password,
+                                         lambda: self._get_api_key(username, password))
 
     def save_to_excel(self, data, sheet_names=None) -> str:
         """
@@ -116,15 +173,32 @@ class PaloAltoAPI:
         """
         return ','.join(str(item) for item in list_data)
 
-    def get_api_data(self, parameters, timeout: int = 10000):
-        """API 호출을 수행합니다."""
+    def _renew_api_key(self, expired_key: str) -> str:
+        """
+        인증에 실패한 API 키를 캐시에서 지우고 새로 발급받습니다.
+
+        :param expired_key: 인증에 실패한 API 키
+        :return: 새 API 키
+        """
+        logging.info("PaloAlto API 키 인증 실패, 키를 재발급합니다: %s", self.hostname)
+        api_key_cache.invalidate(self.hostname, self.username, self._password, api_key=expired_key)
+        self.api_key = api_key_cache.get(self.hostname, self.username, self._password,
+                                         lambda: self._get_api_key(self.username, self._password))
+        return self.api_key
+
+    def get_api_data(self, parameters, timeout=DEFAULT_TIMEOUT, stream: bool = False):
+        """
+        API 호출을 수행합니다.
+        API 키 인증에 실패(403)하면 키를 재발급받아 한 번 다시 요청합니다.
+        """
         try:
-            response = requests.get(
-                self.base_url,
-                params=parameters,
-                verify=False,
-                timeout=timeout
-            )
+            response = self.http.get(self.base_url, params=parameters, timeout=timeout, stream=stream)
+            expired_key = dict(parameters).get('key')
+            if response.status_code == 403 and expired_key:
+                response.close()
+                api_key = self._renew_api_key(expired_key)
+                parameters = tuple((name, api_key if name == 'key' else value) for name, value in parameters)
+                response = self.http.get(self.base_url, params=parameters, timeout=timeout, stream=stream)
             if response.status_code != 200:
                 raise Exception(f"API 요청 실패 (상태 코드: {response.status_code}): {response.text}")
             return response
@@ -188,6 +262,29 @@ class PaloAltoAPI:
         response = self.get_api_data(params)
         return response.text
 
+    def get_config_tree(self, config_type: str = 'running') -> ET.Element:
+        """
+        파싱된 설정 XML을 반환합니다.
+        같은 배치 안에서는 설정을 한 번만 내려받아 파싱한 스냅샷을 공유합니다.
+
+        :param config_type: 'running' 또는 기타
+        :return: 설정 XML 루트 요소
+        """
+        return config_snapshot_cache.get(
+            self.hostname,
+            self.batch_id,
+            config_type,
+            lambda: ET.fromstring(self.get_config(config_type))
+        )
+
+    def invalidate_config(self) -> int:
+        """
+        현재 배치의 설정 스냅샷을 무효화합니다.
+
+        :return: 삭제된 스냅샷 수
+        """
+        return config_snapshot_cache.invalidate(batch_id=self.batch_id, hostname=self.hostname)
+
     def save_config(self, config_type: str = 'running') -> bool:
         """
         설정 정보를 XML 파일로 저장합니다.
@@ -272,6 +369,183 @@ class PaloAltoAPI:
         }
         return pd.DataFrame(state, index=[0])
 
+    def _parse_security_rule(self, rule: ET.Element, vsys_name: str, seq: int) -> dict:
+        """
+        보안 규칙 엔트리 요소를 레코드로 변환합니다.
+
+        :param rule: rulebase/security/rules/entry 요소
+        :param vsys_name: vsys 이름
+        :param seq: vsys 내 규칙 순서
+        :return: 보안 규칙 레코드
+        """
+        rule_name = str(rule.attrib.get('name'))
+        disabled_list = self._get_member_texts(rule.findall('./disabled'))
+        disabled_status = "N" if self.list_to_string(disabled_list) == "yes" else "Y"
+        action = self.list_to_string(self._get_member_texts(rule.findall('./action')))
+        source = self.list_to_string(self._get_member_texts(rule.findall('./source/member')))
+        user = self.list_to_string(self._get_member_texts(rule.findall('./source-user/member')))
+        destination = self.list_to_string(self._get_member_texts(rule.findall('./destination/member')))
+        service = self.list_to_string(self._get_member_texts(rule.findall('./service/member')))
+        application = self.list_to_string(self._get_member_texts(rule.findall('./application/member')))
+        url_filtering = self.list_to_string(self._get_member_texts(rule.findall('./profile-setting/profiles/url-filtering/member')))
+        category = self.list_to_string(self._get_member_texts(rule.findall('./category/member')))
+        category = "any" if not category else category
+        description_list = self._get_member_texts(rule.findall('./description'))
+        description = self.list_to_string([desc.replace('\n', ' ') for desc in description_list])
+
+        return {
+            "Vsys": vsys_name,
+            "Seq": seq,
+            "Rule Name": rule_name,
+            "Enable": disabled_status,
+            "Action": action,
+            "Source": source,
+            "User": user,
+            "Destination": destination,
+            "Service": service,
+            "Application": application,
+            "Security Profile": url_filtering,
+            "Category": category,
+            "Description": description,
+        }
+
+    def _parse_address(self, address: ET.Element) -> dict:
+        """
+        주소 객체 엔트리 요소를 레코드로 변환합니다.
+
+        :param address: address/entry 요소
+        :return: 네트워크 객체 레코드
+        """
+        address_name = address.attrib.get('name')
+        address_type = address.find('*').tag if address.find('*') is not None else ""
+        member_elements = address.findall(f'./{address_type}')
+        members = [elem.text for elem in member_elements if elem.text is not None]
+
+        return {
+            "Name": address_name,
+            "Type": address_type,
+            "Value": self.list_to_string(members)
+        }
+
+    def _parse_address_group(self, group: ET.Element) -> dict:
+        """
+        주소 그룹 엔트리 요소를 레코드로 변환합니다.
+
+        :param group: address-group/entry 요소
+        :return: 네트워크 그룹 객체 레코드
+        """
+        group_name = group.attrib.get('name')
+        member_elements = group.findall('./static/member')
+        members = [elem.text for elem in member_elements if elem.text is not None]
+
+        return {
+            "Group Name": group_name,
+            "Entry": self.list_to_string(members)
+        }
+
+    def _parse_service(self, service: ET.Element) -> list:
+        """
+        서비스 객체 엔트리 요소를 프로토콜별 레코드 리스트로 변환합니다.
+
+        :param service: service/entry 요소
+        :return: 서비스 객체 레코드 리스트
+        """
+        service_name = service.attrib.get('name')
+        service_objects = []
+        protocol_elem = service.find('protocol')
+        if protocol_elem is not None:
+            for protocol in protocol_elem:
+                protocol_name = protocol.tag
+                port = protocol.find('port').text if protocol.find('port') is not None else None
+
+                service_objects.append({
+                    "Name": service_name,
+                    "Protocol": protocol_name,
+                    "Port": port,
+                })
+        return service_objects
+
+    def _parse_service_group(self, group: ET.Element) -> dict:
+        """
+        서비스 그룹 엔트리 요소를 레코드로 변환합니다.
+
+        :param group: service-group/entry 요소
+        :return: 서비스 그룹 객체 레코드
+        """
+        group_name = group.attrib.get('name')
+        member_elements = group.findall('./members/member')
+        members = [elem.text for elem in member_elements if elem.text is not None]
+
+        return {
+            "Group Name": group_name,
+            "Entry": self.list_to_string(members),
+        }
+
+    def _open_config_stream(self, config_type: str = 'running'):
+        """
+        설정 XML을 스트리밍으로 요청하고 응답 바이트 스트림을 반환합니다.
+
+        :param config_type: 'running' 또는 기타
+        :return: (응답 객체, 바이트 스트림)
+        """
+        action = 'show' if config_type == 'running' else 'get'
+        params = (
+            ('key', self.api_key),
+            ('type', 'config'),
+            ('action', action),
+            ('xpath', '/config')
+        )
+        response = self.get_api_data(params, stream=True)
+        # gzip 등 전송 인코딩을 해제한 바이트를 읽도록 설정
+        response.raw.decode_content = True
+        return response, response.raw
+
+    def _stream_config_frames(self, config_type: str = 'running') -> dict:
+        """
+        설정 XML을 한 번의 스트리밍 파싱으로 읽어 레코드 종류별 DataFrame을 생성합니다.
+
+        :param config_type: 'running' 또는 기타
+        :return: {'security_rules', 'address', 'address_group', 'service', 'service_group'} DataFrame 딕셔너리
+        """
+        records = {kind: [] for kind in RECORD_PATHS.values()}
+        rule_seq = {}
+
+        response, stream = self._open_config_stream(config_type)
+        try:
+            for kind, vsys_name, elem in iter_config_entries(stream):
+                if kind == 'security_rules':
+                    rule_seq[vsys_name] = rule_seq.get(vsys_name, 0) + 1
+                    records[kind].append(self._parse_security_rule(elem, vsys_name, rule_seq[vsys_name]))
+                elif kind == 'address':
+                    records[kind].append(self._parse_address(elem))
+                elif kind == 'address_group':
+                    records[kind].append(self._parse_address_group(elem))
+                elif kind == 'service':
+                    records[kind].extend(self._parse_service(elem))
+                elif kind == 'service_group':
+                    records[kind].append(self._parse_service_group(elem))
+        except ET.ParseError:
+            raise Exception("설정 XML 파싱 실패")
+        finally:
+            response.close()
+
+        return {kind: pd.DataFrame(rows) for kind, rows in records.items()}
+
+    def get_config_frames(self, config_type: str = 'running') -> dict:
+        """
+        스트리밍 파싱한 레코드 종류별 DataFrame을 반환합니다.
+        같은 배치 안에서는 한 번만 파싱한 결과를 공유합니다.
+
+        :param config_type: 'running' 또는 기타
+        :return: 레코드 종류별 DataFrame 딕셔너리
+        """
+        return config_snapshot_cache.get(
+            self.hostname,
+            self.batch_id,
+            f'{config_type}:stream',
+            lambda: self._stream_config_frames(config_type)
+        )
+
     def export_security_rules(self, config_type: str = 'running') -> pd.DataFrame:
         """
         보안 규칙 정보를 DataFrame으로 반환합니다.
@@ -279,8 +553,10 @@ class PaloAltoAPI:
         :param config_type: 'running' 또는 기타
         :return: 보안 규칙 DataFrame
         """
-        config_xml = self.get_config(config_type)
-        tree = ET.fromstring(config_xml)
+        if self.streaming:
+            return self.get_config_frames(config_type)['security_rules'].copy()
+
+        tree = self.get_config_tree(config_type)
         vsys_entries = tree.findall('./result/config/devices/entry/vsys/entry')
         security_rules = []
 
@@ -288,37 +564,7 @@ class PaloAltoAPI:
             vsys_name = vsys.attrib.get('name')
             rulebase = vsys.findall('./rulebase/security/rules/entry')
             for idx, rule in enumerate(rulebase):
-                rule_name = str(rule.attrib.get('name'))
-                disabled_list = self._get_member_texts(rule.findall('./disabled'))
-                disabled_status = "N" if self.list_to_string(disabled_list) == "yes" else "Y"
-                action = self.list_to_string(self._get_member_texts(rule.findall('./action')))
-                source = self.list_to_string(self._get_member_texts(rule.findall('./source/member')))
-                user = self.list_to_string(self._get_member_texts(rule.findall('./source-user/member')))
-                destination = self.list_to_string(self._get_member_texts(rule.findall('./destination/member')))
-                service = self.list_to_string(self._get_member_texts(rule.findall('./service/member')))
-                application = self.list_to_string(self._get_member_texts(rule.findall('./application/member')))
-                url_filtering = self.list_to_string(self._get_member_texts(rule.findall('./profile-setting/profiles/url-filtering/member')))
-                category = self.list_to_string(self._get_member_texts(rule.findall('./category/member')))
-                category = "any" if not category else category
-                description_list = self._get_member_texts(rule.findall('./description'))
-                description = self.list_to_string([desc.replace('\n', ' ') for desc in description_list])
-
-                rule_info = {
-                    "Vsys": vsys_name,
-                    "Seq": idx + 1,
-                    "Rule Name": rule_name,
-                    "Enable": disabled_status,
-                    "Action": action,
-                    "Source": source,
-                    "User": user,
-                    "Destination": destination,
-                    "Service": service,
-                    "Application": application,
-                    "Security Profile": url_filtering,
-                    "Category": category,
-                    "Description": description,
-                }
-                security_rules.append(rule_info)
+                security_rules.append(self._parse_security_rule(rule, vsys_name, idx + 1))
 
         return pd.DataFrame(security_rules)
 
@@ -329,23 +575,12 @@ class PaloAltoAPI:
         :param config_type: 'running' 또는 기타
         :return: 네트워크 객체 DataFrame
         """
-        config_xml = self.get_config(config_type)
-        tree = ET.fromstring(config_xml)
-        address_entries = tree.findall('./result/config/devices/entry/vsys/entry/address/entry')
-        address_objects = []
-
-        for address in address_entries:
-            address_name = address.attrib.get('name')
-            address_type = address.find('*').tag if address.find('*') is not None else ""
-            member_elements = address.findall(f'./{address_type}')
-            members = [elem.text for elem in member_elements if elem.text is not None]
+        if self.streaming:
+            return self.get_config_frames(config_type)['address'].copy()
 
-            object_info = {
-                "Name": address_name,
-                "Type": address_type,
-                "Value": self.list_to_string(members)
-            }
-            address_objects.append(object_info)
+        tree = self.get_config_tree(config_type)
+        address_entries = tree.findall('./result/config/devices/entry/vsys/entry/address/entry')
+        address_objects = [self._parse_address(address) for address in address_entries]
 
         return pd.DataFrame(address_objects)
 
@@ -356,21 +591,12 @@ class PaloAltoAPI:
         :param config_type: 'running' 또는 기타
         :return: 네트워크 그룹 객체 DataFrame
         """
-        config_xml = self.get_config(config_type)
-        tree = ET.fromstring(config_xml)
-        group_entries = tree.findall('./result/config/devices/entry/vsys/entry/address-group/entry')
-        group_objects = []
-
-        for group in group_entries:
-            group_name = group.attrib.get('name')
-            member_elements = group.findall('./static/member')
-            members = [elem.text for elem in member_elements if elem.text is not None]
+        if self.streaming:
+            return self.get_config_frames(config_type)['address_group'].copy()
 
-            group_info = {
-                "Group Name": group_name,
-                "Entry": self.list_to_string(members)
-            }
-            group_objects.append(group_info)
+        tree = self.get_config_tree(config_type)
+        group_entries = tree.findall('./result/config/devices/entry/vsys/entry/address-group/entry')
+        group_objects = [self._parse_address_group(group) for group in group_entries]
 
         return pd.DataFrame(group_objects)
 
@@ -381,25 +607,15 @@ class PaloAltoAPI:
         :param config_type: 'running' 또는 기타
         :return: 서비스 객체 DataFrame
         """
-        config_xml = self.get_config(config_type)
-        tree = ET.fromstring(config_xml)
+        if self.streaming:
+            return self.get_config_frames(config_type)['service'].copy()
+
+        tree = self.get_config_tree(config_type)
         service_entries = tree.findall('./result/config/devices/entry/vsys/entry/service/entry')
         service_objects = []
 
         for service in service_entries:
-            service_name = service.attrib.get('name')
-            protocol_elem = service.find('protocol')
-            if protocol_elem is not None:
-                for protocol in protocol_elem:
-                    protocol_name = protocol.tag
-                    port = protocol.find('port').text if protocol.find('port') is not None else None
-
-                    service_info = {
-                        "Name": service_name,
-                        "Protocol": protocol_name,
-                        "Port": port,
-                    }
-                    service_objects.append(service_info)
+            service_objects.extend(self._parse_service(service))
 
         return pd.DataFrame(service_objects)
 
@@ -410,21 +626,12 @@ class PaloAltoAPI:
         :param config_type: 'running' 또는 기타
         :return: 서비스 그룹 객체 DataFrame
         """
-        config_xml = self.get_config(config_type)
-        tree = ET.fromstring(config_xml)
+        if self.streaming:
+            return self.get_config_frames(config_type)['service_group'].copy()
+
+        tree = self.get_config_tree(config_type)
         group_entries = tree.findall('./result/config/devices/entry/vsys/entry/service-group/entry')
-        group_objects = []
-
-        for group in group_entries:
-            group_name = group.attrib.get('name')
-            member_elements = group.findall('./members/member')
-            members = [elem.text for elem in member_elements if elem.text is not None]
-
-            group_info = {
-                "Group Name": group_name,
-                "Entry": self.list_to_string(members),
-            }
-            group_objects.append(group_info)
+        group_objects = [self._parse_service_group(group) for group in group_entries]
 
         return pd.DataFrame(group_objects)
 
@@ -8,6 +8,7 @@ from app.models.firewall import (
     FirewallServiceGroup,
     SyncHistory,
     SyncTask,
+    DeviceStats,
     SYNC_STATUS,
     SYNC_PRIORITY
 ) 
\ No newline at end of file
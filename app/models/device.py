@@ -13,7 +13,7 @@ class Device(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     
     # 기본 정보
-    name = db.Column(db.String(100), nullable=False, comment='장비명')
+    name = db.Column(db.String(100), nullable=False, index=True, comment='장비명')
     category = db.Column(db.String(20), nullable=False, comment='장비 분류(firewall)')
     sub_category = db.Column(db.String(20), nullable=False, comment='세부 분류(paloalto, mf2, ngf, mock)')
     manufacturer = db.Column(db.String(50), nullable=True, comment='제조사')
@@ -53,22 +53,11 @@ class Device(db.Model):
     
     def get_connection_config(self):
         """장비 타입에 맞는 연결 설정 반환"""
-        if self.sub_category == 'paloalto' or self.sub_category == 'mock':
+        if self.sub_category in ('paloalto', 'mf2', 'ngf', 'mock'):
+            # NGF는 username을 ext_clnt_id로, password를 ext_clnt_secret로 사용
             return {
                 'hostname': self.ip_address,
                 'username': self.username,
                 'password': self.password
             }
-        elif self.sub_category == 'mf2':
-            return {
-                'device_ip': self.ip_address,
-                'username': self.username,
-                'password': self.password
-            }
-        elif self.sub_category == 'ngf':
-            return {
-                'hostname': self.ip_address,
-                'ext_clnt_id': self.username,  # NGF는 username을 ext_clnt_id로 사용
-                'ext_clnt_secret': self.password  # NGF는 password를 ext_clnt_secret로 사용
-            }
         return None 
\ No newline at end of file
@@ -30,6 +30,11 @@ class FirewallSystemInfo(db.Model):
 
 class FirewallPolicy(db.Model):
     """방화벽 보안 규칙 정보"""
+    __table_args__ = (
+        # 장비별 삭제/규칙명 조회(사용 이력 병합), 장비별 규칙 순서 정렬
+        db.Index('ix_firewall_policy_device_rule_name', 'device_id', 'rule_name'),
+        db.Index('ix_firewall_policy_device_seq', 'device_id', 'seq'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     device_id = db.Column(db.Integer, db.ForeignKey('device.id'), nullable=False)
     device = db.relationship('Device', backref='firewall_policies')
@@ -61,12 +66,16 @@ class FirewallPolicy(db.Model):
     # 동기화 정보
     firewall_type = db.Column(db.String(20), nullable=False, comment='방화벽 타입(paloalto, mf2, ngf, mock)')
     last_sync_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
+    content_hash = db.Column(db.String(40), nullable=True, comment='증분 동기화용 내용 해시(SHA-1)')
     
     def __repr__(self):
         return f'<FirewallPolicy {self.rule_name} for device_id={self.device_id}>'
 
 class FirewallNetworkObject(db.Model):
     """방화벽 네트워크 객체 정보"""
+    __table_args__ = (
+        db.Index('ix_firewall_network_object_device_name', 'device_id', 'name'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     device_id = db.Column(db.Integer, db.ForeignKey('device.id'), nullable=False)
     device = db.relationship('Device', backref='network_objects')
@@ -79,12 +88,16 @@ class FirewallNetworkObject(db.Model):
     # 동기화 정보
     firewall_type = db.Column(db.String(20), nullable=False, comment='방화벽 타입(paloalto, mf2, ngf, mock)')
     last_sync_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
+    content_hash = db.Column(db.String(40), nullable=True, comment='증분 동기화용 내용 해시(SHA-1)')
     
     def __repr__(self):
         return f'<FirewallNetworkObject {self.name} for device_id={self.device_id}>'
 
 class FirewallNetworkGroup(db.Model):
     """방화벽 네트워크 그룹 객체 정보"""
+    __table_args__ = (
+        db.Index('ix_firewall_network_group_device_group_name', 'device_id', 'group_name'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     device_id = db.Column(db.Integer, db.ForeignKey('device.id'), nullable=False)
     device = db.relationship('Device', backref='network_groups')
@@ -96,12 +109,16 @@ class FirewallNetworkGroup(db.Model):
     # 동기화 정보
     firewall_type = db.Column(db.String(20), nullable=False, comment='방화벽 타입(paloalto, mf2, ngf, mock)')
     last_sync_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
+    content_hash = db.Column(db.String(40), nullable=True, comment='증분 동기화용 내용 해시(SHA-1)')
     
     def __repr__(self):
         return f'<FirewallNetworkGroup {self.group_name} for device_id={self.device_id}>'
 
 class FirewallServiceObject(db.Model):
     """방화벽 서비스 객체 정보"""
+    __table_args__ = (
+        db.Index('ix_firewall_service_object_device_name', 'device_id', 'name'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     device_id = db.Column(db.Integer, db.ForeignKey('device.id'), nullable=False)
     device = db.relationship('Device', backref='service_objects')
@@ -114,12 +131,16 @@ class FirewallServiceObject(db.Model):
     # 동기화 정보
     firewall_type = db.Column(db.String(20), nullable=False, comment='방화벽 타입(paloalto, mf2, ngf, mock)')
     last_sync_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
+    content_hash = db.Column(db.String(40), nullable=True, comment='증분 동기화용 내용 해시(SHA-1)')
     
     def __repr__(self):
         return f'<FirewallServiceObject {self.name} for device_id={self.device_id}>'
 
 class FirewallServiceGroup(db.Model):
     """방화벽 서비스 그룹 객체 정보"""
+    __table_args__ = (
+        db.Index('ix_firewall_service_group_device_group_name', 'device_id', 'group_name'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     device_id = db.Column(db.Integer, db.ForeignKey('device.id'), nullable=False)
     device = db.relationship('Device', backref='service_groups')
@@ -131,12 +152,17 @@ class FirewallServiceGroup(db.Model):
     # 동기화 정보
     firewall_type = db.Column(db.String(20), nullable=False, comment='방화벽 타입(paloalto, mf2, ngf, mock)')
     last_sync_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
+    content_hash = db.Column(db.String(40), nullable=True, comment='증분 동기화용 내용 해시(SHA-1)')
     
     def __repr__(self):
         return f'<FirewallServiceGroup {self.group_name} for device_id={self.device_id}>'
 
 class SyncHistory(db.Model):
     """장비 정책/객체 동기화 이력"""
+    __table_args__ = (
+        # 장비별 최근 동기화 이력 조회
+        db.Index('ix_sync_history_device_created_at', 'device_id', 'created_at'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     device_id = db.Column(db.Integer, db.ForeignKey('device.id'), nullable=False)
     device = db.relationship('Device', backref='sync_histories')
@@ -153,6 +179,56 @@ class SyncHistory(db.Model):
     def __repr__(self):
         return f'<SyncHistory {self.sync_type} for device_id={self.device_id} at {self.created_at}>'
 
+class DeviceStats(db.Model):
+    """장비별 정책/객체 통계 (동기화 완료 시 갱신되는 요약 테이블)"""
+    id = db.Column(db.Integer, primary_key=True)
+    device_id = db.Column(db.Integer, db.ForeignKey('device.id'), nullable=False, unique=True)
+    device = db.relationship('Device', backref=db.backref('stats', uselist=False, cascade='all, delete-orphan'))
+    
+    # 정책 통계
+    policy_total = db.Column(db.Integer, nullable=False, default=0, comment='전체 정책 수')
+    policy_active = db.Column(db.Integer, nullable=False, default=0, comment='활성 정책 수')
+    policy_inactive = db.Column(db.Integer, nullable=False, default=0, comment='비활성 정책 수')
+    policy_allow = db.Column(db.Integer, nullable=False, default=0, comment='허용 정책 수')
+    policy_deny = db.Column(db.Integer, nullable=False, default=0, comment='차단 정책 수')
+    policy_unused = db.Column(db.Integer, nullable=False, default=0, comment='미사용 정책 수')
+    
+    # 객체 통계
+    network_object_count = db.Column(db.Integer, nullable=False, default=0, comment='네트워크 객체 수')
+    network_group_count = db.Column(db.Integer, nullable=False, default=0, comment='네트워크 그룹 수')
+    service_object_count = db.Column(db.Integer, nullable=False, default=0, comment='서비스 객체 수')
+    service_group_count = db.Column(db.Integer, nullable=False, default=0, comment='서비스 그룹 수')
+    
+    # 동기화 정보
+    last_sync_at = db.Column(db.DateTime, nullable=True, comment='마지막 동기화 시간')
+    updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
+    
+    def __repr__(self):
+        return f'<DeviceStats for device_id={self.device_id}>'
+    
+    @property
+    def policies(self):
+        """대시보드 형식의 정책 통계"""
+        return {
+            'total': self.policy_total or 0,
+            'active': self.policy_active or 0,
+            'inactive': self.policy_inactive or 0,
+            'allow': self.policy_allow or 0,
+            'deny': self.policy_deny or 0,
+            'unused': self.policy_unused or 0
+        }
+    
+    @property
+    def objects(self):
+        """대시보드 형식의 객체 통계"""
+        counts = {
+            'network': self.network_object_count or 0,
+            'network_group': self.network_group_count or 0,
+            'service': self.service_object_count or 0,
+            'service_group': self.service_group_count or 0
+        }
+        return {'total': sum(counts.values()), **counts}
+
 # 동기화 상태 및 우선순위 상수 정의
 SYNC_STATUS = {
     'PENDING': 'pending',      # 대기 중
@@ -170,6 +246,11 @@ SYNC_PRIORITY = {
 
 class SyncTask(db.Model):
     """동기화 작업 관리 모델"""
+    __table_args__ = (
+        # 대기 작업 선택(상태 → 우선순위 → 큐 위치), 장비별 작업 조회
+        db.Index('ix_sync_task_status_priority_queue_position', 'status', 'priority', 'queue_position'),
+        db.Index('ix_sync_task_device_status', 'device_id', 'status'),
+    )
     id = db.Column(db.Integer, primary_key=True)
     device_id = db.Column(db.Integer, db.ForeignKey('device.id'), nullable=False)
     device = db.relationship('Device', backref='sync_tasks')
@@ -2,6 +2,7 @@ from flask import render_template, request, redirect, url_for, flash
 from app import db
 from app.models import Device
 from app.routes.devices import devices_bp
+from app.services.dashboard_stats import invalidate_dashboard_stats
 
 @devices_bp.route('/create', methods=['GET', 'POST'])
 def create():
@@ -22,6 +23,7 @@ def create():
             )
             db.session.add(device)
             db.session.commit()
+            invalidate_dashboard_stats()
             flash('장비가 성공적으로 등록되었습니다.', 'success')
             return redirect(url_for('devices.index'))
         except ValueError as e:
@@ -50,6 +52,7 @@ def edit(id):
             if request.form['password']:  # 비밀번호는 입력시에만 업데이트
                 device.password = request.form['password']
             db.session.commit()
+            invalidate_dashboard_stats()
             flash('장비 정보가 수정되었습니다.', 'success')
             return redirect(url_for('devices.index'))
         except ValueError as e:
@@ -67,6 +70,7 @@ def delete(id):
     try:
         db.session.delete(device)
         db.session.commit()
+        invalidate_dashboard_stats()
         flash('장비가 삭제되었습니다.', 'success')
     except Exception as e:
         flash('장비 삭제 중 오류가 발생했습니다.', 'error')
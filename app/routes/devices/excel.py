@@ -7,6 +7,7 @@ import os
 from werkzeug.utils import secure_filename
 import tempfile
 from app.utils.excel import create_excel_template
+from app.services.dashboard_stats import invalidate_dashboard_stats
 
 @devices_bp.route('/upload-excel', methods=['POST'])
 def upload_excel():
@@ -103,6 +104,7 @@ def upload_excel():
         
         # 변경사항 저장
         db.session.commit()
+        invalidate_dashboard_stats()
         
         # 임시 파일 삭제
         os.remove(filepath)
@@ -1,8 +1,79 @@
 from flask import render_template, request, jsonify
+from sqlalchemy import func
 from app import db
-from app.models import Device, FirewallSystemInfo, SyncHistory, SyncTask
+from app.models import Device, DeviceStats, FirewallSystemInfo, SyncHistory, SyncTask
 from app.routes.devices import devices_bp
 
+def latest_per_device(model, device_ids, order_by, *criteria):
+    """장비별 최신 행 조회 (ROW_NUMBER 윈도 함수로 장비 수와 관계없이 쿼리 한 번)
+    
+    Args:
+        model: device_id 컬럼을 가진 모델
+        device_ids: 장비 ID 목록
+        order_by: 최신 행을 고르는 정렬 기준 목록
+        *criteria: 추가 조건
+        
+    Returns:
+        dict: {device_id: 모델 객체}
+    """
+    row_number = func.row_number().over(
+        partition_by=model.device_id,
+        order_by=[*order_by, model.id.desc()]
+    ).label('row_number')
+    ranked = db.session.query(model.id.label('id'), row_number).filter(
+        model.device_id.in_(device_ids), *criteria
+    ).subquery()
+    rows = model.query.join(ranked, model.id == ranked.c.id).filter(ranked.c.row_number == 1).all()
+    return {row.device_id: row for row in rows}
+
+def load_sync_info(devices, include_tasks=False):
+    """페이지에 표시할 장비들의 동기화 정보를 일정한 수의 쿼리로 조회
+    
+    Args:
+        devices: 장비 목록
+        include_tasks: 실행/대기 중인 작업과 최근 완료된 작업 포함 여부
+        
+    Returns:
+        dict: {device_id: {'system_info', 'last_sync', 'stats'[, 'active_task', 'last_task']}}
+    """
+    device_ids = [device.id for device in devices if device.category == 'firewall']
+    if not device_ids:
+        return {}
+    
+    # 시스템 정보 동기화 여부
+    system_infos = {info.device_id: info for info in
+                    FirewallSystemInfo.query.filter(FirewallSystemInfo.device_id.in_(device_ids)).all()}
+    
+    # 마지막 동기화 이력
+    last_syncs = latest_per_device(SyncHistory, device_ids, [SyncHistory.created_at.desc()])
+    
+    # 장비 통계 (요약 테이블)
+    device_stats = {stats.device_id: stats for stats in
+                    DeviceStats.query.filter(DeviceStats.device_id.in_(device_ids)).all()}
+    
+    active_tasks, last_tasks = {}, {}
+    if include_tasks:
+        # 현재 실행/대기 중인 작업
+        active_tasks = latest_per_device(SyncTask, device_ids, [SyncTask.created_at.desc()],
+                                         SyncTask.status.in_(['pending', 'running']))
+        # 최근 완료된 작업 (실행/대기 중인 작업이 없는 장비만)
+        idle_ids = [device_id for device_id in device_ids if device_id not in active_tasks]
+        if idle_ids:
+            last_tasks = latest_per_device(SyncTask, idle_ids, [SyncTask.completed_at.desc()],
+                                           SyncTask.status.in_(['completed', 'failed', 'canceled']))
+    
+    sync_info = {}
+    for device_id in device_ids:
+        sync_info[device_id] = {
+            'system_info': system_infos.get(device_id),
+            'last_sync': last_syncs.get(device_id),
+            'stats': device_stats.get(device_id)
+        }
+        if include_tasks:
+            sync_info[device_id]['active_task'] = active_tasks.get(device_id)
+            sync_info[device_id]['last_task'] = last_tasks.get(device_id)
+    return sync_info
+
 @devices_bp.route('/')
 def index():
     """장비 목록 조회"""
@@ -25,20 +96,8 @@ def index():
     pagination = query.paginate(page=page, per_page=per_page, error_out=False)
     devices = pagination.items
     
-    # 각 장비별 마지막 동기화 정보 조회
-    sync_info = {}
-    for device in devices:
-        if device.category == 'firewall':
-            # 시스템 정보 동기화 여부
-            system_info = FirewallSystemInfo.query.filter_by(device_id=device.id).first()
-            
-            # 마지막 동기화 이력
-            last_sync = SyncHistory.query.filter_by(device_id=device.id).order_by(SyncHistory.created_at.desc()).first()
-            
-            sync_info[device.id] = {
-                'system_info': system_info,
-                'last_sync': last_sync
-            }
+    # 각 장비별 마지막 동기화 정보 조회 (페이지의 장비를 한 번에 조회)
+    sync_info = load_sync_info(devices)
     
     # AJAX 요청인 경우 JSON 응답
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
@@ -80,36 +139,8 @@ def list_devices():
     pagination = query.paginate(page=page, per_page=per_page, error_out=False)
     devices = pagination.items
     
-    # 각 장비별 정보 조회
-    sync_info = {}
-    for device in devices:
-        if device.category == 'firewall':
-            # 시스템 정보 동기화 여부
-            system_info = FirewallSystemInfo.query.filter_by(device_id=device.id).first()
-            
-            # 마지막 동기화 이력
-            last_sync = SyncHistory.query.filter_by(device_id=device.id).order_by(SyncHistory.created_at.desc()).first()
-            
-            # 현재 실행/대기 중인 작업
-            active_task = SyncTask.query.filter(
-                SyncTask.device_id == device.id,
-                SyncTask.status.in_(['pending', 'running'])
-            ).order_by(SyncTask.created_at.desc()).first()
-            
-            # 최근 완료된 작업
-            last_task = None
-            if not active_task:
-                last_task = SyncTask.query.filter(
-                    SyncTask.device_id == device.id,
-                    SyncTask.status.in_(['completed', 'failed', 'canceled'])
-                ).order_by(SyncTask.completed_at.desc()).first()
-            
-            sync_info[device.id] = {
-                'system_info': system_info,
-                'last_sync': last_sync,
-                'active_task': active_task,
-                'last_task': last_task
-            }
+    # 각 장비별 정보 조회 (페이지의 장비를 한 번에 조회)
+    sync_info = load_sync_info(devices, include_tasks=True)
     
     # 테이블 내용과 페이지네이션 HTML 렌더링
     table_html = render_template('devices/_table.html',
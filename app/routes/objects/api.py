@@ -1,15 +1,23 @@
 import json
 from flask import request, jsonify, send_file
-from sqlalchemy import or_
 from app import db
 from app.models.firewall import FirewallNetworkObject, FirewallNetworkGroup, FirewallServiceObject, FirewallServiceGroup
 from app.models.device import Device
 from app.routes.objects import objects_bp
 from app.utils.pagination import get_pagination_info
 from app.utils.excel import generate_excel_file, get_excel_filename
+from app.services.search_index import search_condition, keyword_search_condition
 from datetime import datetime
 import io
 
+# 객체 유형별 검색 컬럼 (객체명/그룹명, 값/멤버)
+SEARCH_COLUMNS = {
+    'network': ['name', 'value'],
+    'network-group': ['group_name', 'entry'],
+    'service': ['name', 'port'],
+    'service-group': ['group_name', 'entry'],
+}
+
 @objects_bp.route('/api/list')
 def get_objects():
     """객체 목록 API"""
@@ -42,18 +50,8 @@ def get_objects():
     
     # 검색어 적용
     if search:
-        if object_type in ['network', 'service']:
-            query = query.filter(or_(
-                model.name.ilike(f'%{search}%'),  # 객체명 검색
-                model.device.has(Device.name.ilike(f'%{search}%')),  # 장비명 검색
-                model.value.ilike(f'%{search}%') if object_type == 'network' else model.port.ilike(f'%{search}%')  # 값 검색
-            ))
-        else:  # network-group, service-group
-            query = query.filter(or_(
-                model.group_name.ilike(f'%{search}%'),  # 그룹명 검색
-                model.device.has(Device.name.ilike(f'%{search}%')),  # 장비명 검색
-                model.entry.ilike(f'%{search}%')  # 멤버 값 검색
-            ))
+        # 장비명, 객체명/그룹명, 값/멤버 검색 (전문 검색)
+        query = query.filter(keyword_search_condition(model, SEARCH_COLUMNS[object_type], search))
     
     # 필터 적용
     for filter_item in filters:
@@ -82,7 +80,7 @@ def get_objects():
         elif field == 'name':
             if object_type in ['network', 'service']:
                 if operator == 'contains':
-                    query = query.filter(model.name.ilike(f'%{value}%'))
+                    query = query.filter(search_condition(model, ['name'], value))
                 elif operator == 'not_contains':
                     query = query.filter(~model.name.ilike(f'%{value}%'))
                 elif operator == 'equals':
@@ -95,7 +93,7 @@ def get_objects():
                     query = query.filter(model.name.ilike(f'%{value}'))
             else:  # network-group, service-group
                 if operator == 'contains':
-                    query = query.filter(model.group_name.ilike(f'%{value}%'))
+                    query = query.filter(search_condition(model, ['group_name'], value))
                 elif operator == 'not_contains':
                     query = query.filter(~model.group_name.ilike(f'%{value}%'))
                 elif operator == 'equals':
@@ -118,7 +116,7 @@ def get_objects():
         elif field == 'value':
             if object_type in ['network']:
                 if operator == 'contains':
-                    query = query.filter(model.value.ilike(f'%{value}%'))
+                    query = query.filter(search_condition(model, ['value'], value))
                 elif operator == 'not_contains':
                     query = query.filter(~model.value.ilike(f'%{value}%'))
                 elif operator == 'equals':
@@ -127,7 +125,7 @@ def get_objects():
                     query = query.filter(model.value != value)
             elif object_type in ['network-group', 'service-group']:
                 if operator == 'contains':
-                    query = query.filter(model.entry.ilike(f'%{value}%'))
+                    query = query.filter(search_condition(model, ['entry'], value))
                 elif operator == 'not_contains':
                     query = query.filter(~model.entry.ilike(f'%{value}%'))
         elif field == 'firewall_type':
@@ -223,18 +221,8 @@ def export_objects():
     
     # 검색어 적용
     if search:
-        if object_type in ['network', 'service']:
-            query = query.filter(or_(
-                model.name.ilike(f'%{search}%'),  # 객체명 검색
-                model.device.has(Device.name.ilike(f'%{search}%')),  # 장비명 검색
-                model.value.ilike(f'%{search}%') if object_type == 'network' else model.port.ilike(f'%{search}%')  # 값 검색
-            ))
-        else:  # network-group, service-group
-            query = query.filter(or_(
-                model.group_name.ilike(f'%{search}%'),  # 그룹명 검색
-                model.device.has(Device.name.ilike(f'%{search}%')),  # 장비명 검색
-                model.entry.ilike(f'%{search}%')  # 멤버 값 검색
-            ))
+        # 장비명, 객체명/그룹명, 값/멤버 검색 (전문 검색)
+        query = query.filter(keyword_search_condition(model, SEARCH_COLUMNS[object_type], search))
     
     # 필터 적용
     for filter_item in filters:
@@ -263,7 +251,7 @@ def export_objects():
         elif field == 'name':
             if object_type in ['network', 'service']:
                 if operator == 'contains':
-                    query = query.filter(model.name.ilike(f'%{value}%'))
+                    query = query.filter(search_condition(model, ['name'], value))
                 elif operator == 'not_contains':
                     query = query.filter(~model.name.ilike(f'%{value}%'))
                 elif operator == 'equals':
@@ -276,7 +264,7 @@ def export_objects():
                     query = query.filter(model.name.ilike(f'%{value}'))
             else:  # network-group, service-group
                 if operator == 'contains':
-                    query = query.filter(model.group_name.ilike(f'%{value}%'))
+                    query = query.filter(search_condition(model, ['group_name'], value))
                 elif operator == 'not_contains':
                     query = query.filter(~model.group_name.ilike(f'%{value}%'))
                 elif operator == 'equals':
@@ -299,7 +287,7 @@ def export_objects():
         elif field == 'value':
             if object_type in ['network']:
                 if operator == 'contains':
-                    query = query.filter(model.value.ilike(f'%{value}%'))
+                    query = query.filter(search_condition(model, ['value'], value))
                 elif operator == 'not_contains':
                     query = query.filter(~model.value.ilike(f'%{value}%'))
                 elif operator == 'equals':
@@ -308,7 +296,7 @@ def export_objects():
                     query = query.filter(model.value != value)
             elif object_type in ['network-group', 'service-group']:
                 if operator == 'contains':
-                    query = query.filter(model.entry.ilike(f'%{value}%'))
+                    query = query.filter(search_condition(model, ['entry'], value))
                 elif operator == 'not_contains':
                     query = query.filter(~model.entry.ilike(f'%{value}%'))
         elif field == 'firewall_type':
@@ -5,9 +5,14 @@ import pandas as pd
 import io
 from datetime import datetime
 from app.utils.excel import generate_excel_from_dataframe, get_excel_filename
+from app.services.search_index import search_condition, keyword_search_condition
 
 policies_bp = Blueprint('policies', __name__, url_prefix='/policies')
 
+# 검색어로 찾을 정책 컬럼 (규칙명, 출발지, 목적지, 서비스, 사용자, 애플리케이션, 가상시스템, 보안프로필, 카테고리)
+SEARCH_COLUMNS = ['rule_name', 'source', 'destination', 'service', 'user', 'application',
+                  'vsys', 'security_profile', 'category']
+
 @policies_bp.route('/', methods=['GET', 'POST'])
 def index():
     """정책 목록 조회"""
@@ -76,7 +81,7 @@ def index():
                 column = getattr(FirewallPolicy, field, None)
                 if column is not None:
                     if operator == 'contains':
-                        condition = column.ilike(f'%{value}%')
+                        condition = search_condition(FirewallPolicy, [field], value)
                     elif operator == 'not_contains':
                         condition = ~column.ilike(f'%{value}%')
                     elif operator == 'equals':
@@ -101,19 +106,8 @@ def index():
 
         # 검색 조건 (필터된 결과 내 검색)
         if search:
-            search_conditions = [
-                Device.name.ilike(f'%{search}%'),  # 장비명
-                FirewallPolicy.rule_name.ilike(f'%{search}%'),  # 규칙명
-                FirewallPolicy.source.ilike(f'%{search}%'),  # 출발지
-                FirewallPolicy.destination.ilike(f'%{search}%'),  # 목적지
-                FirewallPolicy.service.ilike(f'%{search}%'),  # 서비스
-                FirewallPolicy.user.ilike(f'%{search}%'),  # 사용자
-                FirewallPolicy.application.ilike(f'%{search}%'),  # 애플리케이션
-                FirewallPolicy.vsys.ilike(f'%{search}%'),  # 가상시스템
-                FirewallPolicy.security_profile.ilike(f'%{search}%'),  # 보안프로필
-                FirewallPolicy.category.ilike(f'%{search}%')  # 카테고리
-            ]
-            query = query.filter(db.or_(*search_conditions))
+            # 장비명 + 정책 컬럼 (전문 검색)
+            query = query.filter(keyword_search_condition(FirewallPolicy, SEARCH_COLUMNS, search))
         
         # 정렬 (순서 및 장비별)
         query = query.order_by(Device.name, FirewallPolicy.seq)
@@ -215,7 +209,7 @@ def export_excel():
                 column = getattr(FirewallPolicy, field, None)
                 if column is not None:
                     if operator == 'contains':
-                        condition = column.ilike(f'%{value}%')
+                        condition = search_condition(FirewallPolicy, [field], value)
                     elif operator == 'not_contains':
                         condition = ~column.ilike(f'%{value}%')
                     elif operator == 'equals':
@@ -240,19 +234,8 @@ def export_excel():
 
         # 검색 조건 (필터된 결과 내 검색)
         if search:
-            search_conditions = [
-                Device.name.ilike(f'%{search}%'),  # 장비명
-                FirewallPolicy.rule_name.ilike(f'%{search}%'),  # 규칙명
-                FirewallPolicy.source.ilike(f'%{search}%'),  # 출발지
-                FirewallPolicy.destination.ilike(f'%{search}%'),  # 목적지
-                FirewallPolicy.service.ilike(f'%{search}%'),  # 서비스
-                FirewallPolicy.user.ilike(f'%{search}%'),  # 사용자
-                FirewallPolicy.application.ilike(f'%{search}%'),  # 애플리케이션
-                FirewallPolicy.vsys.ilike(f'%{search}%'),  # 가상시스템
-                FirewallPolicy.security_profile.ilike(f'%{search}%'),  # 보안프로필
-                FirewallPolicy.category.ilike(f'%{search}%')  # 카테고리
-            ]
-            query = query.filter(db.or_(*search_conditions))
+            # 장비명 + 정책 컬럼 (전문 검색)
+            query = query.filter(keyword_search_condition(FirewallPolicy, SEARCH_COLUMNS, search))
         
         # 정렬 (순서 및 장비별)
         query = query.order_by(Device.name, FirewallPolicy.seq)
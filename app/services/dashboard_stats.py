@@ -0,0 +1,93 @@
+import threading
+import time
+from flask import current_app
+from app import db
+from app.models import Device, DeviceStats
+
+# 대시보드 통계 캐시 (동기화 작업 완료, 장비 등록/수정/삭제 시 무효화)
+_cache = {'data': None, 'expires_at': 0.0, 'generation': 0}
+_cache_lock = threading.Lock()
+
+
+def _empty_policy_counts():
+    return {'total': 0, 'active': 0, 'inactive': 0, 'allow': 0, 'deny': 0, 'unused': 0}
+
+
+def _empty_object_counts():
+    return {'total': 0, 'network': 0, 'network_group': 0, 'service': 0, 'service_group': 0}
+
+
+def build_dashboard_stats():
+    """
+    대시보드 통계 생성
+
+    동기화 시 갱신되는 DeviceStats 요약 테이블을 장비당 한 행씩만 읽으므로
+    정책/객체 수와 관계없이 쿼리 한 번으로 통계를 구성합니다.
+
+    Returns:
+        dict: 대시보드 템플릿에 전달할 통계 데이터
+    """
+    rows = db.session.query(Device.id, Device.name, Device.category, Device.sub_category, DeviceStats) \
+        .outerjoin(DeviceStats, DeviceStats.device_id == Device.id) \
+        .order_by(Device.id).all()
+
+    device_stats = []
+    policy_totals = _empty_policy_counts()
+    object_totals = _empty_object_counts()
+    for device_id, name, category, sub_category, stats in rows:
+        policies = stats.policies if stats else _empty_policy_counts()
+        objects = stats.objects if stats else _empty_object_counts()
+        for key, value in policies.items():
+            policy_totals[key] += value
+        for key, value in objects.items():
+            object_totals[key] += value
+        device_stats.append({
+            'id': device_id,
+            'name': name,
+            'category': category,
+            'sub_category': sub_category,
+            'policies': policies,
+            'objects': objects,
+            'last_sync_at': stats.last_sync_at if stats else None
+        })
+
+    return {
+        'devices': {
+            'total': len(rows)
+        },
+        'policies': policy_totals,
+        'objects': object_totals,
+        'device_stats': device_stats
+    }
+
+
+def get_dashboard_stats():
+    """
+    캐시된 대시보드 통계 조회 (캐시가 없거나 만료되었으면 새로 집계)
+
+    Returns:
+        dict: 대시보드 통계 데이터
+    """
+    ttl = current_app.config.get('DASHBOARD_STATS_CACHE_TTL', 300)
+    with _cache_lock:
+        if _cache['data'] is not None and time.monotonic() < _cache['expires_at']:
+            return _cache['data']
+        generation = _cache['generation']
+
+    data = build_dashboard_stats()
+    with _cache_lock:
+        # 집계 중에 무효화되었다면 이전 데이터일 수 있으므로 캐시에 저장하지 않음
+        if _cache['generation'] == generation:
+            _cache['data'] = data
+            _cache['expires_at'] = time.monotonic() + ttl
+    return data
+
+
+def invalidate_dashboard_stats():
+    """
+    대시보드 통계 캐시 무효화 (동기화 작업 완료 등 데이터 변경 시 호출)
+    """
+    with _cache_lock:
+        _cache['data'] = None
+        _cache['expires_at'] = 0.0
+        _cache['generation'] += 1
@@ -0,0 +1,319 @@
+from datetime import datetime
+from flask import current_app
+from sqlalchemy import insert, update, delete, select, bindparam
+import hashlib
+import pandas as pd
+from app import db
+from app.models import (
+    FirewallPolicy,
+    FirewallNetworkObject,
+    FirewallNetworkGroup,
+    FirewallServiceObject,
+    FirewallServiceGroup
+)
+
+# 한 번에 실행할 기본 INSERT 행 수
+DEFAULT_CHUNK_SIZE = 1000
+
+# 수집기 DataFrame 컬럼 -> 모델 필드 매핑
+# (정책은 컬럼명을 필드명으로 변환하여 매핑하므로 여기에 정의하지 않습니다)
+COLUMN_MAPS = {
+    FirewallNetworkObject: {'Name': 'name', 'Type': 'type', 'Value': 'value'},
+    FirewallNetworkGroup: {'Group Name': 'group_name', 'Entry': 'entry'},
+    FirewallServiceObject: {'Name': 'name', 'Protocol': 'protocol', 'Port': 'port'},
+    FirewallServiceGroup: {'Group Name': 'group_name', 'Entry': 'entry'},
+}
+
+# 값이 없을 때 빈 문자열로 채울 필드 (NOT NULL 컬럼)
+REQUIRED_TEXT_FIELDS = {
+    FirewallPolicy: ['rule_name'],
+    FirewallNetworkObject: ['name', 'type', 'value'],
+    FirewallNetworkGroup: ['group_name', 'entry'],
+    FirewallServiceObject: ['name', 'protocol'],
+    FirewallServiceGroup: ['group_name', 'entry'],
+}
+
+# 동기화 시 DataFrame 값으로 덮어쓰지 않는 필드
+RESERVED_FIELDS = {'id', 'device_id', 'firewall_type', 'last_sync_at', 'content_hash'}
+
+# 증분 동기화에서 행을 식별하는 자연 키
+NATURAL_KEYS = {
+    FirewallPolicy: ('rule_name', 'vsys'),
+    FirewallNetworkObject: ('name',),
+    FirewallNetworkGroup: ('group_name',),
+    FirewallServiceObject: ('name', 'protocol'),
+    FirewallServiceGroup: ('group_name',),
+}
+
+# 동기화 방식 (incremental: 변경분만 반영, full: 전체 삭제 후 재저장)
+SYNC_MODES = ('incremental', 'full')
+
+def get_chunk_size():
+    """설정된 대량 저장 청크 크기를 반환합니다.
+
+    Returns:
+        int: 청크 크기
+    """
+    try:
+        return int(current_app.config.get('SYNC_BULK_CHUNK_SIZE', DEFAULT_CHUNK_SIZE))
+    except RuntimeError:
+        # 애플리케이션 컨텍스트 밖에서 호출된 경우
+        return DEFAULT_CHUNK_SIZE
+
+def get_sync_mode():
+    """설정된 동기화 방식을 반환합니다.
+
+    Returns:
+        str: 'incremental' 또는 'full'
+    """
+    try:
+        mode = current_app.config.get('SYNC_MODE', 'incremental')
+    except RuntimeError:
+        mode = 'incremental'
+    return mode if mode in SYNC_MODES else 'incremental'
+
+def get_column_map(model, columns):
+    """DataFrame 컬럼과 모델 필드의 매핑을 반환합니다.
+
+    Args:
+        model: 저장할 모델 클래스
+        columns: DataFrame 컬럼 목록
+
+    Returns:
+        dict: {DataFrame 컬럼: 모델 필드}
+    """
+    if model in COLUMN_MAPS:
+        return {column: field for column, field in COLUMN_MAPS[model].items() if column in columns}
+
+    # 컬럼명을 필드명으로 변환 (예: 'Rule Name' -> 'rule_name')
+    table_columns = set(model.__table__.columns.keys()) - RESERVED_FIELDS
+    column_map = {}
+    for column in columns:
+        field_name = str(column).lower().replace(' ', '_')
+        if field_name in table_columns:
+            column_map[column] = field_name
+    return column_map
+
+def dataframe_to_records(model, df, device):
+    """수집기 DataFrame을 모델 컬럼 기준의 딕셔너리 리스트로 변환합니다.
+
+    Args:
+        model: 저장할 모델 클래스
+        df: 수집기 DataFrame
+        device: 장비 객체
+
+    Returns:
+        list: INSERT에 사용할 딕셔너리 리스트
+    """
+    if df is None or df.empty:
+        return []
+
+    column_map = get_column_map(model, df.columns)
+    frame = df[list(column_map.keys())].rename(columns=column_map)
+
+    # NaN -> None, numpy 타입 -> 파이썬 기본 타입
+    frame = frame.astype(object).where(pd.notna(frame), None)
+
+    # 필수 텍스트 필드 보정
+    for field in REQUIRED_TEXT_FIELDS.get(model, []):
+        if field not in frame.columns:
+            frame[field] = ''
+        else:
+            frame[field] = frame[field].map(lambda value: '' if value is None else str(value))
+
+    frame['device_id'] = device.id
+    frame['firewall_type'] = device.sub_category
+    return frame.to_dict('records')
+
+def bulk_insert(model, records, chunk_size=None):
+    """딕셔너리 리스트를 청크 단위 executemany INSERT로 저장합니다.
+
+    커밋은 호출 측에서 수행합니다.
+
+    Args:
+        model: 저장할 모델 클래스
+        records: 저장할 딕셔너리 리스트
+        chunk_size: 한 번에 실행할 행 수 (기본: SYNC_BULK_CHUNK_SIZE 설정값)
+
+    Returns:
+        int: 저장된 행 수
+    """
+    if not records:
+        return 0
+
+    chunk_size = chunk_size or get_chunk_size()
+    statement = insert(model.__table__)
+    for start in range(0, len(records), chunk_size):
+        db.session.execute(statement, records[start:start + chunk_size])
+    return len(records)
+
+def bulk_update(model, records, chunk_size=None):
+    """'_id' 키로 행을 지정한 딕셔너리 리스트를 청크 단위 executemany UPDATE로 반영합니다.
+
+    커밋은 호출 측에서 수행합니다.
+
+    Args:
+        model: 갱신할 모델 클래스
+        records: '_id'(대상 행 ID)와 갱신할 필드를 담은 딕셔너리 리스트 (모두 같은 키 구성)
+        chunk_size: 한 번에 실행할 행 수 (기본: SYNC_BULK_CHUNK_SIZE 설정값)
+
+    Returns:
+        int: 갱신 요청한 행 수
+    """
+    if not records:
+        return 0
+
+    chunk_size = chunk_size or get_chunk_size()
+    table = model.__table__
+    statement = update(table).where(table.c.id == bindparam('_id'))
+    for start in range(0, len(records), chunk_size):
+        db.session.execute(statement, records[start:start + chunk_size])
+    return len(records)
+
+def replace_device_rows(model, df, device, chunk_size=None):
+    """장비의 기존 행을 삭제하고 DataFrame 내용을 대량 저장합니다.
+
+    Args:
+        model: 저장할 모델 클래스
+        df: 수집기 DataFrame
+        device: 장비 객체
+        chunk_size: 한 번에 실행할 행 수
+
+    Returns:
+        int: 저장된 행 수
+    """
+    records = add_content_hashes(dataframe_to_records(model, df, device))
+    model.query.filter_by(device_id=device.id).delete()
+    return bulk_insert(model, records, chunk_size)
+
+def compute_content_hashes(records, fields):
+    """레코드별 내용 해시(SHA-1)를 계산합니다.
+
+    Args:
+        records: 레코드 딕셔너리 리스트
+        fields: 해시에 포함할 필드 목록
+
+    Returns:
+        list: 레코드 순서와 같은 해시 문자열 리스트
+    """
+    hashes = []
+    for record in records:
+        content = '\x1f'.join('\x00' if record.get(field) is None else str(record.get(field)) for field in fields)
+        hashes.append(hashlib.sha1(content.encode('utf-8')).hexdigest())
+    return hashes
+
+def add_content_hashes(records):
+    """레코드에 content_hash 필드를 추가합니다.
+
+    Args:
+        records: dataframe_to_records 반환값
+
+    Returns:
+        list: content_hash가 추가된 레코드 리스트
+    """
+    content_fields = sorted({field for record in records[:1] for field in record} - RESERVED_FIELDS)
+    for record, content_hash in zip(records, compute_content_hashes(records, content_fields)):
+        record['content_hash'] = content_hash
+    return records
+
+def _keyed_by_occurrence(keys):
+    """같은 자연 키가 여러 번 나오면 등장 순번을 붙여 고유한 키로 만듭니다."""
+    seen = {}
+    result = []
+    for key in keys:
+        occurrence = seen.get(key, 0)
+        seen[key] = occurrence + 1
+        result.append((key, occurrence))
+    return result
+
+def sync_device_rows(model, df, device, chunk_size=None):
+    """자연 키와 내용 해시를 비교하여 변경된 행만 INSERT/UPDATE/DELETE 합니다.
+
+    커밋은 호출 측에서 수행합니다.
+
+    Args:
+        model: 저장할 모델 클래스
+        df: 수집기 DataFrame
+        device: 장비 객체
+        chunk_size: 한 번에 실행할 행 수
+
+    Returns:
+        dict: {'inserted', 'updated', 'deleted', 'unchanged'} 건수
+    """
+    chunk_size = chunk_size or get_chunk_size()
+    table = model.__table__
+    key_fields = NATURAL_KEYS[model]
+
+    records = add_content_hashes(dataframe_to_records(model, df, device))
+
+    # 저장된 행의 자연 키와 해시를 한 번에 조회
+    key_columns = [table.c[field] for field in key_fields]
+    existing_rows = db.session.execute(
+        select(table.c.id, table.c.content_hash, *key_columns)
+        .where(table.c.device_id == device.id)
+        .order_by(table.c.id)
+    ).all()
+    existing = dict(zip(
+        _keyed_by_occurrence(tuple(row[2:]) for row in existing_rows),
+        ((row[0], row[1]) for row in existing_rows)
+    ))
+
+    incoming_keys = _keyed_by_occurrence(tuple(record.get(field) for field in key_fields) for record in records)
+
+    inserts = []
+    updates = []
+    unchanged = 0
+    now = datetime.now()
+    for key, record in zip(incoming_keys, records):
+        stored = existing.pop(key, None)
+        if stored is None:
+            inserts.append(record)
+        elif stored[1] != record['content_hash']:
+            updates.append(dict(record, _id=stored[0], last_sync_at=now))
+        else:
+            unchanged += 1
+    delete_ids = [row_id for row_id, _ in existing.values()]
+
+    for start in range(0, len(delete_ids), chunk_size):
+        db.session.execute(delete(table).where(table.c.id.in_(delete_ids[start:start + chunk_size])))
+
+    bulk_update(model, updates, chunk_size)
+    bulk_insert(model, inserts, chunk_size)
+
+    return {
+        'inserted': len(inserts),
+        'updated': len(updates),
+        'deleted': len(delete_ids),
+        'unchanged': unchanged
+    }
+
+def write_device_rows(model, df, device, chunk_size=None):
+    """설정된 동기화 방식(SYNC_MODE)에 따라 장비 데이터를 저장합니다.
+
+    Args:
+        model: 저장할 모델 클래스
+        df: 수집기 DataFrame
+        device: 장비 객체
+        chunk_size: 한 번에 실행할 행 수
+
+    Returns:
+        dict: {'inserted', 'updated', 'deleted', 'unchanged'} 건수
+    """
+    if get_sync_mode() == 'incremental':
+        return sync_device_rows(model, df, device, chunk_size)
+
+    deleted = model.query.filter_by(device_id=device.id).count()
+    inserted = replace_device_rows(model, df, device, chunk_size)
+    return {'inserted': inserted, 'updated': 0, 'deleted': deleted, 'unchanged': 0}
+
+def format_change_summary(counts):
+    """동기화 변경 건수를 이력 메시지용 문자열로 변환합니다.
+
+    Args:
+        counts: write_device_rows 반환값
+
+    Returns:
+        str: 예) '(추가 3, 변경 1, 삭제 0, 유지 120)'
+    """
+    return (f"(추가 {counts['inserted']}, 변경 {counts['updated']}, "
+            f"삭제 {counts['deleted']}, 유지 {counts['unchanged']})")
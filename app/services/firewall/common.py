@@ -1,13 +1,19 @@
 from app import db
 from app.models import Device, SyncHistory
 from app.firewall_module.collector_factory import FirewallCollectorFactory
+import threading
 import uuid
 
-def get_device_and_collector(device_id):
+# 동기화 결과 DB 저장 잠금
+# 장비 데이터 수집은 동시에 진행하되, DB 쓰기(삭제/저장/커밋)는 한 번에 하나만 수행합니다.
+db_write_lock = threading.RLock()
+
+def get_device_and_collector(device_id, batch_id=None):
     """장비 정보와 수집기를 가져옵니다.
     
     Args:
         device_id: 장비 ID
+        batch_id: 배치 동기화 ID (같은 배치의 수집기끼리 설정 스냅샷 등을 공유)
         
     Returns:
         tuple: (device, collector) 또는 (None, None, error_message)
@@ -20,6 +26,8 @@ def get_device_and_collector(device_id):
         # 방화벽 Collector 생성
         collector = FirewallCollectorFactory.get_collector(
             device.sub_category,
+            batch_id=batch_id,
+            device_id=device.id,
             **device.get_connection_config()
         )
         return device, collector, None
@@ -75,14 +83,15 @@ def handle_sync_exception(device_id, sync_type, exception, is_batch=False, batch
     db.session.rollback()
     
     # 오류 이력 저장
-    create_sync_history(
-        device_id=device_id,
-        sync_type=sync_type,
-        status='failed',
-        message=str(exception),
-        is_batch=is_batch,
-        batch_id=batch_id
-    )
-    db.session.commit()
+    with db_write_lock:
+        create_sync_history(
+            device_id=device_id,
+            sync_type=sync_type,
+            status='failed',
+            message=str(exception),
+            is_batch=is_batch,
+            batch_id=batch_id
+        )
+        db.session.commit()
     
     return False, f'동기화 중 오류 발생: {str(exception)}' 
\ No newline at end of file
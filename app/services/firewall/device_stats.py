@@ -0,0 +1,142 @@
+from datetime import datetime
+from sqlalchemy import case, event, func
+from sqlalchemy.orm import Session
+from app import db
+from app.models import (
+    Device,
+    DeviceStats,
+    FirewallPolicy,
+    FirewallNetworkObject,
+    FirewallNetworkGroup,
+    FirewallServiceObject,
+    FirewallServiceGroup
+)
+
+# 미사용 정책 판단 값 (usage_logs 동기화의 미사용여부)
+UNUSED_STATUS = '미사용'
+
+# 객체 동기화 유형별 테이블과 통계 컬럼
+OBJECT_STATS = {
+    'network_objects': (FirewallNetworkObject, 'network_object_count'),
+    'network_groups': (FirewallNetworkGroup, 'network_group_count'),
+    'service_objects': (FirewallServiceObject, 'service_object_count'),
+    'service_groups': (FirewallServiceGroup, 'service_group_count'),
+}
+
+# 정책 통계를 갱신하는 동기화 유형
+POLICY_SYNC_TYPES = ('security_rules', 'usage_logs')
+
+def _policy_columns():
+    """정책 통계 집계 컬럼 (장비 조건/GROUP BY는 호출 측에서 지정)"""
+    return (
+        func.count(FirewallPolicy.id),
+        func.sum(case((FirewallPolicy.enable == 'Y', 1), else_=0)),
+        func.sum(case((FirewallPolicy.action.like('%allow%'), 1), else_=0)),
+        func.sum(case((FirewallPolicy.action.like('%deny%'), 1), else_=0)),
+        func.sum(case((FirewallPolicy.usage_status == UNUSED_STATUS, 1), else_=0))
+    )
+
+def _apply_policy_counts(stats, row):
+    """집계 결과를 통계 행에 반영합니다."""
+    total, active, allow, deny, unused = (int(value or 0) for value in row)
+    stats.policy_total = total
+    stats.policy_active = active
+    stats.policy_inactive = total - active
+    stats.policy_allow = allow
+    stats.policy_deny = deny
+    stats.policy_unused = unused
+
+def _get_or_create_stats(device_id):
+    """장비의 통계 행을 조회하고 없으면 생성합니다."""
+    stats = DeviceStats.query.filter_by(device_id=device_id).first()
+    if not stats:
+        stats = DeviceStats(device_id=device_id)
+        db.session.add(stats)
+    return stats
+
+def refresh_device_stats(device_id, sync_types=None):
+    """장비 통계를 갱신합니다.
+
+    동기화 서비스가 결과 저장 직후 같은 트랜잭션 안에서 호출하며, 커밋은 호출 측에서 수행합니다.
+    동기화 유형에 해당하는 테이블만 다시 집계합니다.
+
+    Args:
+        device_id: 장비 ID
+        sync_types: 갱신할 동기화 유형 목록 (None이면 전체)
+
+    Returns:
+        DeviceStats: 갱신된 통계 객체
+    """
+    if sync_types is None:
+        sync_types = POLICY_SYNC_TYPES + tuple(OBJECT_STATS)
+
+    stats = _get_or_create_stats(device_id)
+
+    if any(sync_type in POLICY_SYNC_TYPES for sync_type in sync_types):
+        row = db.session.query(*_policy_columns()).filter(FirewallPolicy.device_id == device_id).one()
+        _apply_policy_counts(stats, row)
+
+    for sync_type in sync_types:
+        if sync_type in OBJECT_STATS:
+            model, column = OBJECT_STATS[sync_type]
+            count = db.session.query(func.count(model.id)).filter(model.device_id == device_id).scalar()
+            setattr(stats, column, count or 0)
+
+    stats.last_sync_at = datetime.now()
+    return stats
+
+def rebuild_all_device_stats(session=None):
+    """모든 장비의 통계를 다시 계산합니다. (통계 행이 없는 기존 데이터 보정용)
+
+    테이블별 GROUP BY 집계 한 번으로 모든 장비의 통계를 계산합니다. 커밋은 호출 측에서 수행합니다.
+
+    Args:
+        session: 사용할 세션 (None이면 db.session)
+
+    Returns:
+        int: 갱신된 장비 수
+    """
+    session = session or db.session
+    policy_rows = session.query(FirewallPolicy.device_id, *_policy_columns()).group_by(FirewallPolicy.device_id).all()
+    policy_counts = {row[0]: row[1:] for row in policy_rows}
+
+    object_counts = {}
+    for model, column in OBJECT_STATS.values():
+        for device_id, count in session.query(model.device_id, func.count(model.id)).group_by(model.device_id).all():
+            object_counts.setdefault(device_id, {})[column] = count
+
+    existing = {stats.device_id: stats for stats in session.query(DeviceStats).all()}
+    device_ids = [device_id for device_id, in session.query(Device.id).all()]
+    for device_id in device_ids:
+        stats = existing.get(device_id)
+        if not stats:
+            stats = DeviceStats(device_id=device_id)
+            session.add(stats)
+        _apply_policy_counts(stats, policy_counts.get(device_id, (0, 0, 0, 0, 0)))
+        for _, column in OBJECT_STATS.values():
+            setattr(stats, column, object_counts.get(device_id, {}).get(column, 0))
+
+    return len(device_ids)
+
+def backfill_device_stats(connection):
+    """장비는 있는데 통계 행이 하나도 없으면 기존 데이터로 통계를 채웁니다.
+
+    db.create_all()로 통계 테이블을 새로 만든 기존 설치본(마이그레이션 미사용)에서
+    대시보드/장비 목록이 동기화 전까지 0건으로 표시되지 않도록 create_all 직후 호출됩니다.
+
+    Args:
+        connection: SQLAlchemy 연결 (호출 측 트랜잭션에서 저장)
+
+    Returns:
+        int: 채운 장비 수
+    """
+    with Session(bind=connection) as session:
+        if session.query(DeviceStats.id).first() is not None or session.query(Device.id).first() is None:
+            return 0
+        count = rebuild_all_device_stats(session)
+        session.flush()
+        return count
+
+@event.listens_for(db.metadata, 'after_create')
+def _backfill_device_stats(target, connection, **kw):
+    backfill_device_stats(connection)
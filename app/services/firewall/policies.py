@@ -1,6 +1,8 @@
 from app import db
 from app.models import FirewallPolicy
-from app.services.firewall.common import get_device_and_collector, create_sync_history, handle_sync_exception
+from app.services.firewall.common import get_device_and_collector, create_sync_history, handle_sync_exception, db_write_lock
+from app.services.firewall.device_stats import refresh_device_stats
+from app.services.firewall.bulk_writer import write_device_rows, format_change_summary
 
 def sync_firewall_policies(device_id, is_batch=False, batch_id=None):
     """방화벽 정책을 동기화합니다.
@@ -14,7 +16,7 @@ def sync_firewall_policies(device_id, is_batch=False, batch_id=None):
         tuple: (success, message)
     """
     # 장비 및 수집기 가져오기
-    device, collector, error = get_device_and_collector(device_id)
+    device, collector, error = get_device_and_collector(device_id, batch_id)
     if error:
         return False, error
     
@@ -22,41 +24,26 @@ def sync_firewall_policies(device_id, is_batch=False, batch_id=None):
         # 정책 가져오기
         policies_df = collector.export_security_rules()
         
-        # 기존 정책 삭제
-        FirewallPolicy.query.filter_by(device_id=device.id).delete()
+        # DB 쓰기는 다른 동기화 작업과 겹치지 않도록 직렬화
+        with db_write_lock:
+            # 변경된 정책만 반영 (SYNC_MODE=full이면 삭제 후 재저장)
+            counts = write_device_rows(FirewallPolicy, policies_df, device)
+            message = f'{len(policies_df)} 개의 정책을 동기화했습니다. {format_change_summary(counts)}'
         
-        # 새 정책 저장
-        for _, row in policies_df.iterrows():
-            policy = FirewallPolicy(
+            # 동기화 이력 저장
+            create_sync_history(
                 device_id=device.id,
-                firewall_type=device.sub_category
+                sync_type='security_rules',
+                status='success',
+                message=message,
+                is_batch=is_batch,
+                batch_id=batch_id
             )
-            
-            # DataFrame의 컬럼을 모델 필드에 매핑
-            for column in policies_df.columns:
-                # 컬럼명을 필드명으로 변환 (예: 'Rule Name' -> 'rule_name')
-                field_name = column.lower().replace(' ', '_')
-                
-                # 특수 케이스 처리
-                if column == 'Rule Name':
-                    policy.rule_name = row.get(column, '')
-                elif hasattr(policy, field_name):
-                    setattr(policy, field_name, row.get(column))
-            
-            db.session.add(policy)
+            # 장비 통계도 같은 트랜잭션에서 갱신
+            refresh_device_stats(device.id, ['security_rules'])
+            db.session.commit()
         
-        # 동기화 이력 저장
-        create_sync_history(
-            device_id=device.id,
-            sync_type='security_rules',
-            status='success',
-            message=f'{len(policies_df)} 개의 정책을 동기화했습니다.',
-            is_batch=is_batch,
-            batch_id=batch_id
-        )
-        db.session.commit()
-        
-        return True, f'{len(policies_df)} 개의 정책을 동기화했습니다.'
+        return True, message
     
     except Exception as e:
         # 예외 처리 시에도 배치 정보 전달
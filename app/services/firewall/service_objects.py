@@ -1,6 +1,8 @@
 from app import db
 from app.models import FirewallServiceObject, FirewallServiceGroup
-from app.services.firewall.common import get_device_and_collector, create_sync_history, handle_sync_exception
+from app.services.firewall.common import get_device_and_collector, create_sync_history, handle_sync_exception, db_write_lock
+from app.services.firewall.device_stats import refresh_device_stats
+from app.services.firewall.bulk_writer import write_device_rows, format_change_summary
 
 def sync_service_objects(device_id, is_batch=False, batch_id=None):
     """방화벽 서비스 객체를 동기화합니다.
@@ -14,7 +16,7 @@ def sync_service_objects(device_id, is_batch=False, batch_id=None):
         tuple: (success, message)
     """
     # 장비 및 수집기 가져오기
-    device, collector, error = get_device_and_collector(device_id)
+    device, collector, error = get_device_and_collector(device_id, batch_id)
     if error:
         return False, error
     
@@ -22,32 +24,26 @@ def sync_service_objects(device_id, is_batch=False, batch_id=None):
         # 서비스 객체 가져오기
         objects_df = collector.export_service_objects()
         
-        # 기존 객체 삭제
-        FirewallServiceObject.query.filter_by(device_id=device.id).delete()
+        # DB 쓰기는 다른 동기화 작업과 겹치지 않도록 직렬화
+        with db_write_lock:
+            # 변경된 객체만 반영 (SYNC_MODE=full이면 삭제 후 재저장)
+            counts = write_device_rows(FirewallServiceObject, objects_df, device)
+            message = f'{len(objects_df)} 개의 서비스 객체를 동기화했습니다. {format_change_summary(counts)}'
         
-        # 새 객체 저장
-        for _, row in objects_df.iterrows():
-            obj = FirewallServiceObject(
+            # 동기화 이력 저장
+            create_sync_history(
                 device_id=device.id,
-                firewall_type=device.sub_category,
-                name=row.get('Name', ''),
-                protocol=row.get('Protocol', ''),
-                port=row.get('Port', '')
+                sync_type='service_objects',
+                status='success',
+                message=message,
+                is_batch=is_batch,
+                batch_id=batch_id
             )
-            db.session.add(obj)
+            # 장비 통계도 같은 트랜잭션에서 갱신
+            refresh_device_stats(device.id, ['service_objects'])
+            db.session.commit()
         
-        # 동기화 이력 저장
-        create_sync_history(
-            device_id=device.id,
-            sync_type='service_objects',
-            status='success',
-            message=f'{len(objects_df)} 개의 서비스 객체를 동기화했습니다.',
-            is_batch=is_batch,
-            batch_id=batch_id
-        )
-        db.session.commit()
-        
-        return True, f'{len(objects_df)} 개의 서비스 객체를 동기화했습니다.'
+        return True, message
     
     except Exception as e:
         # 예외 처리 시에도 배치 정보 전달
@@ -68,7 +64,7 @@ def sync_service_groups(device_id, is_batch=False, batch_id=None):
         tuple: (success, message)
     """
     # 장비 및 수집기 가져오기
-    device, collector, error = get_device_and_collector(device_id)
+    device, collector, error = get_device_and_collector(device_id, batch_id)
     if error:
         return False, error
     
@@ -76,31 +72,26 @@ def sync_service_groups(device_id, is_batch=False, batch_id=None):
         # 서비스 그룹 가져오기
         groups_df = collector.export_service_group_objects()
         
-        # 기존 그룹 삭제
-        FirewallServiceGroup.query.filter_by(device_id=device.id).delete()
+        # DB 쓰기는 다른 동기화 작업과 겹치지 않도록 직렬화
+        with db_write_lock:
+            # 변경된 그룹만 반영 (SYNC_MODE=full이면 삭제 후 재저장)
+            counts = write_device_rows(FirewallServiceGroup, groups_df, device)
+            message = f'{len(groups_df)} 개의 서비스 그룹을 동기화했습니다. {format_change_summary(counts)}'
         
-        # 새 그룹 저장
-        for _, row in groups_df.iterrows():
-            group = FirewallServiceGroup(
+            # 동기화 이력 저장
+            create_sync_history(
                 device_id=device.id,
-                firewall_type=device.sub_category,
-                group_name=row.get('Name', ''),
-                entry=row.get('Members', '')
+                sync_type='service_groups',
+                status='success',
+                message=message,
+                is_batch=is_batch,
+                batch_id=batch_id
             )
-            db.session.add(group)
-        
-        # 동기화 이력 저장
-        create_sync_history(
-            device_id=device.id,
-            sync_type='service_groups',
-            status='success',
-            message=f'{len(groups_df)} 개의 서비스 그룹을 동기화했습니다.',
-            is_batch=is_batch,
-            batch_id=batch_id
-        )
-        db.session.commit()
+            # 장비 통계도 같은 트랜잭션에서 갱신
+            refresh_device_stats(device.id, ['service_groups'])
+            db.session.commit()
         
-        return True, f'{len(groups_df)} 개의 서비스 그룹을 동기화했습니다.'
+        return True, message
     
     except Exception as e:
         # 예외 처리 시에도 배치 정보 전달
@@ -1,12 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from flask import current_app
 from app import db
 from app.models import Device, SyncHistory, SyncTask, SYNC_STATUS
-from app.services.firewall.common import generate_batch_id
+from app.services.firewall.common import generate_batch_id, create_sync_history, db_write_lock
 from app.services.firewall.sync_queue import SyncQueueService
 from app.services.firewall.system_info import sync_system_info
 from app.services.firewall.policies import sync_firewall_policies
 from app.services.firewall.network_objects import sync_network_objects, sync_network_groups
 from app.services.firewall.service_objects import sync_service_objects, sync_service_groups
 from app.services.firewall.usage_logs import sync_usage_logs
+from app.firewall_module.collector_factory import FirewallCollectorFactory
+import time
 import uuid
 import logging
 
@@ -34,6 +38,15 @@ SYNC_WEIGHTS = {
     SYNC_TYPES['USAGE_LOGS']: 5        # 사용 이력은 읽기 작업 위주로 비교적 빠름
 }
 
+# 동기화 타입별 선행 작업 (선행 작업이 성공한 후에 시작, 실패하면 건너뜀)
+SYNC_DEPENDENCIES = {
+    SYNC_TYPES['USAGE_LOGS']: [SYNC_TYPES['POLICIES']]  # 사용 이력은 저장된 정책을 갱신
+}
+
+# 작업 완료 처리 재시도 횟수와 간격 (초)
+COMPLETE_RETRY_COUNT = 3
+COMPLETE_RETRY_DELAY = 1
+
 def sync_all(device_id, days=90):
     """
     모든 항목 동기화 (큐에 작업 추가)
@@ -91,99 +104,290 @@ class SyncManager:
     """동기화 작업 관리자"""
     
     @classmethod
-    def process_task(cls, task_id):
+    def process_task(cls, task_id, already_started=False):
         """
         동기화 작업 처리
         
         Args:
             task_id (int): 작업 ID
+            already_started (bool): 워커가 claim_next_task로 이미 선점한 작업인지 여부
             
         Returns:
             tuple: (성공 여부, 메시지)
         """
         # 작업 시작
-        success, task = SyncQueueService.start_task(task_id)
-        if not success:
-            return False, task
+        if already_started:
+            task = SyncTask.query.get(task_id)
+            if not task or task.status != SYNC_STATUS['RUNNING']:
+                return False, "실행 중인 작업이 아닙니다."
+        else:
+            success, task = SyncQueueService.start_task(task_id)
+            if not success:
+                return False, task
+        
+        # 배치 ID 생성 또는 사용
+        batch_id = task.batch_id or str(uuid.uuid4())
         
         try:
             # 장비 정보 조회
             device = Device.query.get(task.device_id)
             if not device:
-                SyncQueueService.complete_task(task_id, False, "존재하지 않는 장비입니다.")
+                cls._complete_task(task_id, False, "존재하지 않는 장비입니다.")
                 return False, "존재하지 않는 장비입니다."
                 
             # 동기화 유형 목록 파싱
             sync_types = task.sync_types.split(',')
             
-            # 전체 가중치 계산
-            total_weight = sum(SYNC_WEIGHTS.get(sync_type, 10) for sync_type in sync_types)
+            # 동기화 유형별 가중치 및 전체 가중치 계산
+            weights = {sync_type: SYNC_WEIGHTS.get(sync_type, 10) for sync_type in sync_types}
+            total_weight = sum(weights.values())
             current_weight = 0
             
-            # 배치 ID 생성 또는 사용
-            batch_id = task.batch_id or str(uuid.uuid4())
-            
-            # 각 동기화 유형별 처리
+            # 선행 유형이 끝난 동기화 유형부터 스레드 풀에서 동시에 수행
+            # (장비 데이터 수집은 겹쳐서 진행하고, DB 쓰기는 db_write_lock으로 직렬화됩니다)
             all_success = True
+            canceled = False
+            pending = list(sync_types)
+            completed = set()
+            failed = set()
+            running = {}
+            app = current_app._get_current_object()
             
-            for sync_type in sync_types:
-                # 취소 확인
-                updated_task = SyncTask.query.get(task_id)
-                if updated_task.status == SYNC_STATUS['CANCELED']:
-                    return False, "작업이 취소되었습니다."
-                
-                # 진행 상태 업데이트
-                weight = SYNC_WEIGHTS.get(sync_type, 10)
-                progress_start = int((current_weight / total_weight) * 100)
-                
-                # 현재 작업 유형 업데이트
-                SyncQueueService.update_task_progress(
-                    task_id=task_id,
-                    progress=progress_start,
-                    current_sync_type=sync_type,
-                    message=f"{cls._get_sync_type_name(sync_type)} 동기화 중..."
-                )
-                
-                # 동기화 수행
-                success, message = cls._perform_sync(device.id, sync_type, batch_id)
-                all_success = all_success and success
-                
-                # 현재 작업 가중치 반영
-                current_weight += weight
-                progress_end = int((current_weight / total_weight) * 100)
-                
-                # 진행 상태 업데이트
-                SyncQueueService.update_task_progress(
-                    task_id=task_id,
-                    progress=progress_end,
-                    current_sync_type=sync_type,
-                    message=message
-                )
+            with ThreadPoolExecutor(max_workers=cls._get_concurrency(),
+                                    thread_name_prefix=f'sync-task-{task_id}') as executor:
+                while pending or running:
+                    # 취소 확인 (실행 중인 유형은 마무리하고 새 유형은 시작하지 않음)
+                    if pending and cls._is_canceled(task_id):
+                        canceled = True
+                        pending = []
+                    
+                    ready = cls._get_ready_sync_types(pending, completed, sync_types)
+                    for sync_type in ready:
+                        pending.remove(sync_type)
+                        
+                        # 선행 유형이 실패하면 이전/일부만 저장된 데이터를 갱신하지 않도록 건너뜀
+                        failed_dependencies = [
+                            dependency for dependency in SYNC_DEPENDENCIES.get(sync_type, [])
+                            if dependency in failed
+                        ]
+                        if failed_dependencies:
+                            message = cls._skip_sync(device.id, sync_type, failed_dependencies, batch_id)
+                            all_success = False
+                            completed.add(sync_type)
+                            failed.add(sync_type)
+                            current_weight += weights[sync_type]
+                            cls._update_progress(
+                                task_id,
+                                int((current_weight / total_weight) * 100),
+                                sync_type,
+                                message
+                            )
+                            continue
+                        
+                        # 현재 작업 유형 업데이트
+                        cls._update_progress(
+                            task_id,
+                            int((current_weight / total_weight) * 100),
+                            sync_type,
+                            f"{cls._get_sync_type_name(sync_type)} 동기화 중..."
+                        )
+                        future = executor.submit(cls._perform_sync_in_context, app, device.id, sync_type, batch_id)
+                        running[future] = sync_type
+                    
+                    if not running:
+                        # 건너뛴 유형이 있으면 그 후속 유형을 다시 확인
+                        if ready:
+                            continue
+                        break
+                    
+                    # 먼저 끝난 유형부터 결과 반영
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        sync_type = running.pop(future)
+                        success, message = future.result()
+                        all_success = all_success and success
+                        completed.add(sync_type)
+                        if not success:
+                            failed.add(sync_type)
+                        
+                        # 완료된 작업 가중치 반영
+                        current_weight += weights[sync_type]
+                        cls._update_progress(
+                            task_id,
+                            int((current_weight / total_weight) * 100),
+                            sync_type,
+                            message
+                        )
+            
+            if canceled:
+                return False, "작업이 취소되었습니다."
             
             # 작업 완료 처리
             if all_success:
-                SyncQueueService.complete_task(
-                    task_id=task_id, 
-                    success=True, 
-                    message="모든 동기화 작업이 완료되었습니다."
-                )
+                cls._complete_task(task_id, True, "모든 동기화 작업이 완료되었습니다.")
                 return True, "모든 동기화 작업이 완료되었습니다."
             else:
-                SyncQueueService.complete_task(
-                    task_id=task_id, 
-                    success=False, 
-                    message="일부 동기화 작업 중 오류가 발생했습니다."
-                )
+                cls._complete_task(task_id, False, "일부 동기화 작업 중 오류가 발생했습니다.")
                 return False, "일부 동기화 작업 중 오류가 발생했습니다."
                 
         except Exception as e:
             logger.error(f"동기화 작업 처리 중 오류 발생: {str(e)}")
-            SyncQueueService.complete_task(
-                task_id=task_id, 
-                success=False, 
-                message=f"동기화 작업 처리 중 오류 발생: {str(e)}"
-            )
+            cls._complete_task(task_id, False, f"동기화 작업 처리 중 오류 발생: {str(e)}")
             return False, f"동기화 작업 처리 중 오류 발생: {str(e)}"
+        finally:
+            # 배치 단위로 공유하던 수집기 자원(설정 스냅샷 등) 해제
+            FirewallCollectorFactory.release_batch(batch_id)
+    
+    @staticmethod
+    def _get_concurrency():
+        """
+        한 작업 안에서 동시에 수행할 동기화 유형 수 반환
+        
+        Returns:
+            int: 동시 수행 수 (SYNC_TYPE_CONCURRENCY 설정값)
+        """
+        return max(1, int(current_app.config.get('SYNC_TYPE_CONCURRENCY', 1)))
+    
+    @staticmethod
+    def _get_ready_sync_types(pending, completed, sync_types):
+        """
+        선행 동기화 유형이 모두 끝나 바로 시작할 수 있는 유형 목록 반환
+        
+        Args:
+            pending (list): 아직 시작하지 않은 동기화 유형
+            completed (set): 완료된 동기화 유형
+            sync_types (list): 작업에 포함된 전체 동기화 유형
+            
+        Returns:
+            list: 시작할 수 있는 동기화 유형
+        """
+        return [
+            sync_type for sync_type in pending
+            if all(
+                dependency in completed or dependency not in sync_types
+                for dependency in SYNC_DEPENDENCIES.get(sync_type, [])
+            )
+        ]
+    
+    @classmethod
+    def _skip_sync(cls, device_id, sync_type, failed_dependencies, batch_id):
+        """
+        선행 동기화 유형이 실패한 동기화 유형을 실패로 기록하고 건너뜀
+        
+        Args:
+            device_id (int): 장비 ID
+            sync_type (str): 건너뛸 동기화 유형
+            failed_dependencies (list): 실패한 선행 동기화 유형
+            batch_id (str): 배치 ID
+            
+        Returns:
+            str: 실패 메시지
+        """
+        dependency_names = ', '.join(cls._get_sync_type_name(dependency) for dependency in failed_dependencies)
+        message = f"선행 동기화({dependency_names})가 실패하여 {cls._get_sync_type_name(sync_type)} 동기화를 건너뛰었습니다."
+        logger.warning(message)
+        with db_write_lock:
+            create_sync_history(
+                device_id=device_id,
+                sync_type=sync_type,
+                status='failed',
+                message=message,
+                is_batch=True,
+                batch_id=batch_id
+            )
+            db.session.commit()
+        return message
+    
+    @staticmethod
+    def _complete_task(task_id, success, message):
+        """
+        작업 완료 처리 (DB 잠금 등으로 실패하면 재시도)
+        
+        완료 처리가 실패한 채로 두면 작업이 실행 중 상태로 남아 해당 장비를 다시 동기화할 수 없으므로,
+        작업이 아직 실행/대기 상태인 동안 COMPLETE_RETRY_COUNT번까지 다시 시도합니다.
+        
+        Args:
+            task_id (int): 작업 ID
+            success (bool): 성공 여부
+            message (str): 완료 메시지
+            
+        Returns:
+            bool: 완료 처리 성공 여부
+        """
+        for attempt in range(1, COMPLETE_RETRY_COUNT + 1):
+            completed, result = SyncQueueService.complete_task(task_id=task_id, success=success, message=message)
+            if completed:
+                return True
+            
+            # 이미 취소/완료된 작업이면 재시도하지 않음
+            try:
+                task = SyncTask.query.get(task_id)
+            except Exception:
+                db.session.rollback()
+                task = None
+            if task is not None and task.status not in [SYNC_STATUS['RUNNING'], SYNC_STATUS['PENDING']]:
+                return False
+            
+            logger.warning(f"작업 {task_id} 완료 처리 실패 ({attempt}/{COMPLETE_RETRY_COUNT}): {result}")
+            if attempt < COMPLETE_RETRY_COUNT:
+                time.sleep(COMPLETE_RETRY_DELAY)
+        
+        logger.error(f"작업 {task_id} 완료 처리에 실패하여 실행 중 상태로 남았습니다.")
+        return False
+    
+    @staticmethod
+    def _is_canceled(task_id):
+        """
+        작업 취소 여부 확인
+        
+        Args:
+            task_id (int): 작업 ID
+            
+        Returns:
+            bool: 취소 여부
+        """
+        task = SyncTask.query.get(task_id)
+        return task is not None and task.status == SYNC_STATUS['CANCELED']
+    
+    @staticmethod
+    def _update_progress(task_id, progress, sync_type, message):
+        """
+        작업 진행 상태 업데이트 (동기화 결과 저장과 겹치지 않도록 직렬화)
+        
+        Args:
+            task_id (int): 작업 ID
+            progress (int): 진행률
+            sync_type (str): 현재 동기화 유형
+            message (str): 상태 메시지
+        """
+        with db_write_lock:
+            SyncQueueService.update_task_progress(
+                task_id=task_id,
+                progress=progress,
+                current_sync_type=sync_type,
+                message=message
+            )
+    
+    @classmethod
+    def _perform_sync_in_context(cls, app, device_id, sync_type, batch_id):
+        """
+        스레드 풀에서 별도 애플리케이션 컨텍스트(별도 DB 세션)로 동기화 수행
+        
+        Args:
+            app: Flask 애플리케이션
+            device_id (int): 장비 ID
+            sync_type (str): 동기화 유형
+            batch_id (str): 배치 ID
+            
+        Returns:
+            tuple: (성공 여부, 메시지)
+        """
+        with app.app_context():
+            try:
+                return cls._perform_sync(device_id, sync_type, batch_id)
+            except Exception as e:
+                logger.error(f"{sync_type} 동기화 중 오류 발생: {str(e)}")
+                return False, f"{cls._get_sync_type_name(sync_type)} 동기화 중 오류 발생: {str(e)}"
     
     @staticmethod
     def _perform_sync(device_id, sync_type, batch_id):
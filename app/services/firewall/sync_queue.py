@@ -1,12 +1,40 @@
 from datetime import datetime
+import threading
 import uuid
 from app import db
 from app.models import Device, SyncTask, SyncHistory, SYNC_STATUS, SYNC_PRIORITY
+from app.services.dashboard_stats import invalidate_dashboard_stats
+from app.services.firewall.common import db_write_lock
 from sqlalchemy import func, or_
 
+# 큐 변경 알림 (작업 추가/완료 시 워커를 즉시 깨우기 위한 이벤트)
+_queue_event = threading.Event()
+
 class SyncQueueService:
     """동기화 큐 관리 서비스"""
     
+    @staticmethod
+    def notify_queue():
+        """
+        큐 변경 알림 (대기 중인 워커를 즉시 깨움)
+        """
+        _queue_event.set()
+    
+    @staticmethod
+    def wait_for_task(timeout=None):
+        """
+        큐 변경 알림이 올 때까지 대기
+        
+        Args:
+            timeout (float, optional): 최대 대기 시간 (초), 폴링 대체 주기로 사용
+            
+        Returns:
+            bool: 알림을 받았으면 True, 시간 초과면 False
+        """
+        notified = _queue_event.wait(timeout)
+        _queue_event.clear()
+        return notified
+    
     @staticmethod
     def create_task(device_id, sync_types, task_name=None, priority=SYNC_PRIORITY['NORMAL'], batch_id=None):
         """
@@ -63,6 +91,9 @@ class SyncQueueService:
             # 큐 정렬 (우선순위 반영)
             SyncQueueService.reorder_queue()
             
+            # 워커에 새 작업 알림
+            SyncQueueService.notify_queue()
+            
             return True, task
             
         except Exception as e:
@@ -70,61 +101,126 @@ class SyncQueueService:
             return False, f"작업 생성 중 오류 발생: {str(e)}"
     
     @staticmethod
-    def get_next_task():
+    def get_next_task(max_running=1, vendor_limits=None):
         """
         다음 실행할 작업 가져오기
         
+        이미 실행 중인 작업이 있는 장비와 동시 실행 한도에 도달한 벤더의 작업은 건너뜁니다.
+        
+        Args:
+            max_running (int): 전체 동시 실행 작업 수 한도 (기본: 1)
+            vendor_limits (dict, optional): 벤더(sub_category)별 동시 실행 작업 수 한도
+            
         Returns:
             SyncTask or None: 다음 실행할 작업 또는 None
         """
-        # 현재 실행 중인 작업이 있는지 확인
-        running_task = SyncTask.query.filter_by(status=SYNC_STATUS['RUNNING']).first()
-        if running_task:
+        # 실행 중인 작업의 장비/벤더 현황 확인
+        running = db.session.query(SyncTask.device_id, Device.sub_category).join(
+            Device, Device.id == SyncTask.device_id
+        ).filter(
+            SyncTask.status == SYNC_STATUS['RUNNING']
+        ).all()
+        if len(running) >= max_running:
             return None
+        
+        query = SyncTask.query.filter(SyncTask.status == SYNC_STATUS['PENDING'])
+        
+        # 장비당 하나의 작업만 실행
+        busy_devices = {device_id for device_id, _ in running}
+        if busy_devices:
+            query = query.filter(SyncTask.device_id.notin_(busy_devices))
+        
+        # 동시 실행 한도에 도달한 벤더 제외
+        if vendor_limits:
+            running_by_vendor = {}
+            for _, vendor in running:
+                running_by_vendor[vendor] = running_by_vendor.get(vendor, 0) + 1
+            saturated = [
+                vendor for vendor, limit in vendor_limits.items()
+                if running_by_vendor.get(vendor, 0) >= limit
+            ]
+            if saturated:
+                query = query.join(Device, Device.id == SyncTask.device_id).filter(
+                    Device.sub_category.notin_(saturated)
+                )
             
         # 우선순위와 큐 위치를 기준으로 다음 작업 선택
-        next_task = SyncTask.query.filter_by(
-            status=SYNC_STATUS['PENDING']
-        ).order_by(
+        next_task = query.order_by(
             SyncTask.priority,     # 우선순위 높은 순 (숫자가 작을수록 높음)
             SyncTask.queue_position  # 큐 위치 순
         ).first()
         
         return next_task
     
+    @staticmethod
+    def claim_next_task(max_running=1, vendor_limits=None, max_attempts=3):
+        """
+        다음 작업을 선택하고 실행 상태로 선점
+        
+        여러 워커가 같은 작업을 선택한 경우 start_task의 조건부 업데이트에
+        성공한 워커만 작업을 가져가며, 나머지는 다음 후보로 다시 시도합니다.
+        
+        Args:
+            max_running (int): 전체 동시 실행 작업 수 한도
+            vendor_limits (dict, optional): 벤더별 동시 실행 작업 수 한도
+            max_attempts (int): 선점 경쟁에서 밀렸을 때 재시도 횟수
+            
+        Returns:
+            SyncTask or None: 선점한 작업 또는 None
+        """
+        for _ in range(max_attempts):
+            next_task = SyncQueueService.get_next_task(max_running, vendor_limits)
+            if not next_task:
+                return None
+            
+            success, task = SyncQueueService.start_task(next_task.id)
+            if success:
+                return task
+        return None
+    
     @staticmethod
     def start_task(task_id):
         """
         작업 시작 상태로 변경
         
+        대기(pending) 상태일 때만 실행(running) 상태로 바꾸는 조건부 UPDATE를 사용하므로
+        여러 워커가 동시에 호출해도 한 워커만 작업을 시작할 수 있습니다.
+        
         Args:
             task_id (int): 작업 ID
             
         Returns:
             tuple: (성공 여부, 작업 객체 또는 메시지)
         """
-        try:
-            task = SyncTask.query.get(task_id)
-            if not task:
-                return False, "존재하지 않는 작업입니다."
+        with db_write_lock:
+            try:
+                claimed = SyncTask.query.filter_by(
+                    id=task_id,
+                    status=SYNC_STATUS['PENDING']
+                ).update({
+                    SyncTask.status: SYNC_STATUS['RUNNING'],
+                    SyncTask.started_at: datetime.now(),
+                    SyncTask.queue_position: 0,
+                    SyncTask.progress: 0,
+                    SyncTask.message: "동기화를 시작합니다."
+                }, synchronize_session=False)
+                db.session.commit()
+            
+                task = SyncTask.query.get(task_id)
+                if not task:
+                    return False, "존재하지 않는 작업입니다."
                 
-            if task.status != SYNC_STATUS['PENDING']:
-                return False, f"작업을 시작할 수 없습니다. 현재 상태: {task.status}"
-                
-            # 작업 시작 정보 업데이트
-            task.status = SYNC_STATUS['RUNNING']
-            task.started_at = datetime.now()
-            task.queue_position = 0
-            task.progress = 0
-            task.message = "동기화를 시작합니다."
+                if not claimed:
+                    return False, f"작업을 시작할 수 없습니다. 현재 상태: {task.status}"
             
-            db.session.commit()
+                # 조건부 UPDATE 결과를 세션의 객체에 반영
+                db.session.refresh(task)
             
-            return True, task
+                return True, task
             
-        except Exception as e:
-            db.session.rollback()
-            return False, f"작업 시작 중 오류 발생: {str(e)}"
+            except Exception as e:
+                db.session.rollback()
+                return False, f"작업 시작 중 오류 발생: {str(e)}"
     
     @staticmethod
     def update_task_progress(task_id, progress, current_sync_type=None, message=None):
@@ -140,31 +236,32 @@ class SyncQueueService:
         Returns:
             tuple: (성공 여부, 작업 객체 또는 메시지)
         """
-        try:
-            task = SyncTask.query.get(task_id)
-            if not task:
-                return False, "존재하지 않는 작업입니다."
+        with db_write_lock:
+            try:
+                task = SyncTask.query.get(task_id)
+                if not task:
+                    return False, "존재하지 않는 작업입니다."
                 
-            if task.status != SYNC_STATUS['RUNNING']:
-                return False, f"작업 진행률을 업데이트할 수 없습니다. 현재 상태: {task.status}"
+                if task.status != SYNC_STATUS['RUNNING']:
+                    return False, f"작업 진행률을 업데이트할 수 없습니다. 현재 상태: {task.status}"
                 
-            # 진행률 검증
-            progress = min(max(0, progress), 100)
-            
-            # 작업 정보 업데이트
-            task.progress = progress
-            if current_sync_type:
-                task.current_sync_type = current_sync_type
-            if message:
-                task.message = message
+                # 진행률 검증
+                progress = min(max(0, progress), 100)
+            
+                # 작업 정보 업데이트
+                task.progress = progress
+                if current_sync_type:
+                    task.current_sync_type = current_sync_type
+                if message:
+                    task.message = message
                 
-            db.session.commit()
+                db.session.commit()
             
-            return True, task
+                return True, task
             
-        except Exception as e:
-            db.session.rollback()
-            return False, f"작업 진행률 업데이트 중 오류 발생: {str(e)}"
+            except Exception as e:
+                db.session.rollback()
+                return False, f"작업 진행률 업데이트 중 오류 발생: {str(e)}"
     
     @staticmethod
     def complete_task(task_id, success=True, message=None):
@@ -179,31 +276,38 @@ class SyncQueueService:
         Returns:
             tuple: (성공 여부, 작업 객체 또는 메시지)
         """
-        try:
-            task = SyncTask.query.get(task_id)
-            if not task:
-                return False, "존재하지 않는 작업입니다."
+        with db_write_lock:
+            try:
+                task = SyncTask.query.get(task_id)
+                if not task:
+                    return False, "존재하지 않는 작업입니다."
                 
-            if task.status not in [SYNC_STATUS['RUNNING'], SYNC_STATUS['PENDING']]:
-                return False, f"이미 완료된 작업입니다. 현재 상태: {task.status}"
+                if task.status not in [SYNC_STATUS['RUNNING'], SYNC_STATUS['PENDING']]:
+                    return False, f"이미 완료된 작업입니다. 현재 상태: {task.status}"
                 
-            # 작업 완료 정보 업데이트
-            task.status = SYNC_STATUS['COMPLETED'] if success else SYNC_STATUS['FAILED']
-            task.completed_at = datetime.now()
-            task.progress = 100 if success else task.progress
-            
-            if message:
-                task.message = message
-            else:
-                task.message = "동기화가 완료되었습니다." if success else "동기화 중 오류가 발생했습니다."
+                # 작업 완료 정보 업데이트
+                task.status = SYNC_STATUS['COMPLETED'] if success else SYNC_STATUS['FAILED']
+                task.completed_at = datetime.now()
+                task.progress = 100 if success else task.progress
+            
+                if message:
+                    task.message = message
+                else:
+                    task.message = "동기화가 완료되었습니다." if success else "동기화 중 오류가 발생했습니다."
                 
-            db.session.commit()
+                db.session.commit()
             
-            return True, task
+                # 동기화로 정책/객체 수가 바뀌었으므로 대시보드 통계 캐시 무효화
+                invalidate_dashboard_stats()
             
-        except Exception as e:
-            db.session.rollback()
-            return False, f"작업 완료 처리 중 오류 발생: {str(e)}"
+                # 장비/벤더 실행 슬롯이 비었으므로 대기 중인 작업 확인 요청
+                SyncQueueService.notify_queue()
+            
+                return True, task
+            
+            except Exception as e:
+                db.session.rollback()
+                return False, f"작업 완료 처리 중 오류 발생: {str(e)}"
     
     @staticmethod
     def cancel_task(task_id):
@@ -216,35 +320,36 @@ class SyncQueueService:
         Returns:
             tuple: (성공 여부, 작업 객체 또는 메시지)
         """
-        try:
-            task = SyncTask.query.get(task_id)
-            if not task:
-                return False, "존재하지 않는 작업입니다."
+        with db_write_lock:
+            try:
+                task = SyncTask.query.get(task_id)
+                if not task:
+                    return False, "존재하지 않는 작업입니다."
                 
-            if not task.can_cancel:
-                return False, f"취소할 수 없는 작업입니다. 현재 상태: {task.status}"
-            
-            # 작업 취소 정보 업데이트
-            prev_status = task.status
-            task.status = SYNC_STATUS['CANCELED']
-            task.completed_at = datetime.now()
-            task.message = "사용자에 의해 취소되었습니다."
-            
-            # 대기 중인 작업이었으면 큐에서 제거
-            if prev_status == SYNC_STATUS['PENDING']:
-                task.queue_position = 0
+                if not task.can_cancel:
+                    return False, f"취소할 수 없는 작업입니다. 현재 상태: {task.status}"
+            
+                # 작업 취소 정보 업데이트
+                prev_status = task.status
+                task.status = SYNC_STATUS['CANCELED']
+                task.completed_at = datetime.now()
+                task.message = "사용자에 의해 취소되었습니다."
+            
+                # 대기 중인 작업이었으면 큐에서 제거
+                if prev_status == SYNC_STATUS['PENDING']:
+                    task.queue_position = 0
                 
-            db.session.commit()
+                db.session.commit()
             
-            # 다른 작업들의 큐 위치 재조정
-            if prev_status == SYNC_STATUS['PENDING']:
-                SyncQueueService.reorder_queue()
+                # 다른 작업들의 큐 위치 재조정
+                if prev_status == SYNC_STATUS['PENDING']:
+                    SyncQueueService.reorder_queue()
             
-            return True, task
+                return True, task
             
-        except Exception as e:
-            db.session.rollback()
-            return False, f"작업 취소 중 오류 발생: {str(e)}"
+            except Exception as e:
+                db.session.rollback()
+                return False, f"작업 취소 중 오류 발생: {str(e)}"
     
     @staticmethod
     def get_device_tasks(device_id, limit=10, include_completed=False):
@@ -1,6 +1,7 @@
 from app import db
 from app.models import FirewallSystemInfo
-from app.services.firewall.common import get_device_and_collector, create_sync_history, handle_sync_exception
+from app.services.firewall.common import get_device_and_collector, create_sync_history, handle_sync_exception, db_write_lock
+from app.services.firewall.device_stats import refresh_device_stats
 
 def sync_system_info(device_id, is_batch=False, batch_id=None):
     """방화벽 시스템 정보를 동기화합니다.
@@ -14,7 +15,7 @@ def sync_system_info(device_id, is_batch=False, batch_id=None):
         tuple: (success, message)
     """
     # 장비 및 수집기 가져오기
-    device, collector, error = get_device_and_collector(device_id)
+    device, collector, error = get_device_and_collector(device_id, batch_id)
     if error:
         return False, error
     
@@ -25,30 +26,34 @@ def sync_system_info(device_id, is_batch=False, batch_id=None):
         if system_info_df.empty:
             return False, "시스템 정보를 가져올 수 없습니다."
         
-        # 기존 시스템 정보 조회 또는 새로 생성
-        system_info = FirewallSystemInfo.query.filter_by(device_id=device.id).first()
-        if not system_info:
-            system_info = FirewallSystemInfo(device_id=device.id)
+        # DB 쓰기는 다른 동기화 작업과 겹치지 않도록 직렬화
+        with db_write_lock:
+            # 기존 시스템 정보 조회 또는 새로 생성
+            system_info = FirewallSystemInfo.query.filter_by(device_id=device.id).first()
+            if not system_info:
+                system_info = FirewallSystemInfo(device_id=device.id)
         
-        # 시스템 정보 업데이트
-        row = system_info_df.iloc[0]
-        for column in system_info_df.columns:
-            field_name = column.lower().replace('-', '_').replace(' ', '_')
-            if hasattr(system_info, field_name):
-                setattr(system_info, field_name, row.get(column))
+            # 시스템 정보 업데이트
+            row = system_info_df.iloc[0]
+            for column in system_info_df.columns:
+                field_name = column.lower().replace('-', '_').replace(' ', '_')
+                if hasattr(system_info, field_name):
+                    setattr(system_info, field_name, row.get(column))
         
-        db.session.add(system_info)
+            db.session.add(system_info)
         
-        # 동기화 이력 저장
-        create_sync_history(
-            device_id=device.id,
-            sync_type='system_info',
-            status='success',
-            message='시스템 정보를 동기화했습니다.',
-            is_batch=is_batch,
-            batch_id=batch_id
-        )
-        db.session.commit()
+            # 동기화 이력 저장
+            create_sync_history(
+                device_id=device.id,
+                sync_type='system_info',
+                status='success',
+                message='시스템 정보를 동기화했습니다.',
+                is_batch=is_batch,
+                batch_id=batch_id
+            )
+            # 장비 통계도 같은 트랜잭션에서 갱신
+            refresh_device_stats(device.id, ['system_info'])
+            db.session.commit()
         
         return True, '시스템 정보를 동기화했습니다.'
     
@@ -1,7 +1,10 @@
 from app import db
 from app.models import FirewallPolicy
-from app.services.firewall.common import get_device_and_collector, create_sync_history, handle_sync_exception
+from app.services.firewall.common import get_device_and_collector, create_sync_history, handle_sync_exception, db_write_lock
+from app.services.firewall.device_stats import refresh_device_stats
+from app.services.firewall.bulk_writer import bulk_update
 from datetime import datetime
+import pandas as pd
 
 def parse_date(date_str):
     """다양한 형식의 날짜 문자열을 파싱합니다.
@@ -28,6 +31,67 @@ def parse_date(date_str):
     
     return None
 
+def format_last_hit_date(value):
+    """마지막 사용 일시를 저장 형식(YYYY-MM-DD HH:MM:SS) 문자열로 변환합니다.
+    
+    Args:
+        value: 수집기의 Last Hit Date 값
+        
+    Returns:
+        str 또는 None (파싱할 수 없는 값은 원본 문자열 유지)
+    """
+    if value is None or pd.isna(value) or str(value).strip() == '':
+        return None
+    
+    parsed = parse_date(str(value))
+    return parsed.strftime('%Y-%m-%d %H:%M:%S') if parsed else str(value).strip()
+
+def merge_usage_logs(device, usage_logs_df, chunk_size=None):
+    """사용 이력 DataFrame을 장비의 정책과 메모리에서 조인하여 일괄 업데이트합니다.
+    
+    정책 (rule_name, id) 목록을 한 번에 조회한 뒤 규칙명으로 병합하고,
+    last_hit_date, unused_days, usage_status를 executemany UPDATE로 반영합니다.
+    커밋은 호출 측에서 수행합니다.
+    
+    Args:
+        device: 장비 객체
+        usage_logs_df: Rule Name, Last Hit Date, Unused Days, 미사용여부 컬럼을 가진 DataFrame
+        chunk_size: 한 번에 실행할 행 수
+        
+    Returns:
+        int: 갱신된 정책 수
+    """
+    if usage_logs_df is None or usage_logs_df.empty or 'Rule Name' not in usage_logs_df.columns:
+        return 0
+    
+    policies_df = pd.DataFrame(
+        db.session.query(FirewallPolicy.rule_name, FirewallPolicy.id).filter(
+            FirewallPolicy.device_id == device.id
+        ).all(),
+        columns=['Rule Name', '_id']
+    )
+    if policies_df.empty:
+        return 0
+    
+    # 같은 규칙명의 사용 이력이 여러 번 나오면 마지막 값을 사용
+    usage = usage_logs_df.drop_duplicates('Rule Name', keep='last')
+    merged = policies_df.merge(usage, on='Rule Name', how='inner')
+    if merged.empty:
+        return 0
+    
+    records = pd.DataFrame({
+        '_id': merged['_id'].astype(int),
+        'last_hit_date': merged['Last Hit Date'].map(format_last_hit_date)
+            if 'Last Hit Date' in merged.columns else None,
+        'unused_days': pd.to_numeric(merged['Unused Days'], errors='coerce')
+            if 'Unused Days' in merged.columns else 0,
+        'usage_status': merged['미사용여부'] if '미사용여부' in merged.columns else '',
+    })
+    records = records.astype(object).where(pd.notna(records), None)
+    records['unused_days'] = records['unused_days'].map(lambda days: None if days is None else int(days))
+    
+    return bulk_update(FirewallPolicy, records.to_dict('records'), chunk_size)
+
 def sync_usage_logs(device_id, days=90, is_batch=False, batch_id=None):
     """방화벽 정책 사용 이력을 동기화합니다.
     
@@ -41,7 +105,7 @@ def sync_usage_logs(device_id, days=90, is_batch=False, batch_id=None):
         tuple: (success, message)
     """
     # 장비 및 수집기 가져오기
-    device, collector, error = get_device_and_collector(device_id)
+    device, collector, error = get_device_and_collector(device_id, batch_id)
     if error:
         return False, error
     
@@ -49,38 +113,25 @@ def sync_usage_logs(device_id, days=90, is_batch=False, batch_id=None):
         # 정책 사용 이력 가져오기
         usage_logs_df = collector.export_usage_logs(days=days)
         
-        # 정책 사용 이력 업데이트
-        for _, row in usage_logs_df.iterrows():
-            rule_name = row.get('Rule Name', '')
-            last_hit_date = row.get('Last Hit Date', '')
-            unused_days = row.get('Unused Days', 0)
-            usage_status = row.get('미사용여부', '')
-            
-            # 해당 정책 찾기
-            policy = FirewallPolicy.query.filter_by(
-                device_id=device.id,
-                rule_name=rule_name
-            ).first()
-            
-            if policy:
-                # 사용 이력 업데이트
-                policy.last_hit = parse_date(last_hit_date)
-                policy.unused_days = unused_days
-                policy.usage_status = usage_status
-                db.session.add(policy)
+        # DB 쓰기는 다른 동기화 작업과 겹치지 않도록 직렬화
+        with db_write_lock:
+            # 정책 사용 이력 일괄 업데이트
+            updated_count = merge_usage_logs(device, usage_logs_df)
         
-        # 동기화 이력 저장
-        create_sync_history(
-            device_id=device.id,
-            sync_type='usage_logs',
-            status='success',
-            message=f'{len(usage_logs_df)} 개의 정책 사용 이력을 동기화했습니다.',
-            is_batch=is_batch,
-            batch_id=batch_id
-        )
-        db.session.commit()
+            # 동기화 이력 저장
+            create_sync_history(
+                device_id=device.id,
+                sync_type='usage_logs',
+                status='success',
+                message=f'{len(usage_logs_df)} 개의 정책 사용 이력을 동기화했습니다. (정책 {updated_count}개 갱신)',
+                is_batch=is_batch,
+                batch_id=batch_id
+            )
+            # 장비 통계도 같은 트랜잭션에서 갱신
+            refresh_device_stats(device.id, ['usage_logs'])
+            db.session.commit()
         
-        return True, f'{len(usage_logs_df)} 개의 정책 사용 이력을 동기화했습니다.'
+        return True, f'{len(usage_logs_df)} 개의 정책 사용 이력을 동기화했습니다. (정책 {updated_count}개 갱신)'
     
     except Exception as e:
         # 예외 처리 시에도 배치 정보 전달
@@ -1,108 +1,180 @@
 import threading
-import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from app import db
-from app.models import SyncTask, SYNC_STATUS
 from app.services.firewall import SyncManager, SyncQueueService
 
 logger = logging.getLogger(__name__)
 
+def parse_vendor_limits(value):
+    """
+    벤더별 동시 실행 한도 설정 파싱
+
+    Args:
+        value (dict or str): {'mf2': 1} 형태의 딕셔너리 또는 'mf2=1,ngf=2' 형태의 문자열
+
+    Returns:
+        dict: {벤더(sub_category): 한도}
+    """
+    if not value:
+        return {}
+    if isinstance(value, dict):
+        return {vendor: int(limit) for vendor, limit in value.items()}
+
+    limits = {}
+    for item in str(value).split(','):
+        if '=' not in item:
+            continue
+        vendor, limit = item.split('=', 1)
+        if vendor.strip() and limit.strip():
+            limits[vendor.strip()] = int(limit)
+    return limits
+
 class SyncWorker:
     """동기화 작업 워커 클래스"""
-    
-    def __init__(self, poll_interval=5):
+
+    def __init__(self, poll_interval=5, max_workers=1, vendor_limits=None):
         """
         초기화
-        
+
         Args:
-            poll_interval (int): 큐 확인 간격 (초)
+            poll_interval (int): 알림이 없을 때 큐를 다시 확인하는 간격 (초)
+            max_workers (int): 동시에 처리할 최대 작업 수
+            vendor_limits (dict or str, optional): 벤더별 동시 실행 한도
         """
         self.poll_interval = poll_interval
+        self.max_workers = max(1, int(max_workers))
+        self.vendor_limits = parse_vendor_limits(vendor_limits)
         self.running = False
         self.thread = None
-    
+        self.executor = None
+        self._active_count = 0
+        self._active_lock = threading.Lock()
+
     def start(self):
         """워커 시작"""
         if self.running:
             logger.warning("이미 실행 중인 워커가 있습니다.")
             return False
-            
+
         self.running = True
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='sync-worker')
         self.thread = threading.Thread(target=self._worker_loop)
         self.thread.daemon = True  # 메인 스레드 종료 시 함께 종료
         self.thread.start()
-        
-        logger.info("동기화 워커가 시작되었습니다.")
+
+        logger.info(f"동기화 워커가 시작되었습니다. (동시 작업 수: {self.max_workers})")
         return True
-    
+
     def stop(self):
         """워커 중지"""
         if not self.running:
             logger.warning("실행 중인 워커가 없습니다.")
             return False
-            
+
         self.running = False
+        SyncQueueService.notify_queue()  # 대기 중인 분배 루프를 깨워 종료
         if self.thread:
             self.thread.join(timeout=10)  # 최대 10초간 기다림
-        
+        if self.executor:
+            # 실행 중인 작업은 끝까지 처리되도록 두고 새 작업만 막습니다.
+            self.executor.shutdown(wait=False)
+
         logger.info("동기화 워커가 중지되었습니다.")
         return True
-    
+
+    @property
+    def active_count(self):
+        """현재 처리 중인 작업 수"""
+        with self._active_lock:
+            return self._active_count
+
+    def _dispatch(self):
+        """
+        빈 작업 슬롯만큼 작업을 선점하여 스레드 풀에 제출
+
+        Returns:
+            int: 제출한 작업 수
+        """
+        submitted = 0
+        while self.running and self.active_count < self.max_workers:
+            task = SyncQueueService.claim_next_task(
+                max_running=self.max_workers,
+                vendor_limits=self.vendor_limits
+            )
+            if not task:
+                break
+
+            logger.info(f"새 작업 시작: {task.id} ({task.task_name})")
+            with self._active_lock:
+                self._active_count += 1
+            self.executor.submit(self._run_task, db.app, task.id)
+            submitted += 1
+        return submitted
+
+    def _run_task(self, app, task_id):
+        """
+        스레드 풀에서 작업 하나를 처리
+
+        Args:
+            app: Flask 애플리케이션
+            task_id (int): 선점한 작업 ID
+        """
+        try:
+            with app.app_context():
+                success, message = SyncManager.process_task(task_id, already_started=True)
+
+                if success:
+                    logger.info(f"작업 성공: {task_id} - {message}")
+                else:
+                    logger.warning(f"작업 실패: {task_id} - {message}")
+        except Exception as e:
+            logger.error(f"작업 처리 중 오류 발생: {task_id} - {str(e)}")
+        finally:
+            with self._active_lock:
+                self._active_count -= 1
+            # 슬롯이 비었으므로 분배 루프를 깨움
+            SyncQueueService.notify_queue()
+
     def _worker_loop(self):
-        """워커 메인 루프"""
+        """워커 메인 루프 (작업 분배)"""
         logger.info("동기화 워커 루프 시작")
-        
+
         while self.running:
             try:
-                # 현재 실행 중인 작업 확인
                 with db.app.app_context():
-                    running_task = SyncTask.query.filter_by(status=SYNC_STATUS['RUNNING']).first()
-                    
-                    if running_task:
-                        # 이미 실행 중인 작업이 있으면 패스
-                        logger.debug(f"실행 중인 작업이 있습니다: {running_task.id} ({running_task.task_name})")
-                        time.sleep(self.poll_interval)
-                        continue
-                    
-                    # 다음 작업 가져오기
-                    next_task = SyncQueueService.get_next_task()
-                    
-                    if next_task:
-                        logger.info(f"새 작업 시작: {next_task.id} ({next_task.task_name})")
-                        
-                        # 작업 처리
-                        success, message = SyncManager.process_task(next_task.id)
-                        
-                        if success:
-                            logger.info(f"작업 성공: {next_task.id} - {message}")
-                        else:
-                            logger.warning(f"작업 실패: {next_task.id} - {message}")
-                    else:
-                        # 처리할 작업이 없으면 대기
+                    if not self._dispatch():
+                        # 처리할 작업이 없거나 모든 슬롯이 사용 중이면 대기
                         logger.debug("처리할 작업이 없습니다.")
-                
+
             except Exception as e:
                 logger.error(f"워커 처리 중 오류 발생: {str(e)}")
-                
-            # 다음 폴링 전 대기
-            time.sleep(self.poll_interval)
-        
+
+            # 큐 변경 알림을 기다리고, 알림이 없으면 poll_interval마다 다시 확인
+            SyncQueueService.wait_for_task(self.poll_interval)
+
         logger.info("동기화 워커 루프 종료")
 
 # 싱글톤 인스턴스
 _worker_instance = None
 
-def get_worker(poll_interval=5):
+def get_worker(poll_interval=5, max_workers=1, vendor_limits=None):
     """
     워커 인스턴스 반환 (싱글톤)
-    
+
     Args:
-        poll_interval (int): 큐 확인 간격 (초)
-        
+        poll_interval (int): 알림이 없을 때 큐를 다시 확인하는 간격 (초)
+        max_workers (int): 동시에 처리할 최대 작업 수
+        vendor_limits (dict or str, optional): 벤더별 동시 실행 한도
+
     Returns:
         SyncWorker: 워커 인스턴스
     """
     global _worker_instance
     if _worker_instance is None:
-        _worker_instance = SyncWorker(poll_interval=poll_interval)
-    return _worker_instance 
\ No newline at end of file
+        _worker_instance = SyncWorker(
+            poll_interval=poll_interval,
+            max_workers=max_workers,
+            vendor_limits=vendor_limits
+        )
+    return _worker_instance
@@ -0,0 +1,229 @@
+import weakref
+from sqlalchemy import event, literal_column, or_, select, table, column, text, union_all
+from app import db
+from app.models import Device
+
+# 전문 검색 인덱스를 유지할 테이블과 검색 컬럼 (장비명은 장비 테이블에서 따로 검색)
+SEARCH_INDEXES = {
+    'firewall_policy': ('rule_name', 'source', 'destination', 'service', 'user', 'application',
+                        'vsys', 'security_profile', 'category'),
+    'firewall_network_object': ('name', 'value'),
+    'firewall_network_group': ('group_name', 'entry'),
+    'firewall_service_object': ('name', 'port'),
+    'firewall_service_group': ('group_name', 'entry'),
+}
+
+# trigram 토크나이저가 부분 문자열로 검색할 수 있는 최소 검색어 길이
+MIN_TERM_LENGTH = 3
+
+# 엔진별 전문 검색 인덱스 사용 가능 여부 캐시 (테이블 생성/삭제 시 무효화)
+_availability = weakref.WeakKeyDictionary()
+
+def fts_table_name(table_name):
+    """원본 테이블의 전문 검색(FTS5) 테이블 이름을 반환합니다."""
+    return f'{table_name}_fts'
+
+def search_index_ddl(table_name, columns):
+    """FTS5 테이블과 원본 테이블 변경을 반영하는 트리거 생성 SQL 목록을 반환합니다.
+
+    원본 테이블을 content로 사용하는 외부 콘텐츠 테이블이므로 색인만 저장하며,
+    동기화 서비스의 INSERT/UPDATE/DELETE가 트리거를 통해 같은 트랜잭션에서 색인에 반영됩니다.
+
+    Args:
+        table_name: 원본 테이블 이름
+        columns: 검색 컬럼 목록
+
+    Returns:
+        list: SQL 문 목록
+    """
+    fts = fts_table_name(table_name)
+    names = ', '.join(columns)
+    new_values = ', '.join(f'new.{name}' for name in columns)
+    old_values = ', '.join(f'old.{name}' for name in columns)
+    insert_new = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values});"
+    delete_old = f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({names}, "
+        f"content='{table_name}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table_name} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table_name} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {names} ON {table_name} "
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+def search_index_supported(connection):
+    """연결된 데이터베이스가 FTS5 trigram 토크나이저를 지원하는지 확인합니다.
+
+    Args:
+        connection: SQLAlchemy 연결
+
+    Returns:
+        bool: 지원 여부 (SQLite 3.34 이상, FTS5 포함 빌드)
+    """
+    if connection.dialect.name != 'sqlite':
+        return False
+    version = connection.exec_driver_sql('SELECT sqlite_version()').scalar()
+    if tuple(int(part) for part in version.split('.')[:2]) < (3, 34):
+        return False
+    options = {row[0] for row in connection.exec_driver_sql('PRAGMA compile_options')}
+    return 'ENABLE_FTS5' in options
+
+def _existing_tables(connection):
+    return {row[0] for row in connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+def create_search_index(connection):
+    """전문 검색 테이블과 트리거를 생성합니다. (이미 있으면 유지)
+
+    새로 만든 테이블은 원본 테이블의 기존 데이터로 색인을 채웁니다.
+
+    Args:
+        connection: SQLAlchemy 연결
+
+    Returns:
+        bool: 전문 검색 인덱스 사용 가능 여부
+    """
+    _availability.pop(connection.engine, None)
+    if not search_index_supported(connection):
+        return False
+
+    existing = _existing_tables(connection)
+    for table_name, columns in SEARCH_INDEXES.items():
+        if table_name not in existing:
+            continue
+        fts = fts_table_name(table_name)
+        for statement in search_index_ddl(table_name, columns):
+            connection.exec_driver_sql(statement)
+        if fts not in existing:
+            connection.exec_driver_sql(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+    return True
+
+def drop_search_index(connection):
+    """전문 검색 테이블을 삭제합니다. (트리거는 원본 테이블과 함께 삭제됨)
+
+    Args:
+        connection: SQLAlchemy 연결
+    """
+    _availability.pop(connection.engine, None)
+    if connection.dialect.name != 'sqlite':
+        return
+    for table_name in SEARCH_INDEXES:
+        connection.exec_driver_sql(f'DROP TABLE IF EXISTS {fts_table_name(table_name)}')
+
+def rebuild_search_index():
+    """원본 테이블에서 모든 전문 검색 색인을 다시 만듭니다. (색인 손상/수동 변경 보정용)
+
+    커밋은 호출 측에서 수행합니다.
+
+    Returns:
+        int: 다시 만든 전문 검색 테이블 수
+    """
+    if not is_search_index_available():
+        return 0
+    for table_name in SEARCH_INDEXES:
+        fts = fts_table_name(table_name)
+        db.session.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+    return len(SEARCH_INDEXES)
+
+def is_search_index_available():
+    """현재 데이터베이스에 전문 검색 테이블이 모두 있는지 확인합니다.
+
+    Returns:
+        bool: 사용 가능 여부
+    """
+    engine = db.engine
+    available = _availability.get(engine)
+    if available is None:
+        if engine.dialect.name != 'sqlite':
+            available = False
+        else:
+            names = {row[0] for row in db.session.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'"))}
+            available = all(fts_table_name(table_name) in names for table_name in SEARCH_INDEXES)
+        _availability[engine] = available
+    return available
+
+def _match_query(columns, all_columns, term):
+    """FTS5 MATCH 구문을 만듭니다. (검색어 전체를 하나의 구문으로 검색)"""
+    phrase = '"' + term.replace('"', '""') + '"'
+    if set(columns) == set(all_columns):
+        return phrase
+    return '{' + ' '.join(columns) + '} : ' + phrase
+
+def _matched_ids(model, columns, term):
+    """FTS5로 검색어를 포함하는 행 ID를 찾는 서브쿼리를 반환합니다. (전문 검색을 쓸 수 없으면 None)"""
+    table_name = model.__tablename__
+    indexed = SEARCH_INDEXES.get(table_name, ())
+    if (len(term) < MIN_TERM_LENGTH or '%' in term or not set(columns) <= set(indexed)
+            or not is_search_index_available()):
+        return None
+
+    fts = fts_table_name(table_name)
+    return select(table(fts, column('rowid')).c.rowid).where(
+        literal_column(fts).op('MATCH')(_match_query(columns, indexed, term))
+    )
+
+def _ilike_condition(model, columns, term):
+    return or_(*[getattr(model, name).ilike(f'%{term}%') for name in columns])
+
+def search_condition(model, columns, term):
+    """컬럼 중 하나라도 검색어를 포함하는 행을 찾는 조건을 반환합니다.
+
+    전문 검색 색인이 있으면 FTS5 trigram 검색으로 일치하는 ID를 찾고,
+    색인이 없거나 검색어가 짧거나(3자 미만) 와일드카드(%)를 포함하면 ILIKE 검색을 사용합니다.
+
+    Args:
+        model: 검색할 모델 클래스
+        columns: 검색 컬럼 이름 목록
+        term: 검색어
+
+    Returns:
+        ColumnElement: 쿼리 필터 조건
+    """
+    columns = list(columns)
+    matched = _matched_ids(model, columns, term)
+    if matched is None:
+        return _ilike_condition(model, columns, term)
+    return model.id.in_(matched)
+
+def device_name_condition(model, term):
+    """장비명이 검색어를 포함하는 행을 찾는 조건을 반환합니다.
+
+    장비 테이블에서 ID를 먼저 찾아 device_id 인덱스로 조회합니다.
+
+    Args:
+        model: 검색할 모델 클래스 (device_id 컬럼 필요)
+        term: 검색어
+
+    Returns:
+        ColumnElement: 쿼리 필터 조건
+    """
+    return model.device_id.in_(select(Device.id).where(Device.name.ilike(f'%{term}%')))
+
+def keyword_search_condition(model, columns, term):
+    """검색창 검색어 조건을 반환합니다. (장비명 또는 컬럼 중 하나라도 검색어를 포함)
+
+    전문 검색을 쓸 수 있으면 장비명으로 찾은 ID와 FTS5로 찾은 ID를 UNION ALL로 합쳐
+    기본 키로 조회하므로, 통계(ANALYZE) 유무와 관계없이 전체 행을 스캔하지 않습니다.
+    그 외에는 장비명 조건과 ILIKE 검색을 OR로 묶습니다.
+
+    Args:
+        model: 검색할 모델 클래스 (device_id 컬럼 필요)
+        columns: 검색 컬럼 이름 목록
+        term: 검색어
+
+    Returns:
+        ColumnElement: 쿼리 필터 조건
+    """
+    columns = list(columns)
+    device_condition = device_name_condition(model, term)
+    matched = _matched_ids(model, columns, term)
+    if matched is None:
+        return or_(device_condition, _ilike_condition(model, columns, term))
+    return model.id.in_(union_all(select(model.id).where(device_condition), matched))
+
+@event.listens_for(db.metadata, 'after_create')
+def _create_search_index(target, connection, **kw):
+    create_search_index(connection)
+
+@event.listens_for(db.metadata, 'before_drop')
+def _drop_search_index(target, connection, **kw):
+    drop_search_index(connection)
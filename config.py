@@ -3,12 +3,31 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# SECRET_KEY를 설정하지 않았을 때 사용하는 개발용 기본값
+DEFAULT_SECRET_KEY = 'dev-key-12345'
+
 class Config:
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-key-12345'
+    SECRET_KEY = os.environ.get('SECRET_KEY') or DEFAULT_SECRET_KEY
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         'sqlite:///cmd.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # SQLite는 쓰기 잠금을 기다리는 시간(초)을 늘려 동기화 워커와 화면 요청의 쓰기가 겹쳐도 바로 실패하지 않도록 함
+    SQLALCHEMY_ENGINE_OPTIONS = {'connect_args': {'timeout': 30}} if SQLALCHEMY_DATABASE_URI.startswith('sqlite') else {}
     
     # 업로드 설정
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 최대 16MB
-    UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads') 
\ No newline at end of file
+    UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads')
+    
+    # 동기화 설정
+    SYNC_BULK_CHUNK_SIZE = int(os.environ.get('SYNC_BULK_CHUNK_SIZE') or 1000)  # 대량 저장 시 한 번에 INSERT할 행 수 
+    SYNC_MODE = os.environ.get('SYNC_MODE') or 'incremental'  # incremental: 변경분만 반영, full: 전체 삭제 후 재저장
+    SYNC_WORKER_ENABLED = (os.environ.get('SYNC_WORKER_ENABLED') or 'true').lower() == 'true'  # 앱 시작 시 동기화 워커 실행 여부
+    SYNC_WORKER_COUNT = int(os.environ.get('SYNC_WORKER_COUNT') or 1)  # 동시에 처리할 동기화 작업 수 (SQLite는 1 권장)
+    SYNC_VENDOR_LIMITS = os.environ.get('SYNC_VENDOR_LIMITS') or 'mf2=2'  # 벤더별 동시 작업 수 한도 (예: mf2=2,ngf=2)
+    SYNC_TYPE_CONCURRENCY = int(os.environ.get('SYNC_TYPE_CONCURRENCY') or 4)  # 한 작업 안에서 동시에 수집할 동기화 유형 수
+    
+    # 대시보드 통계 캐시 유지 시간 (초, 동기화 작업 완료 시에는 즉시 무효화)
+    DASHBOARD_STATS_CACHE_TTL = int(os.environ.get('DASHBOARD_STATS_CACHE_TTL') or 300)
+    
+    # PaloAlto API 키 캐시 파일 (설정하고 SECRET_KEY도 기본값이 아닐 때만 암호화하여 저장, 그 외에는 메모리에만 보관)
+    PALOALTO_KEY_CACHE_FILE = os.environ.get('PALOALTO_KEY_CACHE_FILE')
\ No newline at end of file
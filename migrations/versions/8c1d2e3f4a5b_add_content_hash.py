@@ -0,0 +1,36 @@
+"""Add content_hash for incremental sync
+
+Revision ID: 8c1d2e3f4a5b
+Revises: 5b04fc924f50
+Create Date: 2026-10-18 10:12:41.204318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c1d2e3f4a5b'
+down_revision = '5b04fc924f50'
+branch_labels = None
+depends_on = None
+
+TABLES = [
+    'firewall_policy',
+    'firewall_network_object',
+    'firewall_network_group',
+    'firewall_service_object',
+    'firewall_service_group',
+]
+
+
+def upgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('content_hash', sa.String(length=40), nullable=True))
+
+
+def downgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_column('content_hash')
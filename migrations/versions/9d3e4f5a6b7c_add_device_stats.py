@@ -0,0 +1,81 @@
+"""Add device_stats summary table
+
+Revision ID: 9d3e4f5a6b7c
+Revises: 8c1d2e3f4a5b
+Create Date: 2026-10-18 14:03:27.518902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d3e4f5a6b7c'
+down_revision = '8c1d2e3f4a5b'
+branch_labels = None
+depends_on = None
+
+COUNT_COLUMNS = [
+    'policy_total',
+    'policy_active',
+    'policy_inactive',
+    'policy_allow',
+    'policy_deny',
+    'policy_unused',
+    'network_object_count',
+    'network_group_count',
+    'service_object_count',
+    'service_group_count',
+]
+
+# 기존 데이터로 장비별 통계를 채움 (테이블별 GROUP BY 한 번씩)
+BACKFILL_SQL = """
+INSERT INTO device_stats (device_id, policy_total, policy_active, policy_inactive, policy_allow, policy_deny,
+                          policy_unused, network_object_count, network_group_count, service_object_count,
+                          service_group_count, updated_at)
+SELECT d.id,
+       COALESCE(p.total, 0),
+       COALESCE(p.active, 0),
+       COALESCE(p.total, 0) - COALESCE(p.active, 0),
+       COALESCE(p.allow, 0),
+       COALESCE(p.deny, 0),
+       COALESCE(p.unused, 0),
+       COALESCE(no.cnt, 0),
+       COALESCE(ng.cnt, 0),
+       COALESCE(so.cnt, 0),
+       COALESCE(sg.cnt, 0),
+       CURRENT_TIMESTAMP
+FROM device d
+LEFT JOIN (
+    SELECT device_id,
+           COUNT(*) AS total,
+           SUM(CASE WHEN enable = 'Y' THEN 1 ELSE 0 END) AS active,
+           SUM(CASE WHEN action LIKE '%allow%' THEN 1 ELSE 0 END) AS allow,
+           SUM(CASE WHEN action LIKE '%deny%' THEN 1 ELSE 0 END) AS deny,
+           SUM(CASE WHEN usage_status = '미사용' THEN 1 ELSE 0 END) AS unused
+    FROM firewall_policy GROUP BY device_id
+) p ON p.device_id = d.id
+LEFT JOIN (SELECT device_id, COUNT(*) AS cnt FROM firewall_network_object GROUP BY device_id) no ON no.device_id = d.id
+LEFT JOIN (SELECT device_id, COUNT(*) AS cnt FROM firewall_network_group GROUP BY device_id) ng ON ng.device_id = d.id
+LEFT JOIN (SELECT device_id, COUNT(*) AS cnt FROM firewall_service_object GROUP BY device_id) so ON so.device_id = d.id
+LEFT JOIN (SELECT device_id, COUNT(*) AS cnt FROM firewall_service_group GROUP BY device_id) sg ON sg.device_id = d.id
+"""
+
+
+def upgrade():
+    op.create_table(
+        'device_stats',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('device_id', sa.Integer(), nullable=False),
+        *[sa.Column(column, sa.Integer(), nullable=False, server_default='0') for column in COUNT_COLUMNS],
+        sa.Column('last_sync_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['device_id'], ['device.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('device_id')
+    )
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade():
+    op.drop_table('device_stats')
@@ -0,0 +1,39 @@
+"""Add composite indexes for hot lookup columns
+
+Revision ID: a4f7c2d91e08
+Revises: 9d3e4f5a6b7c
+Create Date: 2026-10-18 15:26:09.731842
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4f7c2d91e08'
+down_revision = '9d3e4f5a6b7c'
+branch_labels = None
+depends_on = None
+
+# (인덱스명, 테이블, 컬럼 목록)
+INDEXES = [
+    ('ix_device_name', 'device', ['name']),
+    ('ix_firewall_policy_device_rule_name', 'firewall_policy', ['device_id', 'rule_name']),
+    ('ix_firewall_policy_device_seq', 'firewall_policy', ['device_id', 'seq']),
+    ('ix_firewall_network_object_device_name', 'firewall_network_object', ['device_id', 'name']),
+    ('ix_firewall_network_group_device_group_name', 'firewall_network_group', ['device_id', 'group_name']),
+    ('ix_firewall_service_object_device_name', 'firewall_service_object', ['device_id', 'name']),
+    ('ix_firewall_service_group_device_group_name', 'firewall_service_group', ['device_id', 'group_name']),
+    ('ix_sync_history_device_created_at', 'sync_history', ['device_id', 'created_at']),
+    ('ix_sync_task_status_priority_queue_position', 'sync_task', ['status', 'priority', 'queue_position']),
+    ('ix_sync_task_device_status', 'sync_task', ['device_id', 'status']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
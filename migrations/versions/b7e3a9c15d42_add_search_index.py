@@ -0,0 +1,68 @@
+"""Add FTS5 full-text search index for policies and objects
+
+Revision ID: b7e3a9c15d42
+Revises: a4f7c2d91e08
+Create Date: 2026-10-18 16:41:52.206317
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e3a9c15d42'
+down_revision = 'a4f7c2d91e08'
+branch_labels = None
+depends_on = None
+
+# 원본 테이블과 검색 컬럼 (app.services.search_index.SEARCH_INDEXES와 같아야 함)
+SEARCH_INDEXES = {
+    'firewall_policy': ('rule_name', 'source', 'destination', 'service', 'user', 'application',
+                        'vsys', 'security_profile', 'category'),
+    'firewall_network_object': ('name', 'value'),
+    'firewall_network_group': ('group_name', 'entry'),
+    'firewall_service_object': ('name', 'port'),
+    'firewall_service_group': ('group_name', 'entry'),
+}
+
+
+def is_supported(bind):
+    """SQLite 3.34 이상이고 FTS5가 포함된 빌드인지 확인 (그 외 DB는 ILIKE 검색 사용)"""
+    if bind.dialect.name != 'sqlite':
+        return False
+    version = bind.exec_driver_sql('SELECT sqlite_version()').scalar()
+    if tuple(int(part) for part in version.split('.')[:2]) < (3, 34):
+        return False
+    return 'ENABLE_FTS5' in {row[0] for row in bind.exec_driver_sql('PRAGMA compile_options')}
+
+
+def upgrade():
+    bind = op.get_bind()
+    if not is_supported(bind):
+        return
+
+    for table, columns in SEARCH_INDEXES.items():
+        fts = f'{table}_fts'
+        names = ', '.join(columns)
+        new_values = ', '.join(f'new.{name}' for name in columns)
+        old_values = ', '.join(f'old.{name}' for name in columns)
+        insert_new = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values});"
+        delete_old = f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values});"
+
+        op.execute(f"CREATE VIRTUAL TABLE {fts} USING fts5({names}, "
+                   f"content='{table}', content_rowid='id', tokenize='trigram')")
+        op.execute(f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {insert_new} END")
+        op.execute(f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN {delete_old} END")
+        op.execute(f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {names} ON {table} BEGIN {delete_old} {insert_new} END")
+        op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'sqlite':
+        return
+
+    for table in reversed(list(SEARCH_INDEXES)):
+        fts = f'{table}_fts'
+        for suffix in ('ai', 'ad', 'au'):
+            op.execute(f'DROP TRIGGER IF EXISTS {fts}_{suffix}')
+        op.execute(f'DROP TABLE IF EXISTS {fts}')
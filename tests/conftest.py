@@ -3,4 +3,9 @@ import sys
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root) 
\ No newline at end of file
+sys.path.insert(0, project_root) 
+
+# 테스트 중에는 백그라운드 동기화 워커가 테스트 DB의 작업을 가져가지 않도록 비활성화
+os.environ.setdefault('SYNC_WORKER_ENABLED', 'false')
+# 테스트 중에는 PaloAlto API 키를 파일에 저장하지 않음
+os.environ.setdefault('PALOALTO_KEY_CACHE_FILE', '')
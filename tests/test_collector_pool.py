@@ -0,0 +1,50 @@
+from app.firewall_module.collector_factory import FirewallCollectorFactory
+from app.firewall_module.collector_pool import CollectorPool
+
+MOCK_CONFIG = {'hostname': '192.0.2.20', 'username': 'admin', 'password': 'secret'}
+
+
+class FakeCollector:
+    """close 호출 여부를 기록하는 수집기 대용"""
+
+    def __init__(self, name):
+        self.name = name
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_factory_reuses_collector_within_batch():
+    """같은 장비/배치의 동기화 단계는 같은 수집기를 사용해야 합니다."""
+    try:
+        first = FirewallCollectorFactory.get_collector('mock', batch_id='batch-a', device_id=1, **MOCK_CONFIG)
+        second = FirewallCollectorFactory.get_collector('mock', batch_id='batch-a', device_id=1, **MOCK_CONFIG)
+        other_batch = FirewallCollectorFactory.get_collector('mock', batch_id='batch-b', device_id=1, **MOCK_CONFIG)
+        unpooled = FirewallCollectorFactory.get_collector('mock', batch_id='batch-a', **MOCK_CONFIG)
+
+        assert first is second
+        assert other_batch is not first
+        assert unpooled is not first
+    finally:
+        FirewallCollectorFactory.release_batch('batch-a')
+
+    assert FirewallCollectorFactory.get_collector('mock', batch_id='batch-a', device_id=1, **MOCK_CONFIG) is not first
+    FirewallCollectorFactory.release_batch('batch-a')
+    FirewallCollectorFactory.release_batch('batch-b')
+    assert len(FirewallCollectorFactory._pool) == 0
+
+
+def test_pool_evicts_least_recently_used_collector():
+    """풀 크기를 넘으면 가장 오래 사용하지 않은 수집기를 정리해야 합니다."""
+    pool = CollectorPool(max_size=2)
+    first = pool.get(1, 'batch', lambda: FakeCollector('first'))
+    second = pool.get(2, 'batch', lambda: FakeCollector('second'))
+    assert pool.get(1, 'batch', lambda: FakeCollector('unused')) is first
+
+    third = pool.get(3, 'batch', lambda: FakeCollector('third'))
+
+    assert second.closed and not first.closed
+    assert len(pool) == 2
+    assert pool.release('batch') == 2
+    assert first.closed and third.closed
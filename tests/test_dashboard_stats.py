@@ -0,0 +1,224 @@
+import importlib.util
+import os
+import pytest
+import pandas as pd
+from sqlalchemy import event, text
+from app import create_app, db
+from app.models import Device, DeviceStats
+from app.models.firewall import (
+    FirewallPolicy,
+    FirewallNetworkObject,
+    FirewallNetworkGroup,
+    FirewallServiceObject
+)
+from app.services.dashboard_stats import build_dashboard_stats, get_dashboard_stats, invalidate_dashboard_stats
+from app.services.firewall import SyncQueueService, sync_firewall_policies, sync_network_objects, sync_usage_logs
+from app.services.firewall.device_stats import refresh_device_stats, rebuild_all_device_stats
+
+@pytest.fixture
+def app():
+    """테스트용 Flask 앱 생성"""
+    app = create_app()
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    return app
+
+@pytest.fixture
+def db_session(app):
+    """테스트용 데이터베이스 세션"""
+    with app.app_context():
+        db.create_all()
+        invalidate_dashboard_stats()
+        yield db
+        invalidate_dashboard_stats()
+        db.session.remove()
+        db.drop_all()
+
+def add_device(index, policies, usage_status=None):
+    """정책과 객체를 가진 테스트용 장비 추가 (policies: (enable, action) 목록)"""
+    device = Device(
+        name=f'FW-{index}',
+        category='firewall',
+        sub_category='paloalto',
+        ip_address=f'192.168.1.{index}',
+        username='admin',
+        password='test123!'
+    )
+    db.session.add(device)
+    db.session.flush()
+    for seq, (enable, action) in enumerate(policies):
+        db.session.add(FirewallPolicy(device_id=device.id, rule_name=f'rule_{seq}', seq=seq,
+                                      enable=enable, action=action, usage_status=usage_status,
+                                      firewall_type='paloalto'))
+    for seq in range(index):
+        db.session.add(FirewallNetworkObject(device_id=device.id, name=f'host_{seq}', type='ip-netmask',
+                                             value=f'10.0.0.{seq}', firewall_type='paloalto'))
+    db.session.add(FirewallNetworkGroup(device_id=device.id, group_name='grp', entry='host_0',
+                                        firewall_type='paloalto'))
+    db.session.add(FirewallServiceObject(device_id=device.id, name='http', protocol='tcp', port='80',
+                                         firewall_type='paloalto'))
+    refresh_device_stats(device.id)
+    db.session.commit()
+    return device
+
+def count_queries(func):
+    """함수 실행 중 발생한 SQL 쿼리 수를 반환"""
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        func()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+    return len(statements)
+
+def test_dashboard_stats_per_device(db_session):
+    """장비별/전체 정책 및 객체 수가 집계되어야 합니다."""
+    add_device(1, [('Y', 'allow'), ('N', 'allow'), ('Y', 'deny')])
+    add_device(2, [('Y', 'allow')])
+    add_device(3, [])
+
+    data = build_dashboard_stats()
+
+    assert data['devices'] == {'total': 3}
+    assert data['policies'] == {'total': 4, 'active': 3, 'inactive': 1, 'allow': 3, 'deny': 1, 'unused': 0}
+    assert data['objects'] == {'total': 12, 'network': 6, 'network_group': 3, 'service': 3, 'service_group': 0}
+
+    stats = {item['name']: item for item in data['device_stats']}
+    assert stats['FW-1']['policies'] == {'total': 3, 'active': 2, 'inactive': 1, 'allow': 2, 'deny': 1, 'unused': 0}
+    assert stats['FW-2']['objects'] == {'total': 4, 'network': 2, 'network_group': 1, 'service': 1, 'service_group': 0}
+    assert stats['FW-3']['policies'] == {'total': 0, 'active': 0, 'inactive': 0, 'allow': 0, 'deny': 0, 'unused': 0}
+
+def test_dashboard_query_count_does_not_grow_with_devices(db_session):
+    """장비 수가 늘어도 대시보드 쿼리 수는 일정해야 합니다."""
+    add_device(1, [('Y', 'allow')])
+    few = count_queries(build_dashboard_stats)
+
+    for index in range(2, 12):
+        add_device(index, [('Y', 'allow'), ('N', 'deny')])
+    many = count_queries(build_dashboard_stats)
+
+    assert few == many == 1
+
+def test_dashboard_cache_invalidated_on_task_completion(db_session):
+    """동기화 작업이 완료되면 캐시된 통계가 무효화되어야 합니다."""
+    device = add_device(1, [('Y', 'allow')])
+    assert get_dashboard_stats()['policies']['total'] == 1
+
+    db.session.add(FirewallPolicy(device_id=device.id, rule_name='rule_new', seq=10,
+                                  enable='Y', action='deny', firewall_type='paloalto'))
+    refresh_device_stats(device.id, ['security_rules'])
+    db.session.commit()
+    assert count_queries(get_dashboard_stats) == 0
+    assert get_dashboard_stats()['policies']['total'] == 1
+
+    success, task = SyncQueueService.create_task(device.id, ['policies'])
+    assert success
+    success, _ = SyncQueueService.complete_task(task.id)
+    assert success
+
+    assert get_dashboard_stats()['policies'] == {'total': 2, 'active': 2, 'inactive': 0, 'allow': 1, 'deny': 1, 'unused': 0}
+
+class FakeCollector:
+    """동기화 서비스 테스트용 수집기"""
+    def export_security_rules(self):
+        return pd.DataFrame({
+            'Seq': [1, 2, 3],
+            'Rule Name': ['rule_1', 'rule_2', 'rule_3'],
+            'Enable': ['Y', 'Y', 'N'],
+            'Action': ['allow', 'deny', 'allow'],
+        })
+
+    def export_network_objects(self):
+        return pd.DataFrame({'Name': ['host_1', 'host_2'], 'Type': ['ip-netmask'] * 2, 'Value': ['10.0.0.1', '10.0.0.2']})
+
+    def export_usage_logs(self, days=90):
+        return pd.DataFrame({'Rule Name': ['rule_1', 'rule_3'], 'Last Hit Date': ['', ''],
+                             'Unused Days': [120, 200], '미사용여부': ['미사용', '미사용']})
+
+def test_sync_services_update_device_stats(db_session, monkeypatch):
+    """동기화 서비스는 결과 저장과 함께 장비 통계를 갱신해야 합니다."""
+    device = add_device(1, [])
+    for module in ('policies', 'network_objects', 'usage_logs'):
+        monkeypatch.setattr(f'app.services.firewall.{module}.get_device_and_collector',
+                            lambda device_id, batch_id=None: (db.session.get(Device, device_id), FakeCollector(), None))
+
+    assert sync_firewall_policies(device.id)[0]
+    stats = DeviceStats.query.filter_by(device_id=device.id).one()
+    assert stats.policies == {'total': 3, 'active': 2, 'inactive': 1, 'allow': 2, 'deny': 1, 'unused': 0}
+    assert stats.network_object_count == 1
+
+    assert sync_network_objects(device.id)[0]
+    assert sync_usage_logs(device.id)[0]
+    db.session.refresh(stats)
+    assert stats.network_object_count == 2
+    assert stats.policy_unused == 2
+    assert stats.objects == {'total': 4, 'network': 2, 'network_group': 1, 'service': 1, 'service_group': 0}
+    assert stats.last_sync_at is not None
+
+def test_backfill_matches_rebuild(db_session):
+    """마이그레이션의 통계 채우기 SQL은 rebuild_all_device_stats와 같은 결과를 내야 합니다."""
+    add_device(1, [('Y', 'allow'), ('N', 'deny')], usage_status='미사용')
+    add_device(2, [('Y', 'allow')])
+    add_device(3, [])
+
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        'migrations', 'versions', '9d3e4f5a6b7c_add_device_stats.py')
+    spec = importlib.util.spec_from_file_location('device_stats_migration', path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    DeviceStats.query.delete()
+    db.session.execute(text(migration.BACKFILL_SQL))
+    db.session.commit()
+    backfilled = {stats.device_id: (stats.policies, stats.objects) for stats in DeviceStats.query.all()}
+
+    DeviceStats.query.delete()
+    assert rebuild_all_device_stats() == 3
+    db.session.commit()
+    rebuilt = {stats.device_id: (stats.policies, stats.objects) for stats in DeviceStats.query.all()}
+
+    assert backfilled == rebuilt
+    assert backfilled[1][0]['unused'] == 2
+
+def test_create_all_backfills_missing_device_stats(db_session):
+    """create_all로 통계 테이블만 새로 생긴 기존 설치본은 기존 데이터로 통계를 채워야 합니다."""
+    add_device(1, [('Y', 'allow'), ('N', 'deny')], usage_status='미사용')
+    add_device(2, [('Y', 'allow')])
+    expected = {stats.device_id: (stats.policies, stats.objects) for stats in DeviceStats.query.all()}
+
+    DeviceStats.query.delete()
+    db.session.commit()
+    db.create_all()
+
+    backfilled = {stats.device_id: (stats.policies, stats.objects) for stats in DeviceStats.query.all()}
+    assert backfilled == expected
+    assert build_dashboard_stats()['policies']['total'] == 3
+
+    # 통계가 이미 있으면 다시 계산하지 않습니다.
+    stats = DeviceStats.query.filter_by(device_id=1).one()
+    stats.policy_total = 99
+    db.session.commit()
+    db.create_all()
+    db.session.refresh(stats)
+    assert stats.policy_total == 99
+
+def test_dashboard_cache_invalidated_on_device_changes(db_session, app):
+    """장비 등록/수정/삭제 후 대시보드에 바로 반영되어야 합니다."""
+    add_device(1, [('Y', 'allow')])
+    assert get_dashboard_stats()['devices'] == {'total': 1}
+    client = app.test_client()
+    form = {'name': 'FW-new', 'category': 'firewall', 'sub_category': 'paloalto', 'manufacturer': 'PaloAlto',
+            'model': 'PA-220', 'version': '10.1', 'ip_address': '192.168.1.50', 'port': '443',
+            'username': 'admin', 'password': 'test123!'}
+
+    client.post('/devices/create', data=form)
+    stats = get_dashboard_stats()
+    assert stats['devices'] == {'total': 2}
+    device_id = next(item['id'] for item in stats['device_stats'] if item['name'] == 'FW-new')
+
+    client.post(f'/devices/{device_id}/edit', data=dict(form, name='FW-renamed', password=''))
+    assert 'FW-renamed' in [item['name'] for item in get_dashboard_stats()['device_stats']]
+
+    client.post(f'/devices/{device_id}/delete')
+    assert get_dashboard_stats()['devices'] == {'total': 1}
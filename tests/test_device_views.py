@@ -0,0 +1,115 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import event
+from app import create_app, db
+from app.models import Device, FirewallSystemInfo, SyncHistory, SyncTask
+from app.routes.devices.views import load_sync_info
+
+@pytest.fixture
+def app():
+    """테스트용 Flask 앱 생성"""
+    app = create_app()
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    return app
+
+@pytest.fixture
+def db_session(app):
+    """테스트용 데이터베이스 세션"""
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+def add_device(index):
+    """동기화 이력과 작업을 가진 테스트용 장비 추가"""
+    device = Device(
+        name=f'FW-{index}',
+        category='firewall',
+        sub_category='paloalto',
+        ip_address=f'192.168.1.{index}',
+        username='admin',
+        password='test123!'
+    )
+    db.session.add(device)
+    db.session.flush()
+
+    base = datetime(2026, 1, 1) + timedelta(hours=index)
+    if index % 2:
+        db.session.add(FirewallSystemInfo(device_id=device.id, hostname=f'fw-{index}'))
+    for offset in range(index % 3 + 1):
+        db.session.add(SyncHistory(device_id=device.id, sync_type='security_rules', status='success',
+                                   message=f'history {offset}', created_at=base + timedelta(minutes=offset)))
+    for offset, status in enumerate(['completed', 'failed', 'canceled'][:index % 4]):
+        db.session.add(SyncTask(device_id=device.id, task_name=f'done {offset}', sync_types='policies',
+                                status=status, created_at=base, completed_at=base + timedelta(minutes=offset)))
+    if index % 3 == 0:
+        db.session.add(SyncTask(device_id=device.id, task_name='active', sync_types='policies',
+                                status='running', created_at=base + timedelta(minutes=10)))
+        db.session.add(SyncTask(device_id=device.id, task_name='queued', sync_types='policies',
+                                status='pending', created_at=base + timedelta(minutes=20)))
+    db.session.commit()
+    return device
+
+def naive_sync_info(device):
+    """장비별로 조회하는 기존 방식"""
+    active_task = SyncTask.query.filter(
+        SyncTask.device_id == device.id,
+        SyncTask.status.in_(['pending', 'running'])
+    ).order_by(SyncTask.created_at.desc()).first()
+    last_task = None
+    if not active_task:
+        last_task = SyncTask.query.filter(
+            SyncTask.device_id == device.id,
+            SyncTask.status.in_(['completed', 'failed', 'canceled'])
+        ).order_by(SyncTask.completed_at.desc()).first()
+    return {
+        'system_info': FirewallSystemInfo.query.filter_by(device_id=device.id).first(),
+        'last_sync': SyncHistory.query.filter_by(device_id=device.id).order_by(SyncHistory.created_at.desc()).first(),
+        'stats': None,
+        'active_task': active_task,
+        'last_task': last_task
+    }
+
+def count_queries(func):
+    """함수 실행 중 발생한 SQL 쿼리 수와 결과를 반환"""
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db.engine, 'before_cursor_execute', listener)
+    try:
+        result = func()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', listener)
+    return len(statements), result
+
+def test_load_sync_info_matches_per_device_queries(db_session):
+    """일괄 조회 결과는 장비별 조회 결과와 같아야 합니다."""
+    devices = [add_device(index) for index in range(1, 13)]
+
+    sync_info = load_sync_info(devices, include_tasks=True)
+
+    assert sync_info == {device.id: naive_sync_info(device) for device in devices}
+    assert sync_info[devices[2].id]['active_task'].task_name == 'queued'
+    assert sync_info[devices[6].id]['last_task'].status == 'canceled'
+    assert set(load_sync_info(devices)[devices[0].id]) == {'system_info', 'last_sync', 'stats'}
+
+def test_load_sync_info_query_count_is_constant(db_session):
+    """페이지의 장비 수와 관계없이 쿼리 수가 일정해야 합니다."""
+    for index in range(1, 13):
+        add_device(index)
+    devices = Device.query.order_by(Device.id).all()
+    few, _ = count_queries(lambda: load_sync_info(devices[:2], include_tasks=True))
+    many, _ = count_queries(lambda: load_sync_info(devices, include_tasks=True))
+
+    assert few == many <= 5
+
+def test_device_list_renders(db_session, app):
+    """장비 목록 AJAX 응답이 정상적으로 생성되어야 합니다."""
+    for index in range(1, 4):
+        add_device(index)
+
+    response = app.test_client().get('/devices/list')
+
+    assert response.status_code == 200
+    assert 'FW-3' in response.get_json()['html']
@@ -0,0 +1,132 @@
+import pytest
+import pandas as pd
+from app import create_app, db
+from app.models import Device, FirewallPolicy, FirewallNetworkGroup
+from app.services.firewall.bulk_writer import replace_device_rows, dataframe_to_records, sync_device_rows
+from app.services.firewall.usage_logs import merge_usage_logs
+
+@pytest.fixture
+def app():
+    """테스트용 Flask 앱 생성"""
+    app = create_app()
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    return app
+
+@pytest.fixture
+def db_session(app):
+    """테스트용 데이터베이스 세션"""
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+@pytest.fixture
+def device(db_session):
+    """테스트용 방화벽 장비"""
+    device = Device(
+        name='Test-Firewall',
+        category='firewall',
+        sub_category='paloalto',
+        ip_address='192.168.1.1',
+        username='admin',
+        password='test123!'
+    )
+    db_session.session.add(device)
+    db_session.session.commit()
+    return device
+
+def make_policies(count):
+    """수집기 형식의 정책 DataFrame 생성"""
+    return pd.DataFrame({
+        'Vsys': ['vsys1'] * count,
+        'Seq': range(1, count + 1),
+        'Rule Name': [f'rule_{i}' for i in range(count)],
+        'Enable': ['Y'] * count,
+        'Action': ['allow'] * count,
+        'Source': ['any'] * count,
+        'Destination': ['any'] * count,
+        'Service': ['any'] * count,
+        'Unknown Column': ['x'] * count,
+    })
+
+def test_dataframe_to_records_maps_columns(device):
+    """DataFrame 컬럼이 모델 필드로 변환되어야 합니다."""
+    records = dataframe_to_records(FirewallPolicy, make_policies(1), device)
+
+    assert records[0]['rule_name'] == 'rule_0'
+    assert records[0]['vsys'] == 'vsys1'
+    assert records[0]['seq'] == 1
+    assert records[0]['device_id'] == device.id
+    assert records[0]['firewall_type'] == 'paloalto'
+    assert 'unknown_column' not in records[0]
+
+def test_replace_device_rows_in_chunks(db_session, device):
+    """청크 단위로 저장하고 기존 행은 교체해야 합니다."""
+    replace_device_rows(FirewallPolicy, make_policies(5), device, chunk_size=2)
+    db_session.session.commit()
+    assert FirewallPolicy.query.filter_by(device_id=device.id).count() == 5
+
+    replace_device_rows(FirewallPolicy, make_policies(3), device, chunk_size=2)
+    db_session.session.commit()
+    policies = FirewallPolicy.query.filter_by(device_id=device.id).order_by(FirewallPolicy.seq).all()
+    assert [policy.rule_name for policy in policies] == ['rule_0', 'rule_1', 'rule_2']
+    assert all(policy.last_sync_at is not None for policy in policies)
+
+def test_group_rows_use_collector_columns(db_session, device):
+    """그룹은 수집기의 'Group Name', 'Entry' 컬럼으로 저장되어야 합니다."""
+    groups_df = pd.DataFrame({'Group Name': ['grp_1'], 'Entry': ['host_1,host_2']})
+    replace_device_rows(FirewallNetworkGroup, groups_df, device)
+    db_session.session.commit()
+
+    group = FirewallNetworkGroup.query.one()
+    assert group.group_name == 'grp_1'
+    assert group.entry == 'host_1,host_2'
+
+
+def test_sync_device_rows_applies_only_changes(db_session, device):
+    """증분 동기화는 변경된 행만 추가/수정/삭제해야 합니다."""
+    counts = sync_device_rows(FirewallPolicy, make_policies(4), device, chunk_size=2)
+    db_session.session.commit()
+    assert counts == {'inserted': 4, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+    ids = {policy.rule_name: policy.id for policy in FirewallPolicy.query.all()}
+
+    # rule_1 변경, rule_3 삭제, rule_9 추가
+    policies_df = make_policies(3)
+    policies_df.loc[1, 'Action'] = 'deny'
+    policies_df.loc[len(policies_df)] = policies_df.loc[0].to_dict() | {'Seq': 10, 'Rule Name': 'rule_9'}
+    counts = sync_device_rows(FirewallPolicy, policies_df, device, chunk_size=2)
+    db_session.session.commit()
+
+    assert counts == {'inserted': 1, 'updated': 1, 'deleted': 1, 'unchanged': 2}
+    policies = {policy.rule_name: policy for policy in FirewallPolicy.query.all()}
+    assert set(policies) == {'rule_0', 'rule_1', 'rule_2', 'rule_9'}
+    assert policies['rule_1'].action == 'deny'
+    # 변경되지 않은 행은 기존 ID를 유지합니다.
+    assert policies['rule_0'].id == ids['rule_0']
+    assert policies['rule_1'].id == ids['rule_1']
+
+    counts = sync_device_rows(FirewallPolicy, policies_df, device)
+    assert counts['unchanged'] == 4
+
+def test_merge_usage_logs_updates_policies_in_bulk(db_session, device):
+    """사용 이력은 규칙명으로 병합되어 마지막 사용 일시까지 저장되어야 합니다."""
+    replace_device_rows(FirewallPolicy, make_policies(3), device)
+    db_session.session.commit()
+
+    usage_logs_df = pd.DataFrame({
+        'Rule Name': ['rule_0', 'rule_2', 'rule_missing'],
+        'Last Hit Date': ['2025-03-01', None, '2025-03-02 10:00:00'],
+        'Unused Days': [10, 90, 1],
+        '미사용여부': ['사용', '미사용', '사용'],
+    })
+    assert merge_usage_logs(device, usage_logs_df, chunk_size=1) == 2
+    db_session.session.commit()
+
+    policies = {policy.rule_name: policy for policy in FirewallPolicy.query.all()}
+    assert policies['rule_0'].last_hit_date == '2025-03-01 00:00:00'
+    assert policies['rule_0'].unused_days == 10
+    assert policies['rule_2'].last_hit_date is None
+    assert policies['rule_2'].usage_status == '미사용'
+    assert policies['rule_1'].usage_status is None
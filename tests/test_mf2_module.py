@@ -0,0 +1,117 @@
+import random
+from app.firewall_module.mf2.mf2_module import (
+    extract_braces_of_depth_1_or_more,
+    extract_braces_of_depth_2_or_more_without_outer_braces,
+    network_parsing,
+    rule_parsing,
+)
+
+
+def reference_depth_1(content):
+    """기존 문자 단위 구현 (비교 기준)"""
+    depth = 0
+    results = []
+    temp = ""
+    for char in content:
+        if char == '{':
+            if depth == 0:
+                temp = ""
+            temp += char
+            depth += 1
+        elif char == '}':
+            temp += char
+            depth -= 1
+            if depth == 0:
+                results.append(temp.strip())
+        elif depth >= 1:
+            temp += char
+    return results
+
+
+def reference_depth_2(content):
+    """기존 문자 단위 구현 (비교 기준)"""
+    depth = 0
+    results = []
+    temp = ""
+    for char in content:
+        if char == '{':
+            if depth >= 1:
+                temp += char
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth >= 1:
+                temp += char
+                if depth == 1:
+                    results.append(temp[1:-1].strip())
+                    temp = ""
+        elif depth >= 2:
+            temp += char
+    return results
+
+
+def test_tokenizer_matches_reference_on_rule_file():
+    """MF2 규칙 파일 형식에서 기존 구현과 같은 결과를 반환해야 합니다."""
+    content = (
+        '{ {\n{rid=1, description="web", use="1", action="1", group=1, from = {"obj a"},  to = {},  service = {}},\n'
+        '  {rid=2, use="0", action="0", group=1, from = {"obj b","obj c"},  to = {"x y"},  service = {}} }, {meta} }'
+    )
+    for remove_newlines in (False, True):
+        expected_source = content.replace('\n', '') if remove_newlines else content
+        assert (extract_braces_of_depth_2_or_more_without_outer_braces(content, remove_newlines=remove_newlines)
+                == reference_depth_2(expected_source))
+        assert (extract_braces_of_depth_1_or_more(content, remove_newlines=remove_newlines)
+                == reference_depth_1(expected_source))
+
+
+def test_tokenizer_matches_reference_on_random_input():
+    """불균형 중괄호를 포함한 임의 입력에서도 기존 구현과 같아야 합니다."""
+    rng = random.Random(1234)
+    alphabet = '{{}}ab \n,"='
+    for _ in range(2000):
+        content = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        assert extract_braces_of_depth_1_or_more(content) == reference_depth_1(content)
+        assert extract_braces_of_depth_2_or_more_without_outer_braces(content) == reference_depth_2(content)
+        assert (extract_braces_of_depth_2_or_more_without_outer_braces(content, remove_newlines=True)
+                == reference_depth_2(content.replace('\n', '')))
+        assert (extract_braces_of_depth_1_or_more(content, remove_newlines=True)
+                == reference_depth_1(content.replace('\n', '')))
+
+
+def test_rule_parsing_extracts_first_field_values(tmp_path):
+    """규칙 블록의 각 필드는 첫 번째로 일치한 값으로 추출되어야 합니다."""
+    rule_file = tmp_path / 'rules.fwrules'
+    rule_file.write_text(
+        '{ {\n'
+        '{rid=10, description="web", use="1", action="1", group=1, shaping_string="time="work", bi_di=0, '
+        'from = {"1 host_a","2 host_b"},  to = {},  service = {"3 tcp_80"},  vid=0, ua = {}, unuse=0},\n'
+        '{rid=11, use="0", action="0", group=1, shaping_string="", bi_di=0, '
+        'from = {},  to = {"4 net_1"},  service = {},  vid=0, ua = {"5 user_1"}, unuse=0}\n'
+        '}, {meta} }',
+        encoding='utf-8'
+    )
+
+    rules = rule_parsing(str(rule_file))
+
+    assert list(rules['Rule Name']) == [10, 11]
+    assert list(rules['Source']) == ['host_a,host_b', 'Any']
+    assert list(rules['Destination']) == ['Any', 'net_1']
+    assert list(rules['Service']) == ['tcp_80', 'Any']
+    assert list(rules['User']) == ['Any', 'user_1']
+    assert list(rules['Description']) == ['web', '']
+    assert list(rules['Security Profile']) == ['work', '']
+
+
+def test_network_parsing_selects_range_or_mask_fields(tmp_path):
+    """네트워크 객체는 range 여부에 따라 다른 필드 패턴을 사용해야 합니다."""
+    network_file = tmp_path / 'networkobject.conf'
+    network_file.write_text(
+        '{ {info},\n {id = 3, name = "net_1", ip="10.1.0.0", mask="24"},\n'
+        ' {id = 4, name = "range_1", rangestart="10.2.0.1", rangeend="10.2.0.9"} }',
+        encoding='utf-8'
+    )
+
+    networks = network_parsing(str(network_file))
+
+    assert list(networks['ip/start']) == ['10.1.0.0', '10.2.0.1']
+    assert list(networks['mask/end']) == ['24', '10.2.0.9']
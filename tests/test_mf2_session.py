@@ -0,0 +1,102 @@
+import os
+import pytest
+from app.firewall_module.collector_factory import FirewallCollectorFactory
+from app.firewall_module.mf2.mf2_session import MF2Session, mf2_sessions
+
+CONF_FILES = {
+    'hostobject.conf': '{ {info},\n {id = 1, name = "host_1", ip = "10.0.0.1", d = "web"},\n {id = 2, name = "host_2", ip = "10.0.0.2"} }',
+    'networkobject.conf': '{ {info},\n {id = 3, name = "net_1", ip="10.1.0.0", mask="24"},\n {id = 4, name = "range_1", rangestart="10.2.0.1", rangeend="10.2.0.9"} }',
+    'groupobject.conf': '{ {info},\n {id = 5, name = "grp_1", count = {h=2}, hosts={[1]=1,[2]=1}, networks={[3]=1}, } }',
+    'serviceobject.conf': '{ {a}, {b},\n {id = 7, name = "tcp_80", protocol="TCP", str_src_port="any", str_svc_port="80", svc_type="1", d = "http"} }',
+}
+
+
+class FakeStdout:
+    def __init__(self, lines):
+        self.lines = lines
+
+    def readlines(self):
+        return self.lines
+
+
+class FakeTransport:
+    def is_active(self):
+        return True
+
+
+class FakeSSHClient:
+    """원격 명령 결과만 흉내 내는 SSHClient 대용"""
+
+    def __init__(self):
+        self.closed = False
+
+    def exec_command(self, command):
+        if 'ls *.conf' in command:
+            return None, FakeStdout([f'{name}\n' for name in CONF_FILES]), None
+        return None, FakeStdout([]), None
+
+    def get_transport(self):
+        return FakeTransport()
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_ssh(monkeypatch):
+    """SSH 연결과 SCP 다운로드를 기록하는 가짜 세션"""
+    calls = {'connect': 0, 'download': []}
+
+    def fake_open_client(self):
+        calls['connect'] += 1
+        return FakeSSHClient()
+
+    def fake_scp_get(self, remote_path, local_path):
+        file_name = os.path.basename(remote_path)
+        calls['download'].append(file_name)
+        with open(local_path, 'w', encoding='utf-8') as file:
+            file.write(CONF_FILES[file_name])
+
+    monkeypatch.setattr(MF2Session, '_open_client', fake_open_client)
+    monkeypatch.setattr(MF2Session, '_scp_get', fake_scp_get)
+    yield calls
+    mf2_sessions.release('batch-test')
+
+
+def test_batch_reuses_one_session_and_downloads(fake_ssh):
+    """같은 배치의 export는 SSH 연결 1회, 파일별 다운로드 1회만 수행해야 합니다."""
+    collectors = [
+        FirewallCollectorFactory.get_collector(
+            'mf2', batch_id='batch-test', hostname='192.0.2.10', username='admin', password='secret'
+        )
+        for _ in range(3)
+    ]
+
+    objects = collectors[0].export_network_objects()
+    groups = collectors[1].export_network_group_objects()
+    services = collectors[2].export_service_objects()
+
+    assert fake_ssh['connect'] == 1
+    assert sorted(fake_ssh['download']) == sorted(CONF_FILES)
+    assert list(objects['Value']) == ['10.0.0.1', '10.0.0.2', '10.1.0.0/24', '10.2.0.1-10.2.0.9']
+    assert list(objects['Type']) == ['ip-netmask', 'ip-netmask', 'ip-netmask', 'ip-range']
+    assert groups.iloc[0]['Entry'] == '10.0.0.1,10.0.0.2,10.1.0.0/24'
+    assert services.iloc[0]['Protocol'] == 'tcp'
+
+    session = mf2_sessions.get('192.0.2.10', 'admin', 'secret', 'batch-test')
+    local_directory = session.local_directory
+    assert FirewallCollectorFactory.release_batch('batch-test') is None
+    assert len(mf2_sessions) == 0
+    assert not os.path.exists(local_directory)
+
+
+def test_collector_without_batch_closes_session(fake_ssh):
+    """배치 ID가 없으면 호출마다 세션을 열고 닫아야 합니다."""
+    collector = FirewallCollectorFactory.get_collector(
+        'mf2', hostname='192.0.2.10', username='admin', password='secret'
+    )
+    collector.export_service_objects()
+    collector.export_service_objects()
+
+    assert fake_ssh['connect'] == 2
+    assert len(mf2_sessions) == 0
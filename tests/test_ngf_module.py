@@ -0,0 +1,150 @@
+import threading
+import time
+from app.firewall_module.collector_factory import FirewallCollectorFactory
+from app.firewall_module.ngf.ngf_collector import NGFCollector
+from app.firewall_module.ngf.ngf_module import NGFClient
+from app.firewall_module.ngf.ngf_session import ngf_clients
+
+
+class FakeResponse:
+    """requests 응답 대용"""
+
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+
+class FakeHTTPSession:
+    """NGF API를 흉내내는 HTTP 세션 (동시 요청 수를 기록)"""
+
+    def __init__(self, group_count=1, expire_once=False):
+        self.group_count = group_count
+        self.expire_once = expire_once
+        self.login_count = 0
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def request(self, method, url, **kwargs):
+        if self.expire_once and kwargs['headers'].get('Authorization') == 'token-1':
+            self.expire_once = False
+            self.calls.append((method, url))
+            return FakeResponse({}, status_code=401)
+        return getattr(self, method.lower())(url, **kwargs)
+
+    def post(self, url, json=None, **kwargs):
+        self.calls.append(('POST', url))
+        if url.endswith('/login'):
+            self.login_count += 1
+            return FakeResponse({'result': {'api_token': f'token-{self.login_count}'}})
+
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self._lock:
+            self.in_flight -= 1
+
+        index = int(json['name'].split('_')[1])
+        mem_id = '' if index == 0 else f'{index};999'
+        return FakeResponse({'result': [{'name': json['name'], 'mem_id': mem_id}]})
+
+    def get(self, url, **kwargs):
+        self.calls.append(('GET', url))
+        if url.endswith('/host/4/objects'):
+            return FakeResponse({'result': [{'name': 'host_1', 'ip_list': '10.0.0.1'}]})
+        if url.endswith('/network/4/objects'):
+            return FakeResponse({'result': [
+                {'name': 'net_1', 'ip_list': {'ip_info1': '10.1.0.0', 'ip_info2': '24'}}
+            ]})
+        if url.endswith('/domain/4/objects'):
+            return FakeResponse({'result': [{'name': 'dmn_1', 'dmn_name': 'example.com'}]})
+        if url.endswith('/fw/4/rules'):
+            return FakeResponse({'result': [{'seq': 1, 'fw_rule_id': 'rule_1', 'name': 'r1', 'use': 1, 'action': 1}]})
+        if url.endswith('/service/objects'):
+            return FakeResponse({'result': [
+                {'srv_obj_id': index, 'name': f'svc_{index}', 'prtc_name': 'TCP', 'srv_port': str(index)} for index in range(self.group_count)
+            ]})
+        return FakeResponse({'result': [{'name': f'group_{index}'} for index in range(self.group_count)]})
+
+    def delete(self, url, **kwargs):
+        self.calls.append(('DELETE', url))
+        return FakeResponse({})
+
+    def close(self):
+        pass
+
+
+def test_service_group_details_are_fetched_concurrently():
+    """서비스 그룹 상세 정보는 max_workers 이내에서 동시에 조회되어야 합니다."""
+    client = NGFClient('192.0.2.1', 'client', 'secret', max_workers=4)
+    client.http = FakeHTTPSession(group_count=12)
+
+    groups = client.export_service_group_objects_with_members()
+
+    assert list(groups['Group Name']) == [f'group_{index}' for index in range(12)]
+    assert groups.iloc[0]['Entry'] == ''
+    assert groups.iloc[3]['Entry'] == 'svc_3,Unknown_999'
+    assert 1 < client.http.max_in_flight <= 4
+    assert [call for call in client.http.calls if call[1].endswith('/login')] == [
+        ('POST', 'https://192.0.2.1/api/au/external/login')
+    ]
+
+
+def logouts(http):
+    return [call for call in http.calls if call[0] == 'DELETE']
+
+
+def test_batch_collectors_share_one_login():
+    """같은 배치의 수집기는 한 번 로그인하고 배치 해제 시 한 번 로그아웃해야 합니다."""
+    first = FirewallCollectorFactory.get_collector(
+        'ngf', batch_id='ngf-batch', hostname='192.0.2.1', username='client', password='secret')
+    second = FirewallCollectorFactory.get_collector(
+        'ngf', batch_id='ngf-batch', hostname='192.0.2.1', username='client', password='secret')
+    assert first.client is second.client
+
+    http = FakeHTTPSession()
+    first.client.http = http
+    try:
+        network_objects = first.export_network_objects()
+        rules = second.export_security_rules()
+        second.export_service_objects()
+
+        assert list(network_objects['Value']) == ['10.0.0.1', '10.1.0.0/24', 'example.com']
+        assert list(rules['Rule Name']) == ['rule_1']
+        assert http.login_count == 1
+        assert logouts(http) == []
+    finally:
+        FirewallCollectorFactory.release_batch('ngf-batch')
+
+    assert len(logouts(http)) == 1
+    assert len(ngf_clients) == 0
+
+
+def test_collector_without_batch_logs_in_once_per_export():
+    """배치가 없으면 export 메서드마다 로그인/로그아웃하되, 메서드 안에서는 한 번만 수행해야 합니다."""
+    collector = NGFCollector('192.0.2.1', 'client', 'secret')
+    collector.client.http = http = FakeHTTPSession()
+
+    collector.export_network_objects()
+
+    assert http.login_count == 1
+    assert len(logouts(http)) == 1
+
+
+def test_expired_token_is_refreshed_once():
+    """토큰이 만료(401)되면 재로그인 후 같은 요청을 다시 보내야 합니다."""
+    client = NGFClient('192.0.2.1', 'client', 'secret')
+    client.http = http = FakeHTTPSession(expire_once=True)
+
+    rules = client.export_security_rules()
+
+    assert list(rules['Rule Name']) == ['rule_1']
+    assert http.login_count == 2
+    assert [call for call in http.calls if call[1].endswith('/fw/4/rules')] == [
+        ('GET', 'https://192.0.2.1/api/po/fw/4/rules')
+    ] * 2
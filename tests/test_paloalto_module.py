@@ -0,0 +1,260 @@
+import io
+import threading
+import pytest
+import pandas as pd
+from app.firewall_module.paloalto.paloalto_module import PaloAltoAPI
+from app.firewall_module.paloalto.config_snapshot import config_snapshot_cache
+from app.firewall_module.paloalto.api_key_cache import ApiKeyCache, api_key_cache
+
+SAMPLE_CONFIG = """<response status="success"><result><config><devices><entry name="localhost.localdomain">
+<vsys><entry name="vsys1">
+<address>
+  <entry name="host_1"><ip-netmask>10.0.0.1/32</ip-netmask></entry>
+  <entry name="range_1"><ip-range>10.0.0.10-10.0.0.20</ip-range></entry>
+</address>
+<address-group>
+  <entry name="grp_1"><static><member>host_1</member><member>range_1</member></static></entry>
+</address-group>
+<service>
+  <entry name="tcp_8080"><protocol><tcp><port>8080</port></tcp></protocol></entry>
+</service>
+<service-group>
+  <entry name="svc_grp"><members><member>tcp_8080</member></members></entry>
+</service-group>
+<rulebase><security><rules>
+  <entry name="rule_1">
+    <action>allow</action>
+    <source><member>grp_1</member></source>
+    <destination><member>any</member></destination>
+    <service><member>svc_grp</member></service>
+    <application><member>any</member></application>
+    <source-user><member>any</member></source-user>
+    <description>first
+rule</description>
+  </entry>
+  <entry name="rule_2">
+    <disabled>yes</disabled>
+    <action>deny</action>
+    <source><member>any</member></source>
+    <destination><member>host_1</member></destination>
+    <service><member>any</member></service>
+    <application><member>ssl</member></application>
+    <category><member>news</member></category>
+  </entry>
+</rules></security></rulebase>
+</entry></vsys>
+</entry></devices></config></result></response>"""
+
+
+class FakeStreamResponse:
+    """requests 스트리밍 응답 대용"""
+
+    def __init__(self, body):
+        self.raw = io.BytesIO(body.encode('utf-8'))
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(params=[True, False], ids=['streaming', 'tree'])
+def api(request, monkeypatch):
+    """keygen 없이 설정 XML을 반환하는 테스트용 PaloAltoAPI"""
+    calls = []
+
+    def fake_get_config(self, config_type='running'):
+        calls.append(config_type)
+        return SAMPLE_CONFIG
+
+    def fake_open_config_stream(self, config_type='running'):
+        calls.append(config_type)
+        response = FakeStreamResponse(SAMPLE_CONFIG)
+        return response, response.raw
+
+    monkeypatch.setattr(PaloAltoAPI, '_get_api_key', lambda self, username, password: 'test-key')
+    monkeypatch.setattr(PaloAltoAPI, 'get_config', fake_get_config)
+    monkeypatch.setattr(PaloAltoAPI, '_open_config_stream', fake_open_config_stream)
+    api = PaloAltoAPI('192.0.2.1', 'admin', 'secret', batch_id='batch-test', streaming=request.param)
+    api.config_calls = calls
+    yield api
+    config_snapshot_cache.invalidate()
+    api_key_cache.invalidate()
+
+
+def test_config_is_fetched_once_per_batch(api):
+    """같은 배치의 모든 export는 설정을 한 번만 가져와야 합니다."""
+    rules = api.export_security_rules()
+    addresses = api.export_network_objects()
+    address_groups = api.export_network_group_objects()
+    services = api.export_service_objects()
+    service_groups = api.export_service_group_objects()
+
+    assert api.config_calls == ['running']
+    assert list(rules['Rule Name']) == ['rule_1', 'rule_2']
+    assert list(rules['Enable']) == ['Y', 'N']
+    assert list(addresses['Type']) == ['ip-netmask', 'ip-range']
+    assert address_groups.iloc[0]['Entry'] == 'host_1,range_1'
+    assert services.iloc[0]['Port'] == '8080'
+    assert service_groups.iloc[0]['Entry'] == 'tcp_8080'
+
+
+def test_config_snapshot_invalidation(api):
+    """스냅샷을 무효화하면 다음 export에서 설정을 다시 가져와야 합니다."""
+    api.export_security_rules()
+    api.export_security_rules(config_type='candidate')
+    assert api.config_calls == ['running', 'candidate']
+
+    assert api.invalidate_config() == 2
+    api.export_network_objects()
+    assert api.config_calls == ['running', 'candidate', 'running']
+
+
+def test_streaming_matches_tree_parsing(monkeypatch):
+    """스트리밍 파싱 결과는 기존 트리 파싱 결과와 같아야 합니다."""
+    monkeypatch.setattr(PaloAltoAPI, '_get_api_key', lambda self, username, password: 'test-key')
+    monkeypatch.setattr(PaloAltoAPI, 'get_config', lambda self, config_type='running': SAMPLE_CONFIG)
+    monkeypatch.setattr(
+        PaloAltoAPI, '_open_config_stream',
+        lambda self, config_type='running': (FakeStreamResponse(SAMPLE_CONFIG), FakeStreamResponse(SAMPLE_CONFIG).raw)
+    )
+    streaming_api = PaloAltoAPI('192.0.2.1', 'admin', 'secret', batch_id='stream', streaming=True)
+    tree_api = PaloAltoAPI('192.0.2.1', 'admin', 'secret', batch_id='tree', streaming=False)
+
+    try:
+        for method in ['export_security_rules', 'export_network_objects', 'export_network_group_objects',
+                       'export_service_objects', 'export_service_group_objects']:
+            pd.testing.assert_frame_equal(getattr(streaming_api, method)(), getattr(tree_api, method)())
+    finally:
+        config_snapshot_cache.invalidate()
+
+
+class FakeKeyResponse:
+    """requests 응답 대용 (keygen/설정 조회)"""
+
+    def __init__(self, status_code, text=''):
+        self.status_code = status_code
+        self.text = text
+
+    def close(self):
+        pass
+
+
+class FakeHTTPSession:
+    """새로 발급한 키만 유효한 PaloAlto API 흉내"""
+
+    def __init__(self):
+        self.issued = 0
+        self.calls = []
+
+    def get(self, url, params=None, **kwargs):
+        params = dict(params)
+        self.calls.append(params.get('type'))
+        if params.get('type') == 'keygen':
+            self.issued += 1
+            return FakeKeyResponse(200, f'<response><result><key>key-{self.issued}</key></result></response>')
+        if params.get('key') != f'key-{self.issued}':
+            return FakeKeyResponse(403, 'Invalid credentials')
+        return FakeKeyResponse(200, '<response><result><entry name="vsys1"/></result></response>')
+
+
+def test_api_key_is_generated_once_per_device(monkeypatch):
+    """같은 장비/계정의 수집기는 keygen을 한 번만 수행해야 합니다."""
+    http = FakeHTTPSession()
+    monkeypatch.setattr('app.firewall_module.paloalto.paloalto_module.get_http_session', lambda hostname: http)
+    try:
+        first = PaloAltoAPI('192.0.2.10', 'admin', 'secret')
+        second = PaloAltoAPI('192.0.2.10', 'admin', 'secret')
+        assert first.api_key == second.api_key == 'key-1'
+
+        PaloAltoAPI('192.0.2.10', 'admin', 'changed')
+        assert http.calls == ['keygen', 'keygen']
+    finally:
+        api_key_cache.invalidate()
+
+
+def test_api_key_is_renewed_on_auth_failure(monkeypatch):
+    """키 인증에 실패(403)하면 재발급 후 요청을 다시 보내야 합니다."""
+    http = FakeHTTPSession()
+    monkeypatch.setattr('app.firewall_module.paloalto.paloalto_module.get_http_session', lambda hostname: http)
+    try:
+        api = PaloAltoAPI('192.0.2.11', 'admin', 'secret')
+        http.issued += 1  # 장비에서 기존 키가 폐기된 상황
+
+        assert api.get_vsys_list() == ['vsys1']
+        assert api.api_key == 'key-3'
+        assert http.calls == ['keygen', 'config', 'keygen', 'config']
+    finally:
+        api_key_cache.invalidate()
+
+
+def test_api_key_cache_is_encrypted_at_rest(tmp_path):
+    """캐시 파일은 암호화되어 저장되고 같은 비밀값으로만 다시 읽을 수 있어야 합니다."""
+    path = str(tmp_path / 'keys.bin')
+    cache = ApiKeyCache(path, 'app-secret')
+    cache.get('192.0.2.12', 'admin', 'secret', lambda: 'stored-key')
+
+    with open(path, 'rb') as f:
+        content = f.read()
+    assert b'stored-key' not in content and b'secret' not in content
+
+    assert ApiKeyCache(path, 'app-secret').get('192.0.2.12', 'admin', 'secret', lambda: 'new-key') == 'stored-key'
+    assert len(ApiKeyCache(path, 'other-secret')) == 0
+
+    assert cache.invalidate('192.0.2.12') == 1
+    assert len(ApiKeyCache(path, 'app-secret')) == 0
+
+
+def test_slow_keygen_does_not_block_other_devices():
+    """한 장비의 keygen이 지연되어도 다른 장비의 키 조회는 기다리지 않고, 같은 장비는 한 번만 발급해야 합니다."""
+    cache = ApiKeyCache()
+    cache.get('192.0.2.20', 'admin', 'secret', lambda: 'cached-key')
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_loader():
+        calls.append('keygen')
+        started.set()
+        release.wait(5)
+        return 'slow-key'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get('192.0.2.21', 'admin', 'secret', slow_loader)))
+               for _ in range(3)]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    try:
+        # 지연 중인 keygen과 관계없이 즉시 반환되어야 합니다.
+        assert cache.get('192.0.2.20', 'admin', 'secret', lambda: 'unexpected') == 'cached-key'
+        assert cache.get('192.0.2.22', 'admin', 'secret', lambda: 'other-key') == 'other-key'
+        assert not release.is_set() and results == []
+    finally:
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+    assert results == ['slow-key'] * 3
+    assert calls == ['keygen']
+
+
+def test_api_key_cache_file_requires_explicit_secret(tmp_path, monkeypatch):
+    """캐시 파일은 지정한 경우에만, 그리고 SECRET_KEY가 기본값이 아닐 때만 사용해야 합니다."""
+    from app import create_app
+    from config import Config, DEFAULT_SECRET_KEY
+    path = str(tmp_path / 'keys.bin')
+    try:
+        monkeypatch.setattr(Config, 'PALOALTO_KEY_CACHE_FILE', None)
+        monkeypatch.setattr(Config, 'SECRET_KEY', 'app-secret')
+        create_app()
+        assert api_key_cache._path is None
+
+        monkeypatch.setattr(Config, 'PALOALTO_KEY_CACHE_FILE', path)
+        monkeypatch.setattr(Config, 'SECRET_KEY', DEFAULT_SECRET_KEY)
+        create_app()
+        assert api_key_cache._path is None
+
+        monkeypatch.setattr(Config, 'SECRET_KEY', 'app-secret')
+        create_app()
+        assert api_key_cache._path == path
+    finally:
+        api_key_cache.configure(None, None)
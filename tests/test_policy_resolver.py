@@ -0,0 +1,196 @@
+import random
+import pandas as pd
+from app.analysis_module.core.policy_resolver import PolicyResolver
+from app.analysis_module.utils.interval_set import IntervalSet
+from app.analysis_module.utils.ip_intervals import AddressSet
+from app.analysis_module.utils.port_intervals import ServiceSet
+
+
+def make_objects():
+    network_objects = pd.DataFrame([
+        ['web', '10.0.0.10'],
+        ['web_net', '10.0.0.0/24'],
+        ['db_range', '10.0.1.1-10.0.1.20'],
+        ['v6_net', '2001:db8::/64'],
+        ['portal', 'portal.example.com'],
+    ], columns=['Name', 'Value'])
+    network_groups = pd.DataFrame([
+        ['servers', 'web,db_range'],
+        ['all_servers', 'servers,v6_net'],
+    ], columns=['Group Name', 'Entry'])
+    service_objects = pd.DataFrame([
+        ['http', 'tcp', '80'],
+    ], columns=['Name', 'Protocol', 'Port'])
+    service_groups = pd.DataFrame(columns=['Group Name', 'Entry'])
+    return network_objects, network_groups, service_objects, service_groups
+
+
+def make_rules():
+    return pd.DataFrame([
+        ['rule_1', 'web_net', 'all_servers', 'http'],
+        ['rule_2', 'servers', 'portal', 'http'],
+        ['rule_3', 'any', '192.168.0.1', 'http'],
+        ['rule_4', 'web_net', 'all_servers', 'http'],
+    ], columns=['Rule Name', 'Source', 'Destination', 'Service'])
+
+
+def test_resolve_compiles_addresses_per_rule():
+    """resolve는 정책별 출발지/목적지를 병합된 IP 구간 집합으로 변환해야 합니다."""
+    resolver = PolicyResolver()
+    result = resolver.resolve(make_rules(), *make_objects())
+
+    assert isinstance(result, pd.DataFrame)
+    sources = resolver.addresses['source']
+    destinations = resolver.addresses['destination']
+    assert len(sources) == len(destinations) == len(result)
+
+    # 10.0.0.10과 10.0.1.1-10.0.1.20은 정렬된 두 구간이 됨
+    assert list(sources[1].v4) == [(0x0A00000A, 0x0A00000A), (0x0A000101, 0x0A000114)]
+    assert destinations[0].v6 == IntervalSet.from_pairs([(0x20010DB8 << 96, (0x20010DB8 << 96) + 2 ** 64 - 1)])
+    assert destinations[1].names == frozenset({'portal.example.com'})
+    assert sources[2].is_any
+    assert sources[2].contains(sources[1])
+    assert not sources[0].contains(sources[1])
+
+    # 같은 셀은 같은 객체를 재사용
+    assert destinations[0] is destinations[3]
+    assert resolver.address_cache['web_net'] is resolver.compile_address('web_net', {})
+
+
+def test_find_rules_by_ip():
+    """IP를 포함하는 정책을 구간 인덱스로 찾아야 합니다."""
+    resolver = PolicyResolver()
+    resolver.resolve(make_rules(), *make_objects())
+
+    assert list(resolver.find_rules_by_ip('10.0.0.10')['Rule Name']) == ['rule_1', 'rule_2', 'rule_3', 'rule_4']
+    assert list(resolver.find_rules_by_ip('10.0.1.5')['Rule Name']) == ['rule_2', 'rule_3']
+    assert list(resolver.find_rules_by_ip('2001:db8::1', 'destination')['Rule Name']) == ['rule_1', 'rule_4']
+    assert resolver.find_rules_by_ip('172.16.0.1', 'destination').empty
+
+    index = resolver.get_address_index('destination')
+    assert list(index.find_overlapping(AddressSet.parse('10.0.1.20-10.0.2.0'))) == [0, 3]
+    assert list(index.find_overlapping(AddressSet.parse('portal.example.com'))) == [1]
+    assert list(index.find_containing(AddressSet.parse('10.0.1.2-10.0.1.3'))) == [0, 3]
+    assert list(index.find_containing(AddressSet.parse('10.0.1.2-10.0.1.30'))) == []
+
+
+def test_union_all_matches_pairwise_union():
+    """union_all은 순차 union과 같은 결과를 내야 합니다."""
+    sets = [AddressSet.parse(value) for value in ('10.0.0.0/25', '10.0.0.128/25', '::1', 'host.example.com', '10.1.0.1')]
+    expected = sets[0]
+    for address in sets[1:]:
+        expected = expected.union(address)
+    assert AddressSet.union_all(sets) == expected
+    assert list(expected.v4) == [(0x0A000000, 0x0A0000FF), (0x0A010001, 0x0A010001)]
+
+
+def reference_expand(name, group_dict):
+    """그룹을 재귀로 펼치는 기준 구현"""
+    entry = group_dict.get(name)
+    if not entry or entry == name:
+        return {name}
+    members = set()
+    for member in entry.split(','):
+        members |= reference_expand(member.strip(), group_dict)
+    return members
+
+
+def test_expand_groups_matches_recursive_expansion():
+    """그룹 그래프 펼침 결과는 재귀 펼침과 같아야 하며 깊이 제한이 없어야 합니다."""
+    rng = random.Random(3)
+    group_dict = {}
+    for index in range(200):
+        # 앞선 그룹만 참조하므로 순환이 없음
+        members = [f'host_{rng.randint(0, 50)}' for _ in range(rng.randint(0, 3))]
+        members += [f'group_{rng.randint(0, index - 1)}' for _ in range(rng.randint(0, 2)) if index]
+        group_dict[f'group_{index}'] = ','.join(members) or f'host_{index}'
+    # 깊이 30의 중첩 그룹
+    for depth in range(30):
+        group_dict[f'deep_{depth}'] = f'deep_{depth + 1},leaf_{depth}'
+
+    resolver = PolicyResolver()
+    expanded = resolver.expand_groups(group_dict)
+
+    assert resolver.group_cycles == []
+    for name in group_dict:
+        assert set(expanded.get(name, {name})) == reference_expand(name, group_dict)
+    assert len(expanded['deep_0']) == 31
+    assert resolver.process_cell('deep_28, host_1', expanded).count(',') == 3
+
+
+def test_group_cycles_are_reported():
+    """순환 참조 그룹은 묶어서 펼치고 group_cycles로 보고해야 합니다."""
+    network_objects, _, service_objects, service_groups = make_objects()
+    network_groups = pd.DataFrame([
+        ['loop_a', 'web,loop_b'],
+        ['loop_b', 'db_range,loop_a'],
+        ['outer', 'loop_a,portal'],
+        ['self_loop', 'self_loop,v6_net'],
+    ], columns=['Group Name', 'Entry'])
+    rules = pd.DataFrame([
+        ['rule_1', 'outer', 'self_loop', 'http'],
+    ], columns=['Rule Name', 'Source', 'Destination', 'Service'])
+
+    resolver = PolicyResolver()
+    result = resolver.resolve(rules, network_objects, network_groups, service_objects, service_groups)
+
+    assert sorted(resolver.group_cycles) == [['loop_a', 'loop_b'], ['self_loop']]
+    assert set(result.loc[0, 'Extracted Source'].split(',')) == {'10.0.0.10', '10.0.1.1-10.0.1.20', 'portal.example.com'}
+    assert result.loc[0, 'Extracted Destination'] == '2001:db8::/64'
+
+
+def test_service_objects_keep_all_ports_and_ranges():
+    """여러 포트/포트 범위를 가진 서비스 객체가 마지막 포트로 덮어써지지 않아야 합니다."""
+    network_objects, network_groups, _, _ = make_objects()
+    service_objects = pd.DataFrame([
+        ['web_ports', 'tcp', '80, 443'],
+        ['web_ports', 'tcp', '8000-8080'],
+        ['high_ports', 'udp', '1024-2048'],
+        ['all_tcp', 'tcp', '*'],
+        ['dns', 'udp', '53'],
+        ['dns', 'tcp', '53'],
+    ], columns=['Name', 'Protocol', 'Port'])
+    service_groups = pd.DataFrame([
+        ['app_services', 'web_ports,high_ports'],
+    ], columns=['Group Name', 'Entry'])
+    rules = pd.DataFrame([
+        ['rule_1', 'web', 'web', 'app_services'],
+        ['rule_2', 'web', 'web', 'dns'],
+        ['rule_3', 'web', 'web', 'all_tcp'],
+        ['rule_4', 'web', 'web', 'application-default'],
+    ], columns=['Rule Name', 'Source', 'Destination', 'Service'])
+
+    resolver = PolicyResolver()
+    result = resolver.resolve(rules, network_objects, network_groups, service_objects, service_groups)
+
+    assert set(result.loc[0, 'Extracted Service'].split(',')) == {'TCP/80', 'TCP/443', 'TCP/8000-8080', 'UDP/1024-2048'}
+    assert set(result.loc[1, 'Extracted Service'].split(',')) == {'UDP/53', 'TCP/53'}
+    assert result.loc[2, 'Extracted Service'] == 'TCP/0-65535'
+    assert result.loc[3, 'Extracted Service'] == 'application-default'
+
+    services = resolver.services
+    assert services[0] == ServiceSet.parse('TCP/80,TCP/443,TCP/8000-8080,UDP/1024-2048')
+    assert services[0] == ServiceSet.parse(result.loc[0, 'Extracted Service'])
+    assert list(resolver.service_cache['web_ports'].protocols['TCP']) == [(80, 80), (443, 443), (8000, 8080)]
+    assert services[2].contains(ServiceSet.parse('TCP/8000-8080,TCP/53'))
+    assert not services[0].contains(services[1])
+    assert services[0].overlaps(ServiceSet.parse('UDP/2000-3000'))
+    assert services[3].names == frozenset({'application-default'})
+
+    assert list(resolver.find_rules_by_service('tcp', 8080)['Rule Name']) == ['rule_1', 'rule_3']
+    assert list(resolver.find_rules_by_service('udp', 53)['Rule Name']) == ['rule_2']
+
+
+def test_combine_protocol_port():
+    """Protocol/Port 조합은 대문자 프로토콜과 콤마별 행으로 분리되어야 합니다."""
+    df = pd.DataFrame([
+        ['svc_a', 'tcp', '80, 443'],
+        ['svc_b', 'Udp', '*'],
+    ], columns=['Name', 'Protocol', 'Port'])
+
+    combined = PolicyResolver().combine_protocol_port(df)
+
+    assert list(combined.columns) == ['Name', 'Protocol', 'Port', 'Value']
+    assert list(combined['Value']) == ['TCP/80', 'TCP/443', 'UDP/0-65535']
+    assert list(combined['Name']) == ['svc_a', 'svc_a', 'svc_b']
+    assert PolicyResolver().combine_protocol_port(df.iloc[:0]).empty
@@ -0,0 +1,123 @@
+import importlib.util
+import os
+import pytest
+from sqlalchemy import text
+from app import create_app, db
+from app.models import Device, FirewallPolicy, FirewallNetworkGroup, SyncHistory, SyncTask
+from app.routes.policies import SEARCH_COLUMNS
+from app.services.search_index import keyword_search_condition
+
+@pytest.fixture
+def app():
+    """테스트용 Flask 앱 생성"""
+    app = create_app()
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    return app
+
+@pytest.fixture
+def db_session(app):
+    """테스트용 데이터베이스 세션"""
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+def query_plan(query):
+    """SQLite 실행 계획(EXPLAIN QUERY PLAN)의 detail 목록을 반환"""
+    if isinstance(query, str):
+        sql = query
+    else:
+        sql = str(query.statement.compile(db.engine, compile_kwargs={'literal_binds': True}))
+    return [row[-1] for row in db.session.execute(text(f'EXPLAIN QUERY PLAN {sql}'))]
+
+def uses_index(plan, index_name):
+    return any(f'INDEX {index_name}' in detail for detail in plan)
+
+def test_device_scoped_lookups_use_indexes(db_session):
+    """장비 단위 삭제/조회는 장비 ID로 시작하는 복합 인덱스를 사용해야 합니다."""
+    delete_plan = query_plan('DELETE FROM firewall_policy WHERE device_id = 1')
+    # 전문 검색 삭제 트리거가 있으면 COVERING INDEX로 표시됨
+    assert any(detail.startswith('SEARCH firewall_policy USING') and 'INDEX ix_firewall_policy_device_' in detail
+               for detail in delete_plan)
+
+    plan = query_plan(FirewallPolicy.query.filter(FirewallPolicy.device_id == 1, FirewallPolicy.rule_name == 'rule_1'))
+    assert uses_index(plan, 'ix_firewall_policy_device_rule_name')
+
+    plan = query_plan(FirewallNetworkGroup.query.filter_by(device_id=1))
+    assert uses_index(plan, 'ix_firewall_network_group_device_group_name')
+
+    plan = query_plan(SyncHistory.query.filter_by(device_id=1).order_by(SyncHistory.created_at.desc()).limit(1))
+    assert uses_index(plan, 'ix_sync_history_device_created_at')
+    assert not any('TEMP B-TREE' in detail for detail in plan)
+
+def test_queue_lookups_use_indexes(db_session):
+    """대기 작업 선택은 정렬 없이 상태/우선순위/큐 위치 인덱스를 사용해야 합니다."""
+    plan = query_plan(SyncTask.query.filter(SyncTask.status == 'pending')
+                      .order_by(SyncTask.priority, SyncTask.queue_position).limit(1))
+    assert uses_index(plan, 'ix_sync_task_status_priority_queue_position')
+    assert not any('TEMP B-TREE' in detail for detail in plan)
+
+    plan = query_plan(SyncTask.query.filter(SyncTask.device_id == 1, SyncTask.status.in_(['pending', 'running'])))
+    assert uses_index(plan, 'ix_sync_task_device_status')
+
+def test_policy_page_order_uses_indexes(db_session):
+    """정책 목록 정렬(장비명, 순서)은 장비명 인덱스와 장비별 순서 인덱스를 사용해야 합니다."""
+    for index in range(5):
+        db.session.add(Device(name=f'FW-{index}', category='firewall', sub_category='paloalto',
+                              ip_address=f'192.168.1.{index + 1}', username='admin', password='test123!'))
+    db.session.commit()
+    db.session.execute(text(
+        "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 5000) "
+        "INSERT INTO firewall_policy (device_id, rule_name, seq, firewall_type) "
+        "SELECT x % 5 + 1, 'rule_' || x, x, 'paloalto' FROM n"
+    ))
+    db.session.execute(text('ANALYZE'))
+
+    plan = query_plan(FirewallPolicy.query.join(Device, Device.id == FirewallPolicy.device_id)
+                      .order_by(Device.name, FirewallPolicy.seq).limit(50))
+    assert uses_index(plan, 'ix_device_name')
+    assert uses_index(plan, 'ix_firewall_policy_device_seq')
+    assert not any(detail.startswith('SCAN firewall_policy') for detail in plan)
+
+def test_policy_search_uses_indexes(db_session):
+    """검색창 검색(장비명 + 정책 컬럼)은 전체 정책을 스캔하지 않고 장비/전문 검색 색인과 기본 키로 조회해야 합니다."""
+    for index in range(5):
+        db.session.add(Device(name=f'FW-{index}', category='firewall', sub_category='paloalto',
+                              ip_address=f'192.168.1.{index + 1}', username='admin', password='test123!'))
+    db.session.commit()
+    db.session.execute(text(
+        "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 5000) "
+        "INSERT INTO firewall_policy (device_id, rule_name, seq, firewall_type) "
+        "SELECT x % 5 + 1, 'rule_' || x, x, 'paloalto' FROM n"
+    ))
+
+    query = (FirewallPolicy.query.join(Device, Device.id == FirewallPolicy.device_id)
+             .filter(keyword_search_condition(FirewallPolicy, SEARCH_COLUMNS, 'rule_499'))
+             .order_by(Device.name, FirewallPolicy.seq).limit(50))
+    for analyzed in (False, True):
+        if analyzed:
+            db.session.execute(text('ANALYZE'))
+        plan = query_plan(query)
+        assert any('SEARCH firewall_policy USING INTEGER PRIMARY KEY' in detail for detail in plan)
+        assert any('firewall_policy_fts VIRTUAL TABLE' in detail for detail in plan)
+        assert not any(detail.startswith('SCAN firewall_policy ') or detail == 'SCAN firewall_policy'
+                       for detail in plan)
+    assert query.count() == 11
+
+def test_migration_matches_model_indexes(db_session):
+    """마이그레이션의 인덱스 정의는 모델의 인덱스 정의와 같아야 합니다."""
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        'migrations', 'versions', 'a4f7c2d91e08_add_composite_indexes.py')
+    spec = importlib.util.spec_from_file_location('composite_index_migration', path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    model_indexes = {
+        (index.name, table.name, tuple(column.name for column in index.columns))
+        for table in db.metadata.tables.values()
+        for index in table.indexes
+    }
+    migration_indexes = {(name, table, tuple(columns)) for name, table, columns in migration.INDEXES}
+    assert migration_indexes == model_indexes
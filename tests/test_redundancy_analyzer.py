@@ -0,0 +1,93 @@
+import random
+import time
+import pandas as pd
+from app.analysis_module.core.redundancy_analyzer import RedundancyAnalyzer
+
+COLUMNS = ['Seq', 'Rule Name', 'Enable', 'Action', 'Source', 'User', 'Destination', 'Service', 'Application',
+           'Security Profile', 'Category', 'Vsys']
+
+
+def reference_analyze(analyzer, df, vendor):
+    """기존 행 단위 구현 (비교 기준)"""
+    df_filtered = analyzer._prepare_data(df, vendor)
+    df_check = df_filtered[analyzer.vendor_columns.get(vendor, analyzer.vendor_columns['default'])]
+    policy_map = {}
+    rows = []
+    current_no = 1
+    for i in range(len(df_filtered)):
+        key = tuple(','.join(sorted(x.split(','))) if isinstance(x, str) else x for x in df_check.iloc[i])
+        row = df_filtered.iloc[i].to_dict()
+        if key in policy_map:
+            row.update({'No': policy_map[key], 'Type': 'Lower'})
+        else:
+            policy_map[key] = current_no
+            row.update({'No': current_no, 'Type': 'Upper'})
+            current_no += 1
+        rows.append(row)
+    results = pd.DataFrame(rows)
+    counts = results['No'].map(results['No'].value_counts())
+    results = results[counts > 1].copy()
+    results['No'] = results.groupby('No').ngroup() + 1
+    results = results[['No', 'Type'] + list(df.columns)]
+    return results.sort_values(by=['No', 'Type'], ascending=[True, False], kind='stable').reset_index(drop=True)
+
+
+def make_rules(count, seed=0):
+    rng = random.Random(seed)
+    names = ['a', 'b', 'c', 'd']
+    rows = []
+    for index in range(count):
+        rows.append({
+            'Seq': index + 1,
+            'Rule Name': f'rule_{index}',
+            'Enable': rng.choice(['Y', 'Y', 'N']),
+            'Action': rng.choice(['allow', 'allow', 'deny']),
+            'Source': ','.join(rng.sample(names, rng.randint(1, 2))),
+            'User': 'any',
+            'Destination': rng.choice(names),
+            'Service': rng.choice(['tcp_80', 'tcp_443']),
+            'Application': 'any',
+            'Security Profile': rng.choice(['', 'default']),
+            'Category': 'any',
+            'Vsys': 'vsys1',
+        })
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+
+def test_vectorized_analysis_matches_reference():
+    """벡터화 분석 결과는 기존 행 단위 구현과 같아야 합니다."""
+    analyzer = RedundancyAnalyzer()
+    for seed in range(5):
+        rules = make_rules(200, seed)
+        for vendor in ('paloalto', 'ngf'):
+            pd.testing.assert_frame_equal(analyzer.analyze(rules, vendor), reference_analyze(analyzer, rules, vendor))
+
+
+def test_small_rulebase_without_duplicates():
+    """정책이 10개 미만이거나 중복이 없어도 오류 없이 빈 결과를 반환해야 합니다."""
+    analyzer = RedundancyAnalyzer()
+    rules = pd.DataFrame([
+        ['1', 'r1', 'Y', 'allow', 'a', 'any', 'b', 'tcp_80', 'any', '', 'any', 'vsys1'],
+        ['2', 'r2', 'Y', 'allow', 'a', 'any', 'c', 'tcp_80', 'any', '', 'any', 'vsys1'],
+    ], columns=COLUMNS)
+
+    result = analyzer.analyze(rules, 'ngf')
+
+    assert result.empty
+    assert list(result.columns) == ['No', 'Type'] + COLUMNS
+
+    rules.loc[1, 'Destination'] = 'b'
+    result = analyzer.analyze(rules, 'ngf')
+    assert list(result['Type']) == ['Upper', 'Lower']
+
+
+def test_large_rulebase_is_fast():
+    """10만 개 정책도 수 초 안에 분석해야 합니다."""
+    rules = make_rules(1000)
+    rules = pd.concat([rules] * 100, ignore_index=True)
+
+    started = time.perf_counter()
+    result = RedundancyAnalyzer().analyze(rules, 'paloalto')
+
+    assert time.perf_counter() - started < 10
+    assert (result['Type'] == 'Upper').sum() == result['No'].nunique()
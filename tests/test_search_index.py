@@ -0,0 +1,180 @@
+import importlib.util
+import os
+import pytest
+import pandas as pd
+from sqlalchemy import or_, text
+from app import create_app, db
+from app.models import Device, FirewallPolicy, FirewallNetworkObject, FirewallNetworkGroup
+from app.services import search_index
+from app.services.firewall.bulk_writer import write_device_rows
+from app.services.search_index import (
+    SEARCH_INDEXES,
+    search_condition,
+    keyword_search_condition,
+    is_search_index_available,
+    rebuild_search_index
+)
+
+@pytest.fixture
+def app():
+    """테스트용 Flask 앱 생성"""
+    app = create_app()
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    return app
+
+@pytest.fixture
+def db_session(app):
+    """테스트용 데이터베이스 세션"""
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+def add_device(index):
+    """정책과 객체를 가진 테스트용 장비 추가"""
+    device = Device(name=f'FW-{index}', category='firewall', sub_category='paloalto',
+                    ip_address=f'192.168.1.{index}', username='admin', password='test123!')
+    db.session.add(device)
+    db.session.flush()
+    rows = [
+        ('Allow_Web_Server', 'Trust_Net, 10.0.0.0/24', 'Web_Servers', 'tcp_443', None, 'ssl'),
+        ('내부 정책 허용', '내부망', 'any', 'any', 'admin', None),
+        ('Block "Legacy"', 'any', '172.16.1.10', 'udp_53', None, 'dns'),
+        ('rule%wild', None, None, None, None, None),
+    ]
+    for seq, (rule_name, source, destination, service, user, application) in enumerate(rows):
+        db.session.add(FirewallPolicy(device_id=device.id, rule_name=f'{rule_name}_{index}', seq=seq,
+                                      source=source, destination=destination, service=service, user=user,
+                                      application=application, firewall_type='paloalto'))
+    db.session.add(FirewallNetworkObject(device_id=device.id, name='Web_Server_1', type='ip-netmask',
+                                         value='10.0.0.10/32', firewall_type='paloalto'))
+    db.session.add(FirewallNetworkGroup(device_id=device.id, group_name='Web_Servers',
+                                        entry='Web_Server_1,Web_Server_2', firewall_type='paloalto'))
+    db.session.commit()
+    return device
+
+def ilike_ids(model, columns, term):
+    """기존 ILIKE 방식으로 검색한 ID 목록"""
+    condition = or_(*[getattr(model, name).ilike(f'%{term}%') for name in columns])
+    return sorted(row.id for row in model.query.filter(condition))
+
+def search_ids(model, columns, term):
+    return sorted(row.id for row in model.query.filter(search_condition(model, columns, term)))
+
+TERMS = ['web_server', 'WEB', '10.0.0', '내부 정책', '정책 허용', 'legacy"', '"Legacy"', 'tcp_4', 'admin', 'nomatch']
+
+def test_fts_matches_ilike(db_session):
+    """전문 검색 결과는 ILIKE 검색 결과와 같아야 합니다."""
+    for index in range(1, 4):
+        add_device(index)
+    assert is_search_index_available()
+
+    columns = SEARCH_INDEXES['firewall_policy']
+    for term in TERMS:
+        assert search_ids(FirewallPolicy, columns, term) == ilike_ids(FirewallPolicy, columns, term), term
+        assert search_ids(FirewallPolicy, ['source'], term) == ilike_ids(FirewallPolicy, ['source'], term), term
+    assert len(search_ids(FirewallPolicy, columns, 'web_server')) == 3
+
+    for term in ['web_server', '0.10', 'server_2']:
+        assert search_ids(FirewallNetworkGroup, ['group_name', 'entry'], term) == \
+            ilike_ids(FirewallNetworkGroup, ['group_name', 'entry'], term)
+        assert search_ids(FirewallNetworkObject, ['value'], term) == ilike_ids(FirewallNetworkObject, ['value'], term)
+
+def test_search_condition_uses_fts_or_falls_back(db_session):
+    """3자 이상 검색어는 FTS5를, 짧은 검색어/와일드카드/색인 없는 컬럼은 ILIKE를 사용해야 합니다."""
+    add_device(1)
+
+    def sql(columns, term):
+        return str(search_condition(FirewallPolicy, columns, term).compile(db.engine))
+
+    assert 'MATCH' in sql(['rule_name', 'source'], 'web')
+    assert 'MATCH' not in sql(['rule_name'], 'we')
+    assert 'MATCH' not in sql(['rule_name'], '%wild')
+    assert 'MATCH' not in sql(['description'], 'web')
+    assert search_ids(FirewallPolicy, ['rule_name'], '%wild') == ilike_ids(FirewallPolicy, ['rule_name'], '%wild')
+
+    search_index._availability[db.engine] = False
+    assert 'MATCH' not in sql(['rule_name'], 'web')
+
+def test_keyword_search_matches_ilike(db_session):
+    """검색창 검색(장비명 + 컬럼)은 전문 검색/ILIKE 경로 모두 기존 ILIKE 결과와 같아야 합니다."""
+    for index in range(1, 4):
+        add_device(index)
+    columns = SEARCH_INDEXES['firewall_policy']
+
+    def expected(term):
+        condition = or_(Device.name.ilike(f'%{term}%'),
+                        *[getattr(FirewallPolicy, name).ilike(f'%{term}%') for name in columns])
+        return sorted(row.id for row in FirewallPolicy.query.join(Device).filter(condition))
+
+    for term in TERMS + ['fw-2', 'FW', '_1']:
+        result = sorted(row.id for row in FirewallPolicy.query.join(Device).filter(
+            keyword_search_condition(FirewallPolicy, columns, term)))
+        assert result == expected(term), term
+
+def test_index_follows_sync_writes(db_session):
+    """동기화 저장(추가/변경/삭제)과 장비 삭제가 전문 검색 색인에 반영되어야 합니다."""
+    device = add_device(1)
+    other = add_device(2)
+    columns = SEARCH_INDEXES['firewall_policy']
+
+    df = pd.DataFrame({
+        'Seq': [1, 2],
+        'Rule Name': ['Allow_Web_Server_1', 'New_Rule'],
+        'Source': ['Changed_Net', 'Fresh_Source'],
+        'Enable': ['Y', 'Y'],
+        'Action': ['allow', 'allow'],
+    })
+    write_device_rows(FirewallPolicy, df, device)
+    db.session.commit()
+
+    for term in ['trust_net', 'changed_net', 'fresh_source', '내부 정책', 'web_server']:
+        assert search_ids(FirewallPolicy, columns, term) == ilike_ids(FirewallPolicy, columns, term), term
+    assert search_ids(FirewallPolicy, columns, 'trust_net') == \
+        sorted(policy.id for policy in FirewallPolicy.query.filter_by(device_id=other.id, seq=0))
+
+    FirewallPolicy.query.filter_by(device_id=other.id).delete()
+    db.session.commit()
+    assert search_ids(FirewallPolicy, columns, 'trust_net') == []
+
+    assert rebuild_search_index() == len(SEARCH_INDEXES)
+    db.session.execute(text("INSERT INTO firewall_policy_fts(firewall_policy_fts) VALUES ('integrity-check')"))
+
+def test_routes_use_search_index(db_session, app):
+    """정책/객체 목록의 검색어와 contains 필터가 전문 검색 결과를 반환해야 합니다."""
+    for index in range(1, 3):
+        add_device(index)
+    client = app.test_client()
+    headers = {'X-Requested-With': 'XMLHttpRequest'}
+
+    response = client.post('/policies/', json={'search': 'trust_net', 'page': 1, 'per_page': 10}, headers=headers)
+    assert response.status_code == 200
+    assert response.get_json()['html'].count('Allow_Web_Server_') == 2
+
+    filters = [{'field': 'destination', 'operator': 'contains', 'value': '172.16'},
+               {'field': 'device_name', 'operator': 'equals', 'value': 'FW-2'}]
+    response = client.post('/policies/', json={'filters': filters, 'page': 1, 'per_page': 10}, headers=headers)
+    html = response.get_json()['html']
+    assert 'Legacy' in html and '_2' in html and '_1<' not in html
+
+    response = client.get('/objects/api/list', query_string={'type': 'network-group', 'search': 'server_2'})
+    assert response.get_json()['pagination']['total'] == 2
+
+    response = client.get('/objects/api/list', query_string={'type': 'network', 'search': 'fw-1'})
+    assert [item['device_name'] for item in response.get_json()['objects']] == ['FW-1']
+
+    filters = '[{"field": "value", "operator": "contains", "value": "0.0.10"}]'
+    response = client.get('/objects/api/list', query_string={'type': 'network', 'filters': filters})
+    assert response.get_json()['pagination']['total'] == 2
+
+def test_migration_matches_search_indexes():
+    """마이그레이션의 검색 컬럼 정의는 서비스의 정의와 같아야 합니다."""
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        'migrations', 'versions', 'b7e3a9c15d42_add_search_index.py')
+    spec = importlib.util.spec_from_file_location('search_index_migration', path)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    assert migration.SEARCH_INDEXES == SEARCH_INDEXES
@@ -0,0 +1,135 @@
+import random
+import pandas as pd
+from app.analysis_module.core.shadow_analyzer import ShadowAnalyzer
+from app.analysis_module.utils.ip_intervals import AddressSet
+from app.analysis_module.utils.port_intervals import ServiceSet
+
+COLUMNS = ['Seq', 'Rule Name', 'Enable', 'Action', 'Extracted Source', 'User',
+           'Extracted Destination', 'Extracted Service', 'Application', 'Vsys']
+
+
+def make_rule(index, source, destination, service, enable='Y', user='any', application='any', vsys='vsys1'):
+    return [index, f'rule_{index}', enable, 'allow', source, user, destination, service, application, vsys]
+
+
+def reference_pairs(analyzer, df):
+    """모든 정책 쌍을 비교하는 기준 구현 (가려진 정책별 가장 앞선 정책)"""
+    enabled = df[df['Enable'] == 'Y'].reset_index(drop=True)
+    rules = analyzer._compile_rules(enabled)
+    pairs = []
+    for inner in range(len(enabled)):
+        for outer in range(inner):
+            if enabled.loc[outer, 'Vsys'] == enabled.loc[inner, 'Vsys'] and analyzer._covers(rules, outer, inner):
+                pairs.append((enabled.loc[outer, 'Rule Name'], enabled.loc[inner, 'Rule Name']))
+                break
+    return sorted(pairs)
+
+
+def result_pairs(result):
+    pairs = []
+    for _, group in result.groupby('No'):
+        upper = group[group['Type'] == 'Upper']['Rule Name'].iloc[0]
+        pairs.extend((upper, lower) for lower in group[group['Type'] == 'Lower']['Rule Name'])
+    return sorted(pairs)
+
+
+def test_address_and_service_sets():
+    """주소/서비스 집합은 구간 단위로 포함과 겹침을 판단해야 합니다."""
+    network = AddressSet.parse('10.0.0.0/24,10.0.1.0-10.0.1.255,www.example.com')
+    assert network.contains(AddressSet.parse('10.0.0.5,10.0.1.10-10.0.1.20'))
+    assert not network.contains(AddressSet.parse('10.0.0.0/23,10.0.2.1'))
+    assert network.contains(AddressSet.parse('10.0.0.0/23'))
+    assert network.overlaps(AddressSet.parse('10.0.1.255-10.0.2.10'))
+    assert AddressSet.parse('any').contains(AddressSet.parse('2001:db8::/32,host.example.com'))
+    assert AddressSet.parse('any').contains_ip('2001:db8::1')
+
+    services = ServiceSet.parse('TCP/1024-2048,TCP/80,UDP/53')
+    assert services.contains(ServiceSet.parse('TCP/1500-1600,UDP/53'))
+    assert not services.contains(ServiceSet.parse('TCP/2049'))
+    assert services.overlaps(ServiceSet.parse('TCP/2000-3000'))
+    assert ServiceSet.parse('any').contains(services)
+    assert services.contains_port('tcp', 1024)
+
+
+def test_shadowed_rules_are_grouped_by_shadowing_rule():
+    """앞선 정책이 출발지/목적지/서비스를 모두 포함하면 가려진 정책으로 보고해야 합니다."""
+    rules = pd.DataFrame([
+        make_rule(1, '10.0.0.0/16', 'any', 'TCP/0-65535'),
+        make_rule(2, '10.0.1.0/24', '192.168.0.1', 'TCP/443'),
+        make_rule(3, '10.1.0.1', '192.168.0.1', 'TCP/443'),
+        make_rule(4, '10.0.2.1', '192.168.0.1', 'UDP/53'),
+        make_rule(5, '10.0.1.1', '192.168.0.1', 'TCP/443', user='alice'),
+        make_rule(6, '10.0.3.1', 'any', 'TCP/22', enable='N'),
+        make_rule(7, '10.0.3.1', 'any', 'TCP/22', vsys='vsys2'),
+    ], columns=COLUMNS)
+
+    result = ShadowAnalyzer().analyze(rules, 'paloalto')
+
+    assert list(result['No']) == [1, 1, 1]
+    assert list(result['Type']) == ['Upper', 'Lower', 'Lower']
+    assert list(result['Rule Name']) == ['rule_1', 'rule_2', 'rule_5']
+    assert list(result.columns) == ['No', 'Type'] + COLUMNS
+
+
+def test_indexed_search_matches_pairwise_reference():
+    """인덱스 기반 후보 검색 결과는 모든 쌍을 비교한 결과와 같아야 합니다."""
+    rng = random.Random(7)
+    analyzer = ShadowAnalyzer()
+    analyzer.candidate_limit = 0
+
+    def address():
+        choice = rng.random()
+        if choice < 0.1:
+            return 'any'
+        if choice < 0.2:
+            return f'2001:db8::{rng.randint(0, 3)}/127'
+        if choice < 0.3:
+            return 'www.example.com'
+        base = f'10.0.{rng.randint(0, 3)}'
+        if choice < 0.6:
+            return f'{base}.0/{rng.choice([24, 25, 30])}'
+        return ','.join(f'{base}.{rng.randint(0, 7)}' for _ in range(rng.randint(1, 2)))
+
+    def service():
+        if rng.random() < 0.1:
+            return 'any'
+        return ','.join(f"{rng.choice(['TCP', 'UDP'])}/{rng.choice(['80', '443', '0-1024', '53'])}"
+                        for _ in range(rng.randint(1, 2)))
+
+    rows = [make_rule(index, address(), address(), service(),
+                      enable=rng.choice(['Y', 'Y', 'N']),
+                      user=rng.choice(['any', 'any', 'alice']),
+                      vsys=rng.choice(['vsys1', 'vsys1', 'vsys2']))
+            for index in range(300)]
+    rules = pd.DataFrame(rows, columns=COLUMNS)
+
+    expected = reference_pairs(analyzer, rules)
+    assert expected
+    assert result_pairs(analyzer.analyze(rules, 'paloalto')) == expected
+
+    analyzer.candidate_limit = 32
+    assert result_pairs(analyzer.analyze(rules, 'paloalto')) == expected
+
+
+def test_bucket_with_large_end_before_last_entry():
+    """같은 길이 등급에서 마지막 구간이 아닌 구간의 끝값이 int64를 넘어도 분석할 수 있어야 합니다."""
+    analyzer = ShadowAnalyzer()
+    analyzer.candidate_limit = 0
+    rules = pd.DataFrame([
+        make_rule(1, '::7fff:ffff:ffff:fff6-::8000:0:0:5', 'any', 'TCP/80'),
+        make_rule(2, '::7fff:ffff:ffff:fff7-::7fff:ffff:ffff:ffff', 'any', 'TCP/80'),
+    ], columns=COLUMNS)
+
+    assert result_pairs(analyzer.analyze(rules, 'paloalto')) == [('rule_1', 'rule_2')]
+
+
+def test_requires_extracted_columns():
+    """Extracted 컬럼이 없으면 오류를 발생시켜야 합니다."""
+    rules = pd.DataFrame([['1', 'rule_1', 'Y', 'allow', 'any', 'any', 'any']],
+                         columns=['Seq', 'Rule Name', 'Enable', 'Action', 'Source', 'Destination', 'Service'])
+    try:
+        ShadowAnalyzer().analyze(rules, 'ngf')
+    except ValueError as e:
+        assert 'Extracted Source' in str(e)
+    else:
+        raise AssertionError('ValueError가 발생해야 합니다.')
@@ -0,0 +1,173 @@
+import threading
+import pytest
+from app import create_app, db
+from app.models import Device, SyncHistory, SyncTask, SYNC_STATUS
+from app.services.firewall import SyncManager, SyncQueueService, sync_manager
+from app.services.firewall.worker import parse_vendor_limits
+
+@pytest.fixture
+def app():
+    """테스트용 Flask 앱 생성"""
+    app = create_app()
+    app.config['TESTING'] = True
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
+    return app
+
+@pytest.fixture
+def db_session(app):
+    """테스트용 데이터베이스 세션"""
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+def add_device(db_session, name, sub_category):
+    """테스트용 방화벽 장비 추가"""
+    device = Device(
+        name=name,
+        category='firewall',
+        sub_category=sub_category,
+        ip_address=f'192.168.1.{Device.query.count() + 1}',
+        username='admin',
+        password='test123!'
+    )
+    db_session.session.add(device)
+    db_session.session.commit()
+    return device
+
+def add_task(device):
+    """테스트용 동기화 작업 추가"""
+    success, task = SyncQueueService.create_task(device.id, ['policies'])
+    assert success
+    return task
+
+def test_start_task_claims_only_once(db_session):
+    """같은 작업은 한 번만 시작(선점)할 수 있어야 합니다."""
+    task = add_task(add_device(db_session, 'FW-1', 'paloalto'))
+
+    success, started = SyncQueueService.start_task(task.id)
+    assert success
+    assert started.status == SYNC_STATUS['RUNNING']
+
+    success, message = SyncQueueService.start_task(task.id)
+    assert not success
+    assert 'running' in message
+
+def test_claim_skips_busy_device_and_saturated_vendor(db_session):
+    """실행 중인 장비와 한도에 도달한 벤더의 작업은 건너뛰어야 합니다."""
+    mf2_1 = add_device(db_session, 'MF2-1', 'mf2')
+    mf2_2 = add_device(db_session, 'MF2-2', 'mf2')
+    palo = add_device(db_session, 'PA-1', 'paloalto')
+    first = add_task(mf2_1)
+    add_task(mf2_1)
+    add_task(mf2_2)
+    palo_task = add_task(palo)
+
+    limits = {'mf2': 1}
+    assert SyncQueueService.claim_next_task(max_running=4, vendor_limits=limits).id == first.id
+    # MF2-1은 실행 중, mf2 벤더는 한도 도달 -> 팔로알토 작업 선택
+    assert SyncQueueService.claim_next_task(max_running=4, vendor_limits=limits).id == palo_task.id
+    assert SyncQueueService.claim_next_task(max_running=4, vendor_limits=limits) is None
+
+    # 전체 한도 1이면 실행 중인 작업이 있을 때 작업을 주지 않습니다.
+    assert SyncQueueService.get_next_task() is None
+    assert SyncTask.query.filter_by(status=SYNC_STATUS['RUNNING']).count() == 2
+
+def test_create_task_wakes_worker(db_session):
+    """작업을 추가하면 대기 중인 워커가 폴링 없이 즉시 깨어나야 합니다."""
+    device = add_device(db_session, 'FW-1', 'paloalto')
+    SyncQueueService.wait_for_task(0)  # 이전 알림 정리
+    assert SyncQueueService.wait_for_task(0.01) is False
+
+    add_task(device)
+    assert SyncQueueService.wait_for_task(5) is True
+    assert SyncQueueService.wait_for_task(0.01) is False
+
+def test_process_task_runs_independent_types_concurrently(db_session, monkeypatch):
+    """독립적인 동기화 유형은 동시에, 사용 이력은 정책 이후에 수행해야 합니다."""
+    device = add_device(db_session, 'FW-1', 'paloalto')
+    success, task = SyncQueueService.create_task(device.id, ['policies', 'usage_logs', 'network_objects', 'service_objects'])
+    assert success
+
+    events = []
+    lock = threading.Lock()
+    # 독립 유형 3개가 모두 시작해야 통과하는 장벽 (동시에 수행되지 않으면 시간 초과로 실패)
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_perform_sync(device_id, sync_type, batch_id):
+        with lock:
+            events.append(('start', sync_type))
+        if sync_type != 'usage_logs':
+            barrier.wait()
+        with lock:
+            events.append(('end', sync_type))
+        return True, f'{sync_type} 완료'
+
+    monkeypatch.setattr(SyncManager, '_perform_sync', staticmethod(fake_perform_sync))
+    success, message = SyncManager.process_task(task.id)
+
+    assert success, message
+    # 독립 유형 3개가 겹쳐서 수행되고, 사용 이력은 정책 완료 후 시작
+    assert not barrier.broken
+    assert {event for event in events[:3]} == {('start', 'policies'), ('start', 'network_objects'), ('start', 'service_objects')}
+    assert events.index(('end', 'policies')) < events.index(('start', 'usage_logs'))
+
+    task = SyncTask.query.get(task.id)
+    assert task.status == SYNC_STATUS['COMPLETED']
+    assert task.progress == 100
+
+def test_process_task_skips_dependent_type_after_failure(db_session, monkeypatch):
+    """정책 동기화가 실패하면 사용 이력 동기화는 수행하지 않고 실패로 기록해야 합니다."""
+    device = add_device(db_session, 'FW-1', 'paloalto')
+    success, task = SyncQueueService.create_task(device.id, ['policies', 'usage_logs', 'network_objects'])
+    assert success
+
+    performed = []
+
+    def fake_perform_sync(device_id, sync_type, batch_id):
+        performed.append(sync_type)
+        if sync_type == 'policies':
+            return False, '정책 동기화 중 오류 발생'
+        return True, f'{sync_type} 완료'
+
+    monkeypatch.setattr(SyncManager, '_perform_sync', staticmethod(fake_perform_sync))
+    success, message = SyncManager.process_task(task.id)
+
+    assert not success
+    assert sorted(performed) == ['network_objects', 'policies']
+
+    history = SyncHistory.query.filter_by(device_id=device.id, sync_type='usage_logs').one()
+    assert history.status == 'failed'
+    assert '정책' in history.message and '건너뛰었습니다' in history.message
+
+    task = SyncTask.query.get(task.id)
+    assert task.status == SYNC_STATUS['FAILED']
+    assert task.progress == 100
+
+def test_process_task_retries_failed_completion(db_session, monkeypatch):
+    """완료 처리가 DB 잠금으로 실패하면 다시 시도하여 작업이 실행 중 상태로 남지 않아야 합니다."""
+    task = add_task(add_device(db_session, 'FW-1', 'paloalto'))
+    complete_task = SyncQueueService.complete_task
+    calls = []
+
+    def flaky_complete_task(task_id, success=True, message=None):
+        calls.append(task_id)
+        if len(calls) == 1:
+            return False, '작업 완료 처리 중 오류 발생: database is locked'
+        return complete_task(task_id, success, message)
+
+    monkeypatch.setattr(SyncManager, '_perform_sync', staticmethod(lambda device_id, sync_type, batch_id: (True, '완료')))
+    monkeypatch.setattr(SyncQueueService, 'complete_task', staticmethod(flaky_complete_task))
+    monkeypatch.setattr(sync_manager, 'COMPLETE_RETRY_DELAY', 0)
+    success, message = SyncManager.process_task(task.id)
+
+    assert success
+    assert len(calls) == 2
+    assert SyncTask.query.get(task.id).status == SYNC_STATUS['COMPLETED']
+
+def test_parse_vendor_limits():
+    """벤더별 한도 설정 문자열을 파싱해야 합니다."""
+    assert parse_vendor_limits('mf2=1, ngf=2') == {'mf2': 1, 'ngf': 2}
+    assert parse_vendor_limits({'paloalto': '3'}) == {'paloalto': 3}
+    assert parse_vendor_limits('') == {}